@@ -23,10 +23,10 @@
  */
 async function initResume() {
     try {
-        const response = await fetch('/data/resume.json');
+        const response = await fetch('/data/resume.json?v=d87d6a58f2');
         const resume = await response.json();
 
-        const siteResponse = await fetch('/data/site.json');
+        const siteResponse = await fetch('/data/site.json?v=ede7acc256');
         // Set global siteConfig so initThemeSwitcher can update headshots
         siteConfig = await siteResponse.json();
 
@@ -5,49 +5,55 @@
  *
  * TABLE OF CONTENTS
  * -----------------
- * 1. ICONS REGISTRY ...................... Line 56
+ * 1. ICONS REGISTRY ...................... Line 62
  *    - SVG icon definitions for UI elements
  *
- * 2. DOM UTILITIES ....................... Line 101
+ * 2. DOM UTILITIES ....................... Line 111
  *    - createElement() - DOM element factory
  *    - setTrustedHTML() - safe innerHTML wrapper
  *    - createIconElement() - icon span factory
+ *    - showPlaceholder() - reserve an image's box and paint its preview
+ *    - showResponsive() - AVIF/WebP/JPEG srcsets from the image manifest
  *
- * 3. DATA LOADING ........................ Line 142
- *    - loadSiteConfig() - fetch site.json
+ * 3. DATA LOADING ........................ Line 222
+ *    - loadSiteConfig() - fetch site.json (or read the site bundle)
+ *    - fetchSiteFile() - data file from the bundle or network
  *    - parseCSV() - parse CSV data files
  *
- * 4. HEADER & HERO ....................... Line 170
+ * 4. HEADER & HERO ....................... Line 291
  *    - renderHeader() - sticky nav bar
  *    - renderHero() - hero section with nav pills
  *
- * 5. SECTION RENDERING ................... Line 325
+ * 5. SECTION RENDERING ................... Line 457
  *    - renderSections() - main content sections
- *    - renderStatsSection() - baseball stats
+ *    - renderStatsSection() - baseball stats, trend charts and sparklines
  *    - renderContentSection() - articles/projects
  *    - renderPersonalSection() - reading/listening
  *    - renderFooter() - theme switcher
  *
- * 6. CARD RENDERING & DISPLAY ............ Line 909
+ * 6. CARD RENDERING & DISPLAY ............ Line 1330
  *    - displayItems() - unified display function
  *    - displayProjects/Content/Tweets() - wrappers
  *    - createProjectCard() - GitHub project cards
  *    - createTweetCard() - tweet embed cards
  *    - createContentCard() - article/media cards
  *
- * 7. UI UTILITIES ........................ Line 1281
- *    - initCarouselScrollDetection() - scroll shadows
+ * 7. UI UTILITIES ........................ Line 1845
+ *    - initCarouselScrollDetection() - carousel wrapper + scroll shadows
+ *    - initCarouselScrollIndicators() - scroll shadows only
  *    - displayEmptyState() - no content message
  *    - formatDate() - date formatting
  *    - sortByDate() - chronological sort
  *
- * 8. INTERACTIVITY ....................... Line 1335
+ * 8. INTERACTIVITY ....................... Line 1915
+ *    - initStatsCategorySelector() - stats category tabs
+ *    - hydrateSections() - wire up prerendered markup
  *    - initThemeSwitcher() - team color themes
  *    - initScrollReveal() - section animations
  *    - initNavigation() - smooth scroll & active state
  *
- * 9. INITIALIZATION ...................... Line 1457
- *    - initSite() - main entry point
+ * 9. INITIALIZATION ...................... Line 2156
+ *    - initSite() - main entry point (render or hydrate)
  *    - DOMContentLoaded handler
  *
  * =============================================================================
@@ -96,6 +102,10 @@ const ICONS = {
     '<svg width="14" height="14" viewBox="0 0 24 24" fill="currentColor"><path d="M20.84 4.61a5.5 5.5 0 0 0-7.78 0L12 5.67l-1.06-1.06a5.5 5.5 0 0 0-7.78 7.78l1.06 1.06L12 21.23l7.78-7.78 1.06-1.06a5.5 5.5 0 0 0 0-7.78z"/></svg>',
   bookmark:
     '<svg width="14" height="14" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><path d="M19 21l-7-5-7 5V5a2 2 0 0 1 2-2h10a2 2 0 0 1 2 2z"/></svg>',
+  star:
+    '<svg width="16" height="16" viewBox="0 0 16 16" fill="currentColor"><path d="M8 .25a.75.75 0 0 1 .673.418l1.882 3.815 4.21.612a.75.75 0 0 1 .416 1.279l-3.046 2.97.719 4.192a.75.75 0 0 1-1.088.791L8 12.347l-3.766 1.98a.75.75 0 0 1-1.088-.79l.72-4.194L.818 6.374a.75.75 0 0 1 .416-1.28l4.21-.611L7.327.668A.75.75 0 0 1 8 .25Z"/></svg>',
+  fork:
+    '<svg width="16" height="16" viewBox="0 0 16 16" fill="currentColor"><path d="M5 5.372v.878c0 .414.336.75.75.75h4.5a.75.75 0 0 0 .75-.75v-.878a2.25 2.25 0 1 1 1.5 0v.878a2.25 2.25 0 0 1-2.25 2.25h-1.5v2.128a2.251 2.251 0 1 1-1.5 0V8.5h-1.5A2.25 2.25 0 0 1 3.5 6.25v-.878a2.25 2.25 0 1 1 1.5 0ZM5 3.25a.75.75 0 1 0-1.5 0 .75.75 0 0 0 1.5 0Zm6.75.75a.75.75 0 1 0 0-1.5.75.75 0 0 0 0 1.5Zm-3 8.75a.75.75 0 1 0-1.5 0 .75.75 0 0 0 1.5 0Z"/></svg>',
 };
 
 /* =============================================================================
@@ -139,18 +149,129 @@ function createIconElement(name) {
   return span;
 }
 
+// Give an image its intrinsic size (so the layout doesn't shift) and paint
+// its dominant color and blurred preview behind it until it loads. Entries
+// come from data/placeholders.json (tools/generate_placeholders.py), which
+// only ships inside the site bundle; without it images load as before.
+function showPlaceholder(img) {
+  const entry = imagePlaceholders[imageKey(img)];
+  if (!entry) return;
+
+  img.width = entry.width;
+  img.height = entry.height;
+
+  const clear = () => {
+    img.style.backgroundColor = "";
+    img.style.backgroundImage = "";
+    img.style.backgroundSize = "";
+  };
+  if (img.complete && img.naturalWidth) {
+    clear();
+    return;
+  }
+  img.style.backgroundColor = entry.color;
+  img.style.backgroundImage = `url("${entry.preview}")`;
+  img.style.backgroundSize = "cover";
+  img.addEventListener("load", clear, { once: true });
+}
+
+// Root-relative src without its ?v= fingerprint, as the image manifests key it
+function imageKey(img) {
+  return "/" + (img.getAttribute("src") || "").split("?")[0].replace(/^\//, "");
+}
+
+// Rendered width of images by class (the srcset "sizes"); others are card posters
+const IMAGE_SIZES = {
+  "logo-headshot": "40px",
+  "hero-headshot": "100px",
+  default: "320px",
+};
+
+// Let the browser download the smallest AVIF/WebP/JPEG variant that fills the
+// image's box. Entries come from data/image-manifest.json
+// (tools/generate_responsive_images.py), trimmed to srcsets in the site bundle;
+// without the bundle images use their src. The image is wrapped in a <picture>,
+// which styles.css lays out with display: contents. Returns the node to insert.
+function showResponsive(img) {
+  const entry = imageSources[imageKey(img)];
+  let picture = img.parentElement && img.parentElement.tagName === "PICTURE" ? img.parentElement : null;
+  if (picture) {
+    picture.querySelectorAll("source").forEach((source) => source.remove());
+  }
+  if (!entry) {
+    img.removeAttribute("srcset");
+    img.removeAttribute("sizes");
+    return picture || img;
+  }
+
+  const sizeClass = Object.keys(IMAGE_SIZES).find((name) => img.classList.contains(name));
+  const sizes = IMAGE_SIZES[sizeClass || "default"];
+  if (!picture) {
+    picture = document.createElement("picture");
+    if (img.parentNode) img.replaceWith(picture);
+    picture.appendChild(img);
+  }
+  ["avif", "webp"].forEach((format) => {
+    picture.insertBefore(createElement("source", { type: `image/${format}`, srcset: entry.srcset[format], sizes }), img);
+  });
+  img.sizes = sizes;
+  img.srcset = entry.srcset[entry.fallback];
+  return picture;
+}
+
 /* =============================================================================
    3. DATA LOADING
    ============================================================================= */
 
 let siteConfig = null;
+let siteBundle = null;
+let imagePlaceholders = {};
+let imageSources = {};
+
+// Single payload built by tools/bundle_site_data.py: either inlined JSON or a
+// preloaded, content-hashed file. Holds site.json plus every file it references.
+async function loadSiteBundle() {
+  const el = document.getElementById("site-bundle");
+  if (!el) return null;
+
+  try {
+    if (el.tagName === "SCRIPT") {
+      return JSON.parse(el.textContent);
+    }
+    const response = await fetch(el.getAttribute("href"));
+    return await response.json();
+  } catch (error) {
+    console.error("Error loading site bundle, falling back to individual files:", error);
+    return null;
+  }
+}
 
 async function loadSiteConfig() {
-  const response = await fetch("/data/site.json");
+  siteBundle = await loadSiteBundle();
+  if (siteBundle) {
+    siteConfig = siteBundle.site;
+    imagePlaceholders = siteBundle.placeholders || {};
+    imageSources = siteBundle.images || {};
+    return siteConfig;
+  }
+
+  const response = await fetch("/data/site.json?v=ede7acc256");
   siteConfig = await response.json();
   return siteConfig;
 }
 
+// Read a file referenced from site.json, from the bundle when present.
+// CSV comes back as text, everything else as parsed JSON. Paths may carry a
+// ?v= fingerprint from tools/fingerprint_assets.py.
+async function fetchSiteFile(path) {
+  if (siteBundle && path in siteBundle.files) {
+    return siteBundle.files[path];
+  }
+
+  const response = await fetch("/" + path);
+  return path.split("?")[0].endsWith(".json") ? response.json() : response.text();
+}
+
 function parseCSV(text) {
   const lines = text.trim().split("\n");
   const headers = lines[0].split(",");
@@ -191,11 +312,12 @@ function renderHeader(config) {
     alt: config.profile.name,
     className: "logo-headshot",
   });
+  showPlaceholder(logoImg);
   const logoText = createElement("span", {
     className: "logo-text",
     textContent: config.profile.name,
   });
-  logo.appendChild(logoImg);
+  logo.appendChild(showResponsive(logoImg));
   logo.appendChild(logoText);
   nav.appendChild(logo);
 
@@ -242,13 +364,13 @@ function renderHero(config) {
   const container = createElement("div", { className: "container" });
 
   const heroIntro = createElement("div", { className: "hero-intro" });
-  heroIntro.appendChild(
-    createElement("img", {
-      src: getThemedHeadshot(config),
-      alt: config.profile.name,
-      className: "hero-headshot",
-    }),
-  );
+  const heroHeadshot = createElement("img", {
+    src: getThemedHeadshot(config),
+    alt: config.profile.name,
+    className: "hero-headshot",
+  });
+  showPlaceholder(heroHeadshot);
+  heroIntro.appendChild(showResponsive(heroHeadshot));
   heroIntro.appendChild(
     createElement("h1", {
       className: "hero-name",
@@ -357,9 +479,37 @@ async function renderSections(config) {
   }
 }
 
+// Stat label -> chart file slug in assets/images/charts/
+const STAT_CHARTS = {
+  ERA: "era",
+  WHIP: "whip",
+  "K/9": "k9",
+};
+
+// <img> for one chart from charts.json, or null if it wasn't generated.
+// Charts of other categories start hidden, like their table rows.
+function createStatChart(charts, name, category, className) {
+  const entry = charts[name];
+  if (!entry) return null;
+  const img = createElement("img", {
+    src: `/assets/images/charts/${name}?v=${entry.hash.slice(0, 10)}`,
+    alt: entry.alt,
+    width: entry.width,
+    height: entry.height,
+    loading: "lazy",
+    className: `stat-chart ${className}`,
+    dataCategory: category,
+  });
+  if (category !== "Minors") {
+    img.style.display = "none";
+  }
+  return img;
+}
+
 async function renderStatsSection(container, section, config) {
-  const csvResponse = await fetch("/" + section.statsFile);
-  const csvText = await csvResponse.text();
+  const csvText = await fetchSiteFile(section.statsFile);
+  // Chart sizes and alt text ship in the site bundle; without it only the tables show
+  const charts = (siteBundle && siteBundle.charts) || {};
   const statsData = parseCSV(csvText);
 
   // Find all career total rows
@@ -510,6 +660,19 @@ async function renderStatsSection(container, section, config) {
     return `${minYear}-${maxYearShort}`;
   };
 
+  // Helper to get highlight values for a category
+  const getHighlightValues = (category) => {
+    const careerRow = careerRows[category];
+    return {
+      ERA: careerRow?.ERA || "-",
+      "W-L": careerRow ? `${careerRow.W}-${careerRow.L}` : "-",
+      G: careerRow?.G || "-",
+      IP: careerRow?.IP || "-",
+      SO: careerRow?.SO || "-",
+      WHIP: careerRow?.WHIP || "-",
+    };
+  };
+
   // Category selector (ordered by first appearance, but Minors is default selection)
   const categorySelector = createElement("div", { className: "stats-category-selector" });
   const categoryOrder = ["College", "Summer", "Independent", "Minors"];
@@ -518,6 +681,7 @@ async function renderStatsSection(container, section, config) {
       className: `stats-category-btn${category === "Minors" ? " active" : ""}`,
     });
     btn.dataset.category = category;
+    btn.dataset.highlights = JSON.stringify(getHighlightValues(category));
 
     const nameSpan = createElement("span", {
       className: "stats-category-name",
@@ -533,19 +697,6 @@ async function renderStatsSection(container, section, config) {
   });
   subsection.appendChild(categorySelector);
 
-  // Helper to get highlight values for a category
-  const getHighlightValues = (category) => {
-    const careerRow = careerRows[category];
-    return {
-      ERA: careerRow?.ERA || "-",
-      "W-L": careerRow ? `${careerRow.W}-${careerRow.L}` : "-",
-      G: careerRow?.G || "-",
-      IP: careerRow?.IP || "-",
-      SO: careerRow?.SO || "-",
-      WHIP: careerRow?.WHIP || "-",
-    };
-  };
-
   // Overview cards (initially showing Minors)
   const statsOverview = createElement("div", { className: "stats-overview" });
   const initialHighlights = getHighlightValues("Minors");
@@ -563,10 +714,35 @@ async function renderStatsSection(container, section, config) {
         textContent: highlightLabels[stat],
       }),
     );
+    if (STAT_CHARTS[stat]) {
+      categoryOrder.forEach((category) => {
+        const name = `spark-${category.toLowerCase()}-${STAT_CHARTS[stat]}.svg`;
+        const spark = createStatChart(charts, name, category, "stat-sparkline");
+        if (spark) card.appendChild(spark);
+      });
+    }
     statsOverview.appendChild(card);
   });
   subsection.appendChild(statsOverview);
 
+  // Season trend charts per category, shown with the selected tab
+  const statsCharts = createElement("div", { className: "stats-charts" });
+  categoryOrder.forEach((category) => {
+    Object.values(STAT_CHARTS).forEach((slug) => {
+      const name = `trend-${category.toLowerCase()}-${slug}.svg`;
+      const trend = createStatChart(charts, name, category, "stat-trend");
+      if (trend) statsCharts.appendChild(trend);
+    });
+  });
+  // Minor league level totals go with the Minors tab
+  Object.values(STAT_CHARTS).forEach((slug) => {
+    const levels = createStatChart(charts, `levels-${slug}.svg`, "Minors", "stat-trend");
+    if (levels) statsCharts.appendChild(levels);
+  });
+  if (statsCharts.children.length) {
+    subsection.appendChild(statsCharts);
+  }
+
   const tableWrapper = createElement("div", {
     className: "stats-table-wrapper",
   });
@@ -688,45 +864,7 @@ async function renderStatsSection(container, section, config) {
   tableWrapper.appendChild(table);
   subsection.appendChild(tableWrapper);
 
-  // Category selector event handler
-  categorySelector.addEventListener("click", (e) => {
-    const btn = e.target.closest(".stats-category-btn");
-    if (!btn) return;
-
-    const selectedCategory = btn.dataset.category;
-
-    // Update active button
-    categorySelector.querySelectorAll(".stats-category-btn").forEach((b) => {
-      b.classList.toggle("active", b === btn);
-    });
-
-    // Update header labels based on category
-    const teamHeader = thead.querySelector('th[data-column="team"]');
-    const levelsHeader = thead.querySelector('th[data-column="levels"]');
-    if (teamHeader) {
-      teamHeader.textContent = selectedCategory === "Minors" ? "Organization" : "Team";
-    }
-    if (levelsHeader) {
-      levelsHeader.textContent = selectedCategory === "Minors" ? "Levels" : "League";
-    }
-
-    // Update overview card values
-    const newHighlights = getHighlightValues(selectedCategory);
-    statsOverview.querySelectorAll(".stat-value").forEach((el) => {
-      const stat = el.dataset.stat;
-      el.textContent = newHighlights[stat];
-    });
-
-    // Filter table body rows
-    tbody.querySelectorAll("tr").forEach((row) => {
-      row.style.display = row.dataset.category === selectedCategory ? "" : "none";
-    });
-
-    // Filter table footer rows
-    tfoot.querySelectorAll("tr").forEach((row) => {
-      row.style.display = row.dataset.category === selectedCategory ? "" : "none";
-    });
-  });
+  initStatsCategorySelector(subsection);
 
   containerDiv.appendChild(subsection);
 
@@ -753,8 +891,7 @@ async function renderStatsSection(container, section, config) {
   // My Training subsection
   if (section.trainingFile) {
     try {
-      const trainingResponse = await fetch("/" + section.trainingFile);
-      const trainingData = await trainingResponse.json();
+      const trainingData = await fetchSiteFile(section.trainingFile);
 
       if (trainingData && trainingData.length > 0) {
         const trainingSubsection = createElement("div", { className: "subsection" });
@@ -786,7 +923,8 @@ async function renderStatsSection(container, section, config) {
                 src: item.poster,
                 alt: "Training video thumbnail",
               });
-              imgWrapper.appendChild(img);
+              showPlaceholder(img);
+              imgWrapper.appendChild(showResponsive(img));
               card.appendChild(imgWrapper);
 
               const overlay = createElement("div", { className: "training-bg-overlay" });
@@ -956,8 +1094,7 @@ async function renderContentSection(container, section, config) {
     containerDiv.appendChild(subsectionDiv);
 
     try {
-      const dataResponse = await fetch("/" + subsection.dataFile);
-      const items = await dataResponse.json();
+      const items = await fetchSiteFile(subsection.dataFile);
 
       if (subsection.displayType === "projects") {
         displayProjects(contentGrid, items);
@@ -996,8 +1133,7 @@ async function renderPersonalSection(container, section, config) {
   containerDiv.appendChild(sectionHeader);
 
   try {
-    const dataResponse = await fetch("/" + section.dataFile);
-    const data = await dataResponse.json();
+    const data = await fetchSiteFile(section.dataFile);
 
     const personalGrid = createElement("div", { className: "content-grid" });
 
@@ -1395,7 +1531,7 @@ function createProjectCard(project) {
 
       const starIcon = document.createElement("span");
       starIcon.className = "icon-wrapper";
-      setTrustedHTML(starIcon, '<svg width="16" height="16" viewBox="0 0 16 16" fill="currentColor"><path d="M8 .25a.75.75 0 0 1 .673.418l1.882 3.815 4.21.612a.75.75 0 0 1 .416 1.279l-3.046 2.97.719 4.192a.75.75 0 0 1-1.088.791L8 12.347l-3.766 1.98a.75.75 0 0 1-1.088-.79l.72-4.194L.818 6.374a.75.75 0 0 1 .416-1.28l4.21-.611L7.327.668A.75.75 0 0 1 8 .25Z"/></svg>');
+      setTrustedHTML(starIcon, ICONS.star);
       stars.appendChild(starIcon);
 
       const starCount = document.createElement("span");
@@ -1411,7 +1547,7 @@ function createProjectCard(project) {
 
       const forkIcon = document.createElement("span");
       forkIcon.className = "icon-wrapper";
-      setTrustedHTML(forkIcon, '<svg width="16" height="16" viewBox="0 0 16 16" fill="currentColor"><path d="M5 5.372v.878c0 .414.336.75.75.75h4.5a.75.75 0 0 0 .75-.75v-.878a2.25 2.25 0 1 1 1.5 0v.878a2.25 2.25 0 0 1-2.25 2.25h-1.5v2.128a2.251 2.251 0 1 1-1.5 0V8.5h-1.5A2.25 2.25 0 0 1 3.5 6.25v-.878a2.25 2.25 0 1 1 1.5 0ZM5 3.25a.75.75 0 1 0-1.5 0 .75.75 0 0 0 1.5 0Zm6.75.75a.75.75 0 1 0 0-1.5.75.75 0 0 0 0 1.5Zm-3 8.75a.75.75 0 1 0-1.5 0 .75.75 0 0 0 1.5 0Z"/></svg>');
+      setTrustedHTML(forkIcon, ICONS.fork);
       forks.appendChild(forkIcon);
 
       const forkCount = document.createElement("span");
@@ -1716,6 +1852,13 @@ function initCarouselScrollDetection(carousel) {
   carousel.parentNode.insertBefore(wrapper, carousel);
   wrapper.appendChild(carousel);
 
+  initCarouselScrollIndicators(carousel);
+}
+
+// Scroll shadows for a carousel already inside its .content-grid-wrapper
+function initCarouselScrollIndicators(carousel) {
+  const wrapper = carousel.parentNode;
+
   function updateScrollIndicators() {
     const { scrollLeft, scrollWidth, clientWidth } = carousel;
     const hasOverflowRight = scrollLeft < scrollWidth - clientWidth - 10;
@@ -1773,6 +1916,112 @@ function sortByDate(items) {
    8. INTERACTIVITY
    ============================================================================= */
 
+function initStatsCategorySelector(subsection) {
+  const categorySelector = subsection.querySelector(".stats-category-selector");
+  const statsOverview = subsection.querySelector(".stats-overview");
+  const table = subsection.querySelector(".stats-table");
+  if (!categorySelector || !table) return;
+
+  const thead = table.tHead;
+  const tbody = table.tBodies[0];
+  const tfoot = table.tFoot;
+
+  categorySelector.addEventListener("click", (e) => {
+    const btn = e.target.closest(".stats-category-btn");
+    if (!btn) return;
+
+    const selectedCategory = btn.dataset.category;
+
+    // Update active button
+    categorySelector.querySelectorAll(".stats-category-btn").forEach((b) => {
+      b.classList.toggle("active", b === btn);
+    });
+
+    // Update header labels based on category
+    const teamHeader = thead.querySelector('th[data-column="team"]');
+    const levelsHeader = thead.querySelector('th[data-column="levels"]');
+    if (teamHeader) {
+      teamHeader.textContent = selectedCategory === "Minors" ? "Organization" : "Team";
+    }
+    if (levelsHeader) {
+      levelsHeader.textContent = selectedCategory === "Minors" ? "Levels" : "League";
+    }
+
+    // Update overview card values
+    const newHighlights = JSON.parse(btn.dataset.highlights);
+    statsOverview.querySelectorAll(".stat-value").forEach((el) => {
+      const stat = el.dataset.stat;
+      el.textContent = newHighlights[stat];
+    });
+
+    // Show the selected category's charts
+    subsection.querySelectorAll(".stat-chart").forEach((chart) => {
+      chart.style.display = chart.dataset.category === selectedCategory ? "" : "none";
+    });
+
+    // Filter table body rows
+    tbody.querySelectorAll("tr").forEach((row) => {
+      row.style.display = row.dataset.category === selectedCategory ? "" : "none";
+    });
+
+    // Filter table footer rows
+    tfoot.querySelectorAll("tr").forEach((row) => {
+      row.style.display = row.dataset.category === selectedCategory ? "" : "none";
+    });
+  });
+}
+
+// Prerendered pages (tools/prerender_site.py) leave out "New" badges because
+// they depend on today's date. Cards carry data-date instead; add the badge
+// where the client renderer would have put it.
+function hydrateNewBadges() {
+  document.querySelectorAll("[data-date]").forEach((card) => {
+    if (!isWithinDays(card.dataset.date, 30)) return;
+
+    const newBadge = createElement("span", { className: "new-badge", textContent: "New" });
+
+    const pinnedBadge = card.querySelector(".pinned-badge");
+    if (pinnedBadge) {
+      pinnedBadge.after(newBadge);
+      return;
+    }
+
+    const thumbWrapper = card.querySelector(".thumbnail-wrapper");
+    if (thumbWrapper) {
+      thumbWrapper.appendChild(createElement("div", { className: "card-badge-overlay" }, [newBadge]));
+      return;
+    }
+
+    const metaLeft = card.querySelector(".card-meta-left");
+    if (metaLeft) {
+      metaLeft.appendChild(newBadge);
+      return;
+    }
+
+    const badgeRow = card.querySelector(".card-badge-row");
+    if (badgeRow) {
+      badgeRow.prepend(newBadge);
+      return;
+    }
+
+    const anchor = card.querySelector(".tweet-header, .training-header, h3");
+    anchor.after(createElement("div", { className: "card-badge-row" }, [newBadge]));
+  });
+}
+
+// Attach behaviour to markup that was rendered at build time
+function hydrateSections() {
+  document.querySelectorAll(".stats-category-selector").forEach((selector) => {
+    initStatsCategorySelector(selector.closest(".subsection"));
+  });
+  document.querySelectorAll(".content-grid-wrapper > .content-grid").forEach(initCarouselScrollIndicators);
+  hydrateNewBadges();
+  document.querySelectorAll("img").forEach((img) => {
+    showPlaceholder(img);
+    showResponsive(img);
+  });
+}
+
 function initThemeSwitcher() {
   const buttons = document.querySelectorAll(".theme-btn");
   const savedTheme = localStorage.getItem("theme") || "driveline";
@@ -1797,6 +2046,8 @@ function initThemeSwitcher() {
       const headshot = siteConfig.profile.headshots[theme] || siteConfig.profile.headshot;
       document.querySelectorAll(".hero-headshot, .logo-headshot").forEach((img) => {
         img.src = headshot;
+        showPlaceholder(img);
+        showResponsive(img);
       });
     }
   }
@@ -1910,10 +2161,14 @@ async function initSite() {
   try {
     const config = await loadSiteConfig();
 
-    renderHeader(config);
-    renderHero(config);
-    await renderSections(config);
-    renderFooter(config);
+    if (document.body.hasAttribute("data-prerendered")) {
+      hydrateSections();
+    } else {
+      renderHeader(config);
+      renderHero(config);
+      await renderSections(config);
+      renderFooter(config);
+    }
 
     initThemeSwitcher();
     initNavigation();
@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+"""
+Benchmark the resume, OG image, favicon and logo generators.
+
+Every case runs the generator's own functions in a fresh child process
+against fixed fixtures, writing into a temp directory, and is repeated
+--repeat times. Per case we record:
+
+- wall time and CPU time (user + system) of the child, median and min/max
+- peak RSS of the child (from wait4, so it covers only that process)
+- total bytes the generator wrote
+
+Fixtures are the repo's headshot, DMSans.ttf and data/resume.json, plus
+synthetic scaled inputs built once into tools/.cache/benchmark-fixtures/: an
+8K (7680x4320) JPEG photo, a resume.json with about 20 pages of content, and
+a 1200x630 stand-in screenshot for the OG encoder. Times include interpreter
+start-up and imports, which is what a CI step pays too. Each run gets an
+empty image cache (tools/image_cache.py), so cases measure cold builds.
+
+Results go to tools/.cache/benchmark-results.json and are printed as a
+table. If tools/benchmark-baseline.json exists each case is compared with it,
+and the run exits 1 when a case is slower, uses more memory or writes more
+bytes than the thresholds allow. Cases whose dependencies are missing (fpdf,
+Playwright) are reported as skipped.
+
+Usage:
+    python tools/benchmark_generators.py                     # all cases, 5 runs each
+    python tools/benchmark_generators.py --cases "favicon-*" -n 10
+    python tools/benchmark_generators.py --save-baseline     # record the current numbers
+    python tools/benchmark_generators.py --wall-threshold 0.1 --rss-threshold 0.1
+    python tools/benchmark_generators.py --list
+"""
+
+import argparse
+import contextlib
+import fnmatch
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+TOOLS_DIR = Path(__file__).parent
+FIXTURES_DIR = TOOLS_DIR / ".cache" / "benchmark-fixtures"
+RESULTS_PATH = TOOLS_DIR / ".cache" / "benchmark-results.json"
+BASELINE_PATH = TOOLS_DIR / "benchmark-baseline.json"
+
+HEADSHOT = PROJECT_ROOT / "assets" / "images" / "headshot" / "headshot-dl.jpg"
+FONT = PROJECT_ROOT / "assets" / "fonts" / "DMSans.ttf"
+RESUME_JSON = PROJECT_ROOT / "data" / "resume.json"
+OG_TEMPLATE = TOOLS_DIR / "og-template.html"
+
+PHOTO_8K_SIZE = (7680, 4320)
+RESUME_SCALE = 20
+
+DEFAULT_REPEAT = 5
+DEFAULT_WALL_THRESHOLD = 0.20
+DEFAULT_RSS_THRESHOLD = 0.20
+DEFAULT_BYTES_THRESHOLD = 0.05
+DEFAULT_MIN_DELTA_MS = 25
+
+# Exit code a case uses to report a missing dependency
+SKIP_EXIT_CODE = 3
+
+
+# Fixtures
+
+
+def build_fixtures() -> None:
+    """Create the synthetic fixtures once; they are deterministic, so they are cached."""
+    from PIL import Image, ImageDraw, ImageFont
+
+    FIXTURES_DIR.mkdir(parents=True, exist_ok=True)
+
+    photo = FIXTURES_DIR / "photo-8k.jpg"
+    if not photo.exists():
+        # Smooth gradients plus sensor-like noise: realistic JPEG entropy
+        width, height = PHOTO_8K_SIZE
+        red = Image.linear_gradient("L").resize((width, height))
+        green = Image.radial_gradient("L").resize((width, height))
+        blue = Image.effect_noise((width, height), 48)
+        Image.merge("RGB", (red, green, blue)).save(photo, "JPEG", quality=90)
+
+    circular = FIXTURES_DIR / "circular.png"
+    if not circular.exists():
+        sys.path.insert(0, str(TOOLS_DIR))
+        from generate_favicon import create_circular_image
+        with contextlib.redirect_stdout(io.StringIO()):
+            create_circular_image(HEADSHOT, circular)
+
+    resume = FIXTURES_DIR / "resume-20p.json"
+    if not resume.exists():
+        with open(RESUME_JSON, "r") as f:
+            data = json.load(f)
+        for key in ("experience", "education", "projects"):
+            data[key] = data.get(key, []) * RESUME_SCALE
+        resume.write_text(json.dumps(data, indent=2) + "\n")
+
+    screenshot = FIXTURES_DIR / "og-screenshot.png"
+    if not screenshot.exists():
+        card = Image.new("RGB", (1200, 630), "#0a0e1a")
+        with Image.open(HEADSHOT) as headshot:
+            card.paste(headshot.convert("RGB").resize((304, 304)), (80, 163))
+        draw = ImageDraw.Draw(card)
+        draw.text((440, 220), "Josh Hejka", font=ImageFont.truetype(str(FONT), 72), fill="#ffffff")
+        draw.text((440, 320), "Pitcher, engineer, writer", font=ImageFont.truetype(str(FONT), 36), fill="#9ca3af")
+        card.save(screenshot, "PNG")
+
+
+# Cases (run inside the child process; each writes only under out_dir)
+
+
+def case_resume_pdf(out_dir: Path, resume_path: Path = RESUME_JSON) -> None:
+    from generate_resume_pdf import ensure_fonts, generate_pdf
+
+    with open(resume_path, "r") as f:
+        resume = json.load(f)
+    generate_pdf(resume, str(out_dir / "resume.pdf"), use_custom_fonts=ensure_fonts())
+
+
+def case_og_headshot(out_dir: Path, source: Path = HEADSHOT) -> None:
+    from generate_og_image import prepare_headshot
+    from image_cache import ImageCache
+
+    prepare_headshot(source, ImageCache(out_dir))
+
+
+def case_og_encode(out_dir: Path) -> None:
+    from generate_og_image import write_og_outputs
+
+    write_og_outputs((FIXTURES_DIR / "og-screenshot.png").read_bytes(), out_dir / "og-image.png")
+
+
+def case_og_render(out_dir: Path) -> None:
+    from generate_og_image import populate_template, render_screenshot, write_og_outputs
+
+    with open(PROJECT_ROOT / "data" / "site.json", "r") as f:
+        profile = json.load(f)["profile"]
+    html = populate_template(OG_TEMPLATE, profile, PROJECT_ROOT)
+    write_og_outputs(render_screenshot(html), out_dir / "og-image.png")
+
+
+def case_favicon_circle(out_dir: Path, source: Path = HEADSHOT) -> None:
+    from generate_favicon import create_circular_image
+
+    create_circular_image(source, out_dir / "circular.png")
+
+
+def case_favicon_favicons(out_dir: Path) -> None:
+    from generate_favicon import generate_favicons
+
+    generate_favicons(FIXTURES_DIR / "circular.png", out_dir)
+
+
+def case_favicon_all(out_dir: Path, source: Path = HEADSHOT) -> None:
+    from generate_favicon import generate_all
+
+    generate_all(source, out_dir)
+
+
+def case_favicon_text(out_dir: Path, svg: bool = False) -> None:
+    from generate_favicon import generate_text_favicon
+
+    generate_text_favicon("JH", FONT, out_dir, svg=svg)
+
+
+def case_logo(out_dir: Path, svg: bool = False) -> None:
+    from generate_hedgertronic_logo import generate_hedgertronic_logo
+
+    generate_hedgertronic_logo(out_dir, svg=svg)
+
+
+CASES = {
+    "resume-pdf": lambda out: case_resume_pdf(out),
+    "resume-pdf-20p": lambda out: case_resume_pdf(out, FIXTURES_DIR / "resume-20p.json"),
+    "og-headshot": lambda out: case_og_headshot(out),
+    "og-headshot-8k": lambda out: case_og_headshot(out, FIXTURES_DIR / "photo-8k.jpg"),
+    "og-encode": case_og_encode,
+    "og-render": case_og_render,
+    "favicon-circle": lambda out: case_favicon_circle(out),
+    "favicon-circle-8k": lambda out: case_favicon_circle(out, FIXTURES_DIR / "photo-8k.jpg"),
+    "favicon-favicons": case_favicon_favicons,
+    "favicon-all": lambda out: case_favicon_all(out),
+    "favicon-all-8k": lambda out: case_favicon_all(out, FIXTURES_DIR / "photo-8k.jpg"),
+    "favicon-text": lambda out: case_favicon_text(out),
+    "favicon-text-svg": lambda out: case_favicon_text(out, svg=True),
+    "logo": lambda out: case_logo(out),
+    "logo-svg": lambda out: case_logo(out, svg=True),
+}
+
+
+def run_child(name: str, out_dir: Path) -> None:
+    """Entry point of the child process: run one case, exiting 3 if a dependency is missing."""
+    sys.path.insert(0, str(TOOLS_DIR))
+    try:
+        CASES[name](out_dir)
+    except ImportError as e:
+        print(f"skipped: {e}", file=sys.stderr)
+        sys.exit(SKIP_EXIT_CODE)
+
+
+# Measurement
+
+
+def output_bytes(directory: Path) -> int:
+    return sum(path.stat().st_size for path in directory.rglob("*") if path.is_file())
+
+
+def measure_once(name: str) -> dict:
+    """
+    Run a case once in a child process.
+
+    Returns:
+        {"wall_ms", "cpu_ms", "rss_mb", "bytes"}, or {"skipped": reason}
+    """
+    with (tempfile.TemporaryDirectory() as tmp, tempfile.TemporaryDirectory() as cache_tmp,
+          tempfile.TemporaryFile() as stderr_file):
+        out_dir = Path(tmp)
+        command = [sys.executable, __file__, "--child", name, str(out_dir)]
+        # An empty image cache per run, so every run measures a cold build
+        env = {**os.environ, "IMAGE_CACHE_DIR": cache_tmp}
+        start = time.perf_counter()
+        # stderr goes to a file, not a pipe: nothing reads until wait4 returns,
+        # so a child that fills the pipe buffer would block forever
+        proc = subprocess.Popen(command, cwd=PROJECT_ROOT, env=env, stdout=subprocess.DEVNULL, stderr=stderr_file)
+        # wait4 gives this child's own resource usage (getrusage would mix all children)
+        _, status, usage = os.wait4(proc.pid, 0)
+        wall = time.perf_counter() - start
+        proc.returncode = os.waitstatus_to_exitcode(status)
+        stderr_file.seek(0)
+        stderr = stderr_file.read().decode(errors="replace").strip()
+
+        if proc.returncode == SKIP_EXIT_CODE:
+            return {"skipped": stderr.removeprefix("skipped: ")}
+        if proc.returncode != 0:
+            raise RuntimeError(f"{name} failed (exit {proc.returncode}):\n{stderr}")
+
+        # ru_maxrss is kilobytes on Linux, bytes on macOS
+        rss_bytes = usage.ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+        return {
+            "wall_ms": wall * 1000,
+            "cpu_ms": (usage.ru_utime + usage.ru_stime) * 1000,
+            "rss_mb": rss_bytes / (1024 * 1024),
+            "bytes": output_bytes(out_dir),
+        }
+
+
+def measure(name: str, repeat: int) -> dict:
+    """Run a case `repeat` times and summarize (median times, max RSS, last output size)."""
+    runs = []
+    for _ in range(repeat):
+        run = measure_once(name)
+        if "skipped" in run:
+            return run
+        runs.append(run)
+
+    walls = [r["wall_ms"] for r in runs]
+    return {
+        "runs": repeat,
+        "wall_ms": round(statistics.median(walls), 1),
+        "wall_min_ms": round(min(walls), 1),
+        "wall_max_ms": round(max(walls), 1),
+        "cpu_ms": round(statistics.median(r["cpu_ms"] for r in runs), 1),
+        "rss_mb": round(max(r["rss_mb"] for r in runs), 1),
+        "bytes": runs[-1]["bytes"],
+    }
+
+
+# Comparison and report
+
+
+def compare(result: dict, baseline: dict, thresholds: dict) -> list[str]:
+    """Regressions of one case against its baseline entry (empty if within thresholds)."""
+    regressions = []
+    wall_delta = result["wall_ms"] - baseline["wall_ms"]
+    if wall_delta > thresholds["min_delta_ms"] and wall_delta > baseline["wall_ms"] * thresholds["wall"]:
+        regressions.append("wall")
+    if result["rss_mb"] > baseline["rss_mb"] * (1 + thresholds["rss"]):
+        regressions.append("rss")
+    if result["bytes"] > baseline["bytes"] * (1 + thresholds["bytes"]):
+        regressions.append("bytes")
+    return regressions
+
+
+def change(current: float, previous: float | None) -> str:
+    if not previous:
+        return ""
+    return f"{(current - previous) / previous:+.0%}"
+
+
+def print_table(results: dict, baseline: dict) -> None:
+    print(f"\n{'Case':<20} {'Wall ms':>9} {'':>5} {'min-max':>15} {'CPU ms':>8} "
+          f"{'RSS MB':>7} {'':>5} {'Output':>11} {'':>5}  Status")
+    for name, result in results.items():
+        if "skipped" in result:
+            print(f"{name:<20} {'-':>9} {'':>5} {'':>15} {'-':>8} {'-':>7} {'':>5} {'-':>11} {'':>5}  "
+                  f"skipped ({result['skipped']})")
+            continue
+        base = baseline.get(name) or {}
+        status = ", ".join(f"REGRESSION: {r}" for r in result.get("regressions", [])) or ("ok" if base else "new")
+        spread = f"{result['wall_min_ms']:.0f}-{result['wall_max_ms']:.0f}"
+        print(f"{name:<20} {result['wall_ms']:>9.1f} {change(result['wall_ms'], base.get('wall_ms')):>5} "
+              f"{spread:>15} {result['cpu_ms']:>8.1f} {result['rss_mb']:>7.1f} "
+              f"{change(result['rss_mb'], base.get('rss_mb')):>5} {result['bytes']:>11,} "
+              f"{change(result['bytes'], base.get('bytes')):>5}  {status}")
+
+
+def environment() -> dict:
+    from PIL import __version__ as pillow_version
+
+    return {
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "pillow": pillow_version,
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def run_benchmarks(patterns: list[str], repeat: int, thresholds: dict, save_baseline: bool) -> int:
+    """
+    Run the selected cases, write results, compare with the baseline.
+
+    Returns:
+        Process exit code (1 if any case regressed)
+    """
+    names = [name for name in CASES if any(fnmatch.fnmatch(name, p) for p in patterns)]
+    if not names:
+        print(f"No cases match {', '.join(patterns)}")
+        return 1
+
+    # In a separate process: ru_maxrss survives fork+exec, so a parent that
+    # had decoded the 8K photo would raise every child's peak RSS
+    subprocess.run([sys.executable, __file__, "--fixtures"], cwd=PROJECT_ROOT, check=True)
+
+    baseline = {}
+    if BASELINE_PATH.exists() and not save_baseline:
+        with open(BASELINE_PATH, "r") as f:
+            baseline = json.load(f)["cases"]
+
+    results = {}
+    for name in names:
+        print(f"{name} ...", flush=True)
+        result = measure(name, repeat)
+        if "skipped" not in result and name in baseline and "skipped" not in baseline[name]:
+            result["regressions"] = compare(result, baseline[name], thresholds)
+        results[name] = result
+
+    report = {"environment": environment(), "thresholds": thresholds, "cases": results}
+    RESULTS_PATH.parent.mkdir(parents=True, exist_ok=True)
+    RESULTS_PATH.write_text(json.dumps(report, indent=2) + "\n")
+
+    print_table(results, baseline)
+    print(f"\nResults written to {RESULTS_PATH}")
+
+    if save_baseline:
+        measured = {name: {k: v for k, v in r.items() if k != "regressions"}
+                    for name, r in results.items() if "skipped" not in r}
+        BASELINE_PATH.write_text(json.dumps({"environment": report["environment"], "cases": measured}, indent=2) + "\n")
+        print(f"Baseline written to {BASELINE_PATH}")
+        return 0
+
+    if not baseline:
+        print(f"No baseline at {BASELINE_PATH}; run with --save-baseline to record one")
+    regressed = [name for name, r in results.items() if r.get("regressions")]
+    if regressed:
+        print(f"Regressions in: {', '.join(regressed)}")
+        return 1
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the image, PDF and favicon generators",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument("--cases", nargs="+", default=["*"], help="Case names or glob patterns (default: all)")
+    parser.add_argument("-n", "--repeat", type=int, default=DEFAULT_REPEAT,
+                        help=f"Runs per case (default: {DEFAULT_REPEAT})")
+    parser.add_argument("--save-baseline", action="store_true", help=f"Write the results to {BASELINE_PATH.name}")
+    parser.add_argument("--wall-threshold", type=float, default=DEFAULT_WALL_THRESHOLD,
+                        help=f"Allowed median wall-time growth (default: {DEFAULT_WALL_THRESHOLD * 100:.0f}%%)")
+    parser.add_argument("--rss-threshold", type=float, default=DEFAULT_RSS_THRESHOLD,
+                        help=f"Allowed peak RSS growth (default: {DEFAULT_RSS_THRESHOLD * 100:.0f}%%)")
+    parser.add_argument("--bytes-threshold", type=float, default=DEFAULT_BYTES_THRESHOLD,
+                        help=f"Allowed output size growth (default: {DEFAULT_BYTES_THRESHOLD * 100:.0f}%%)")
+    parser.add_argument("--min-delta-ms", type=float, default=DEFAULT_MIN_DELTA_MS,
+                        help=f"Ignore wall-time changes smaller than this (default: {DEFAULT_MIN_DELTA_MS}ms)")
+    parser.add_argument("--list", action="store_true", help="List case names and exit")
+    parser.add_argument("--child", nargs=2, metavar=("CASE", "OUT_DIR"), help=argparse.SUPPRESS)
+    parser.add_argument("--fixtures", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.fixtures:
+        build_fixtures()
+        return
+    if args.child:
+        run_child(args.child[0], Path(args.child[1]))
+        return
+    if args.list:
+        print("\n".join(CASES))
+        return
+
+    thresholds = {
+        "wall": args.wall_threshold,
+        "rss": args.rss_threshold,
+        "bytes": args.bytes_threshold,
+        "min_delta_ms": args.min_delta_ms,
+    }
+    sys.exit(run_benchmarks(args.cases, args.repeat, thresholds, args.save_baseline))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,482 @@
+#!/usr/bin/env python3
+"""
+Build a sharded inverted search index over the writing, media and lab data.
+
+Titles, text, descriptions and tags (source, authors, language) of every item
+in SOURCES are tokenized (Unicode-normalized, accents stripped, lowercased,
+stop words and URLs dropped) into weighted postings. The index is written to
+data/search/:
+
+- docs.json      doc id -> [source, title, url, date] (null for removed items)
+- <prefix>.json  {term: [doc id, weight, doc id, weight, ...]}, terms sorted
+- manifest.json  {"docs": hash, "shards": {name: hash},
+                  "ranges": {name: [first term, last term]}} for cache busting
+
+Terms are sharded by prefix: one shard per first letter, split into longer
+prefixes while a shard is over SHARD_TARGET_BYTES, up to MAX_SHARD_PREFIX
+letters. A prefix shard still over the target is then cut by term range into
+<prefix>-1.json, <prefix>-2.json, ..., each listed in "ranges". To look up a
+(partial) word, a client loads only the shards whose prefix starts with the
+query or that the query starts with (skipping range parts that can't hold
+it), then binary-searches the sorted terms for the prefix range; search()
+below does exactly this. Only a single term whose postings are over the
+target still gets an oversized shard (of its own).
+
+Builds are incremental. Each item's content hash and postings are kept in
+tools/.cache/search-index.json, so only changed items are re-tokenized, doc
+ids stay stable, and only shards whose bytes change are rewritten.
+
+--benchmark builds a synthetic corpus (10,000 items by default) in a temp
+directory and reports full and incremental build time, shard sizes and
+query latency with cold and warm shard caches.
+
+Usage:
+    python tools/build_search_index.py
+    python tools/build_search_index.py --force            # re-tokenize everything, compact doc ids
+    python tools/build_search_index.py --query "pitch des"
+    python tools/build_search_index.py --benchmark 10000
+"""
+
+import argparse
+import bisect
+import gzip
+import hashlib
+import itertools
+import json
+import random
+import re
+import statistics
+import tempfile
+import time
+import unicodedata
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DATA_DIR = PROJECT_ROOT / "data"
+OUTPUT_DIR = DATA_DIR / "search"
+STATE_PATH = Path(__file__).parent / ".cache" / "search-index.json"
+
+# Data files to index (data/<name>.json)
+SOURCES = [
+    "writing-shortform",
+    "writing-longform",
+    "media-press",
+    "media-podcasts",
+    "lab-projects",
+    "lab-research",
+]
+
+# Weight of one occurrence of a term in each field
+FIELD_WEIGHTS = {"title": 4, "description": 2, "text": 1, "caption": 1}
+TAG_FIELDS = {"source": 2, "authors": 2, "language": 2}
+
+STOP_WORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "but", "by", "for", "from", "has", "have", "i", "in", "is",
+    "it", "its", "me", "my", "of", "on", "or", "so", "that", "the", "this", "to", "was", "we", "were",
+    "what", "when", "with", "you", "your",
+}
+
+MIN_TERM_LENGTH = 2
+SHARD_TARGET_BYTES = 16 * 1024
+MAX_SHARD_PREFIX = 3
+
+URL_PATTERN = re.compile(r"https?://\S+")
+TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
+
+def normalize(text: str) -> str:
+    """Casefold and strip accents so "Café" and "cafe" index the same."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into normalized terms, dropping URLs, stop words and single characters."""
+    text = normalize(URL_PATTERN.sub(" ", text))
+    return [t for t in TOKEN_PATTERN.findall(text) if len(t) >= MIN_TERM_LENGTH and t not in STOP_WORDS]
+
+
+def item_postings(item: dict) -> dict[str, int]:
+    """Weighted term frequencies for one item across its text fields and tags."""
+    postings = {}
+    fields = [(item.get(name), weight) for name, weight in FIELD_WEIGHTS.items()]
+    fields += [(item.get(name), weight) for name, weight in TAG_FIELDS.items()]
+    for value, weight in fields:
+        if not value:
+            continue
+        values = value if isinstance(value, list) else [value]
+        for term in tokenize(" ".join(str(v) for v in values)):
+            postings[term] = postings.get(term, 0) + weight
+    return postings
+
+
+def item_key(source: str, item: dict) -> str:
+    """Stable identity of an item across builds."""
+    return f"{source}:{item.get('url') or item.get('title', '')}"
+
+
+def unique_key(seen: dict, key: str) -> str:
+    """Suffix a key with #2, #3, ... when two items share a URL (e.g. a project linking another repo)."""
+    candidate, duplicate = key, 1
+    while candidate in seen:
+        duplicate += 1
+        candidate = f"{key}#{duplicate}"
+    return candidate
+
+
+def item_hash(item: dict) -> str:
+    return hashlib.sha1(json.dumps(item, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def load_sources() -> dict[str, list[dict]]:
+    """Items of every SOURCES data file."""
+    items = {}
+    for name in SOURCES:
+        with open(DATA_DIR / f"{name}.json", "r") as f:
+            items[name] = json.load(f)
+    return items
+
+
+def serialize(value) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def shard_terms(index: dict[str, list[int]], depth: int = 1, terms: list[str] = None) -> dict[str, list[str]]:
+    """
+    Group sorted terms into prefix shards, splitting any shard over the size target.
+
+    Returns:
+        Mapping of shard prefix to the terms it holds
+    """
+    terms = sorted(index) if terms is None else terms
+    groups = {}
+    for term in terms:
+        groups.setdefault(term[:depth], []).append(term)
+
+    shards = {}
+    for prefix, group in groups.items():
+        size = sum(len(serialize(index[t])) + len(t.encode()) + 4 for t in group)
+        splittable = depth < MAX_SHARD_PREFIX and any(len(t) > depth for t in group)
+        if size > SHARD_TARGET_BYTES and splittable:
+            shards.update(shard_terms(index, depth + 1, group))
+        else:
+            shards[prefix] = group
+    return shards
+
+
+def split_by_range(index: dict[str, list[int]], prefix: str, terms: list[str]) -> dict[str, list[str]]:
+    """
+    Cut a prefix shard that is still over the size target into consecutive term ranges.
+
+    Returns:
+        {prefix: terms} if it fits, otherwise {"<prefix>-1": terms, "<prefix>-2": terms, ...}
+    """
+    sizes = [len(serialize(index[t])) + len(t.encode()) + 4 for t in terms]
+    if sum(sizes) <= SHARD_TARGET_BYTES or len(terms) == 1:
+        return {prefix: terms}
+
+    parts, size = [[]], 0
+    for term, term_size in zip(terms, sizes):
+        if parts[-1] and size + term_size > SHARD_TARGET_BYTES:
+            parts.append([])
+            size = 0
+        parts[-1].append(term)
+        size += term_size
+    return {f"{prefix}-{n}": part for n, part in enumerate(parts, 1)}
+
+
+def shards_for(query_term: str, prefixes, ranges: dict = None) -> list[str]:
+    """Shards that can hold terms starting with query_term."""
+    ranges = ranges or {}
+    names = []
+    for name in prefixes:
+        # Terms have no "-", so it only ever separates a range part's number
+        prefix = name.partition("-")[0]
+        if not (prefix.startswith(query_term) or query_term.startswith(prefix)):
+            continue
+        if name in ranges:
+            first, last = ranges[name]
+            # Matching terms sort from query_term up to the first term past its prefix
+            if last < query_term or (first > query_term and not first.startswith(query_term)):
+                continue
+        names.append(name)
+    return names
+
+
+def write_if_changed(path: Path, data: bytes) -> bool:
+    """Write bytes unless the file already holds them; returns whether it wrote."""
+    if path.exists() and path.read_bytes() == data:
+        return False
+    path.write_bytes(data)
+    return True
+
+
+def build_index(sources: dict[str, list[dict]], output_dir: Path = OUTPUT_DIR,
+                state_path: Path = STATE_PATH, force: bool = False) -> dict:
+    """
+    Build or incrementally update the index for a set of source items.
+
+    Args:
+        sources: Items per source name
+        output_dir: Directory for docs.json, shards and manifest.json
+        state_path: Per-item hash/postings cache for incremental builds
+        force: Ignore the cache, re-tokenize everything and renumber doc ids
+
+    Returns:
+        Build stats (items, reindexed, terms, shard sizes, written shards, seconds)
+    """
+    start = time.perf_counter()
+    state = {"next_id": 0, "items": {}}
+    if state_path.exists() and not force:
+        with open(state_path, "r") as f:
+            state = json.load(f)
+
+    # Without a cache (e.g. in CI), keep the ids of the committed docs.json so
+    # unchanged items don't move and their shards aren't rewritten
+    previous_ids = {}
+    docs_path = output_dir / "docs.json"
+    if not state["items"] and docs_path.exists() and not force:
+        with open(docs_path, "r") as f:
+            for doc_id, doc in enumerate(json.load(f)):
+                if doc:
+                    previous_ids[unique_key(previous_ids, f"{doc[0]}:{doc[2] or doc[1]}")] = doc_id
+        state["next_id"] = len(previous_ids) and max(previous_ids.values()) + 1
+
+    items = {}
+    reindexed = 0
+    next_id = state["next_id"]
+    for source, source_items in sources.items():
+        for item in source_items:
+            key = unique_key(items, item_key(source, item))
+            digest = item_hash(item)
+            cached = state["items"].get(key)
+            if cached and cached["hash"] == digest:
+                entry = cached
+            else:
+                reindexed += 1
+                doc_id = cached["id"] if cached else previous_ids.get(key, next_id)
+                next_id = max(next_id, doc_id + 1)
+                entry = {"hash": digest, "id": doc_id, "postings": item_postings(item)}
+            entry["doc"] = [source, item.get("title", ""), item.get("url", ""), item.get("date", "")]
+            items[key] = entry
+
+    # Invert: term -> flat [id, weight, id, weight, ...] ordered by id
+    docs = [None] * next_id
+    inverted = {}
+    for entry in sorted(items.values(), key=lambda e: e["id"]):
+        docs[entry["id"]] = entry["doc"]
+        for term, weight in entry["postings"].items():
+            inverted.setdefault(term, []).extend((entry["id"], weight))
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    shards = {}
+    for prefix, terms in shard_terms(inverted).items():
+        shards.update(split_by_range(inverted, prefix, terms))
+    manifest = {"docs": None, "shards": {}, "ranges": {}}
+    shard_bytes = {}
+    written = 0
+    for name, terms in sorted(shards.items()):
+        data = serialize({term: inverted[term] for term in terms})
+        shard_bytes[name] = len(data)
+        manifest["shards"][name] = hashlib.sha256(data).hexdigest()[:10]
+        if "-" in name:
+            manifest["ranges"][name] = [terms[0], terms[-1]]
+        written += write_if_changed(output_dir / f"{name}.json", data)
+
+    for stale in output_dir.glob("*.json"):
+        if stale.stem not in shards and stale.stem not in ("docs", "manifest"):
+            stale.unlink()
+
+    docs_data = serialize(docs)
+    manifest["docs"] = hashlib.sha256(docs_data).hexdigest()[:10]
+    write_if_changed(output_dir / "docs.json", docs_data)
+    write_if_changed(output_dir / "manifest.json", serialize(manifest))
+
+    state = {"next_id": next_id, "items": {k: {f: v for f, v in e.items() if f != "doc"} for k, e in items.items()}}
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    state_path.write_text(json.dumps(state, separators=(",", ":")))
+
+    return {
+        "items": len(items),
+        "reindexed": reindexed,
+        "terms": len(inverted),
+        "shards": shard_bytes,
+        "written": written,
+        "docs_bytes": len(docs_data),
+        "seconds": time.perf_counter() - start,
+    }
+
+
+class SearchIndex:
+    """Query side of the index, loading shards lazily the way the browser would."""
+
+    def __init__(self, output_dir: Path = OUTPUT_DIR):
+        self.output_dir = output_dir
+        with open(output_dir / "manifest.json", "r") as f:
+            manifest = json.load(f)
+        self.prefixes = sorted(manifest["shards"])
+        self.ranges = manifest.get("ranges", {})
+        with open(output_dir / "docs.json", "r") as f:
+            self.docs = json.load(f)
+        self.loaded = {}
+
+    def shard(self, prefix: str) -> tuple[list[str], dict]:
+        """Sorted terms and postings of one shard, parsed on first use."""
+        if prefix not in self.loaded:
+            with open(self.output_dir / f"{prefix}.json", "r") as f:
+                postings = json.load(f)
+            self.loaded[prefix] = (list(postings), postings)
+        return self.loaded[prefix]
+
+    def term_matches(self, query_term: str) -> dict[int, float]:
+        """Best score per doc for one query term; exact matches outrank prefix matches."""
+        scores = {}
+        for prefix in shards_for(query_term, self.prefixes, self.ranges):
+            terms, postings = self.shard(prefix)
+            i = bisect.bisect_left(terms, query_term)
+            while i < len(terms) and terms[i].startswith(query_term):
+                factor = 1.0 if terms[i] == query_term else 0.5
+                flat = postings[terms[i]]
+                for doc_id, weight in zip(flat[::2], flat[1::2]):
+                    scores[doc_id] = max(scores.get(doc_id, 0), weight * factor)
+                i += 1
+        return scores
+
+    def search(self, query: str, limit: int = 10) -> list[tuple[float, list]]:
+        """
+        Find docs containing every query term (each as a prefix), best first.
+
+        Returns:
+            (score, [source, title, url, date]) pairs
+        """
+        scores = None
+        for term in tokenize(query):
+            matches = self.term_matches(term)
+            if scores is None:
+                scores = matches
+            else:
+                scores = {d: s + matches[d] for d, s in scores.items() if d in matches}
+            if not scores:
+                return []
+        ranked = sorted((scores or {}).items(), key=lambda pair: (-pair[1], pair[0]))[:limit]
+        return [(score, self.docs[doc_id]) for doc_id, score in ranked]
+
+
+def synthetic_corpus(count: int, seed: int = 7) -> tuple[dict[str, list[dict]], list[str]]:
+    """
+    Deterministic fake items with Zipf-distributed vocabulary, spread over SOURCES.
+
+    Returns:
+        (items per source, the most common words for building queries)
+    """
+    rng = random.Random(seed)
+    syllables = ["ba", "ce", "di", "fo", "gu", "ka", "le", "mi", "no", "pu", "ra", "se", "ti", "vo", "zu", "sh", "tr"]
+    vocabulary = sorted({"".join(rng.choices(syllables, k=rng.randint(2, 4))) for _ in range(30000)})
+    rng.shuffle(vocabulary)
+    cum_weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(vocabulary))))
+    names = [f"{rng.choice(vocabulary).title()} {rng.choice(vocabulary).title()}" for _ in range(200)]
+    outlets = [rng.choice(vocabulary).title() for _ in range(50)]
+
+    sources = {name: [] for name in SOURCES}
+    for i in range(count):
+        words = rng.choices(vocabulary, cum_weights=cum_weights, k=rng.randint(35, 130))
+        sources[SOURCES[i % len(SOURCES)]].append({
+            "title": " ".join(words[:rng.randint(4, 10)]).capitalize(),
+            "text": " ".join(words[10:]),
+            "date": f"20{rng.randint(15, 26)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            "url": f"https://example.com/{i}",
+            "source": rng.choice(outlets),
+            "authors": rng.sample(names, rng.randint(1, 3)),
+        })
+    return sources, vocabulary[:2000]
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def benchmark(count: int, queries: int = 500) -> None:
+    """Report build time, shard sizes and query latency on a synthetic corpus."""
+    print(f"Generating {count:,} synthetic items...")
+    sources, common = synthetic_corpus(count)
+    rng = random.Random(11)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        output_dir = Path(tmp) / "search"
+        state_path = Path(tmp) / "state.json"
+
+        full = build_index(sources, output_dir, state_path)
+        print(f"\nFull build:        {full['seconds']:.2f}s  ({full['items']:,} items, {full['terms']:,} terms)")
+
+        # Edit 1% of items and rebuild
+        for items in sources.values():
+            for item in rng.sample(items, max(1, len(items) // 100)):
+                item["title"] += " " + rng.choice(common)
+        incremental = build_index(sources, output_dir, state_path)
+        print(f"Incremental build: {incremental['seconds']:.2f}s  ({incremental['reindexed']:,} items re-tokenized, "
+              f"{incremental['written']} of {len(incremental['shards'])} shards rewritten)")
+
+        sizes = sorted(full["shards"].values())
+        gzipped = [len(gzip.compress((output_dir / f"{p}.json").read_bytes(), 9)) for p in incremental["shards"]]
+        print(f"\nShards: {len(sizes)}  total {sum(sizes):,} B  median {statistics.median(sizes):,.0f} B  "
+              f"max {sizes[-1]:,} B  (gzipped total {sum(gzipped):,} B, max {max(gzipped):,} B)")
+        oversized = [p for p, size in full["shards"].items() if size > SHARD_TARGET_BYTES]
+        ranged = sum("-" in p for p in full["shards"])
+        print(f"Range parts: {ranged}  over the {SHARD_TARGET_BYTES:,} B target: {len(oversized)} (each a single term)")
+        print(f"docs.json: {full['docs_bytes']:,} B")
+
+        # Prefix queries of 1-2 words drawn from the common vocabulary
+        samples = []
+        for _ in range(queries):
+            words = rng.sample(common[:500], rng.randint(1, 2))
+            words[-1] = words[-1][:rng.randint(2, len(words[-1]))]
+            samples.append(" ".join(words))
+
+        for label, warm in (("cold", False), ("warm", True)):
+            index = SearchIndex(output_dir)
+            latencies, loaded = [], []
+            for query in samples:
+                if not warm:
+                    index.loaded.clear()
+                before = len(index.loaded)
+                start = time.perf_counter()
+                index.search(query)
+                latencies.append((time.perf_counter() - start) * 1000)
+                loaded.append(len(index.loaded) - before)
+            print(f"Query latency ({label}): p50 {percentile(latencies, 0.5):.2f}ms  "
+                  f"p95 {percentile(latencies, 0.95):.2f}ms  max {max(latencies):.2f}ms  "
+                  f"shards loaded/query {statistics.mean(loaded):.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build the sharded search index for writing, media and lab data",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument("--force", action="store_true", help="Ignore the cache and rebuild from scratch")
+    parser.add_argument("--query", help="Search the built index and print the results")
+    parser.add_argument("--benchmark", type=int, nargs="?", const=10000, metavar="N",
+                        help="Benchmark on N synthetic items (default: 10000)")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(args.benchmark)
+        return
+
+    if args.query:
+        for score, (source, title, url, date) in SearchIndex().search(args.query):
+            print(f"{score:5.1f}  {source:<18} {date or '':<10}  {title}\n       {url}")
+        return
+
+    stats = build_index(load_sources(), force=args.force)
+    sizes = stats["shards"]
+    print(f"Indexed {stats['items']} items ({stats['reindexed']} changed), {stats['terms']:,} terms "
+          f"in {len(sizes)} shards ({sum(sizes.values()):,} B, largest {max(sizes.values(), default=0):,} B) "
+          f"in {stats['seconds'] * 1000:.0f}ms")
+    print(f"Wrote {stats['written']} shards to {OUTPUT_DIR}")
+
+
+if __name__ == "__main__":
+    main()
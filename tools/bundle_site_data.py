@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""Bundle site.json and every file it references into one site-data payload.
+
+The home page normally fetches data/site.json and then each section's
+statsFile, trainingFile and dataFile one after another. This script resolves
+all of those files and writes them as one minified, content-hashed JSON file
+(data/site-data.<hash>.json), so script.js can render everything after a
+single request. With --inline the payload goes straight into index.html and
+no data request is needed at all. The image placeholders written by
+tools/generate_placeholders.py, the responsive srcsets written by
+tools/generate_responsive_images.py and the stat chart sizes written by
+tools/generate_stat_charts.py ride along when present.
+
+index.html gets a <!-- site-bundle --> block that script.js looks for:
+- default: <link rel="preload" id="site-bundle" href="/data/site-data.<hash>.json" ...>
+- --inline: <script id="site-bundle" type="application/json">...</script>
+
+Usage:
+    python tools/bundle_site_data.py            # hashed file + preload link (CI)
+    python tools/bundle_site_data.py --inline   # inline into index.html
+    python tools/bundle_site_data.py --refresh  # rebuild only if enabled, keeping its mode
+    python tools/bundle_site_data.py --remove   # drop the bundle, back to per-file fetches
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import re
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+SITE_JSON = PROJECT_ROOT / "data" / "site.json"
+PLACEHOLDERS_JSON = PROJECT_ROOT / "data" / "placeholders.json"
+IMAGE_MANIFEST_JSON = PROJECT_ROOT / "data" / "image-manifest.json"
+CHARTS_JSON = PROJECT_ROOT / "assets" / "images" / "charts" / "charts.json"
+INDEX_HTML = PROJECT_ROOT / "index.html"
+BUNDLE_DIR = PROJECT_ROOT / "data"
+BUNDLE_PREFIX = "site-data."
+
+# Section keys in site.json that point at data files
+FILE_KEYS = ("statsFile", "trainingFile", "dataFile")
+
+MARKER_START = "<!-- site-bundle:start -->"
+MARKER_END = "<!-- site-bundle:end -->"
+
+
+def referenced_files(site: dict) -> list[str]:
+    """List every data file path referenced by site.json sections, in page order."""
+    paths = []
+    for section in site.get("sections", []):
+        for entry in [section, *section.get("subsections", [])]:
+            for key in FILE_KEYS:
+                if entry.get(key) and entry[key] not in paths:
+                    paths.append(entry[key])
+    return paths
+
+
+def build_bundle(site: dict) -> dict:
+    """
+    Build the bundle payload.
+
+    JSON files are embedded as parsed values and everything else (the stats
+    CSV) as text, keyed by the same path site.json uses (including any ?v=
+    fingerprint). Image placeholders, when generated, go under "placeholders",
+    and each responsive image's srcsets (without the per-variant byte counts)
+    under "images". Stat charts go under "charts" (size, alt text and hash).
+    """
+    files = {}
+    for rel in referenced_files(site):
+        path = PROJECT_ROOT / rel.split("?")[0]
+        if path.suffix == ".json":
+            with open(path, "r") as f:
+                files[rel] = json.load(f)
+        else:
+            files[rel] = path.read_text()
+
+    bundle = {"site": site, "files": files}
+    if PLACEHOLDERS_JSON.exists():
+        with open(PLACEHOLDERS_JSON, "r") as f:
+            bundle["placeholders"] = json.load(f)
+    if IMAGE_MANIFEST_JSON.exists():
+        with open(IMAGE_MANIFEST_JSON, "r") as f:
+            bundle["images"] = {
+                url: {"fallback": entry["fallback"], "srcset": entry["srcset"]}
+                for url, entry in json.load(f).items()
+            }
+    if CHARTS_JSON.exists():
+        with open(CHARTS_JSON, "r") as f:
+            bundle["charts"] = {
+                name: {key: entry[key] for key in ("hash", "width", "height", "alt")}
+                for name, entry in json.load(f).items()
+            }
+    return bundle
+
+
+def minify(payload: dict) -> str:
+    """Serialize compactly; escape "<" so the JSON is safe inside a <script> tag.
+
+    Key order is kept as-is: script.js iterates some objects (e.g. chess links)
+    in file order.
+    """
+    text = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    return text.replace("<", "\\u003c")
+
+
+def replace_block(html: str, block: str) -> str:
+    """Swap the marked site-bundle block in index.html, inserting it before </head> if absent."""
+    pattern = re.compile(r"[ \t]*" + re.escape(MARKER_START) + r".*?" + re.escape(MARKER_END) + r"\n?", re.DOTALL)
+    line = f"    {block}\n" if block else ""
+    if pattern.search(html):
+        return pattern.sub(lambda _: line, html)
+    return html.replace("</head>", f"{line}</head>", 1)
+
+
+def write_bundle(inline: bool = False) -> None:
+    """Write the bundle (file or inline) and update index.html to point at it."""
+    with open(SITE_JSON, "r") as f:
+        site = json.load(f)
+
+    payload = minify(build_bundle(site))
+    data = payload.encode()
+    digest = hashlib.sha256(data).hexdigest()[:12]
+
+    # Remove bundles from previous builds
+    for old in BUNDLE_DIR.glob(f"{BUNDLE_PREFIX}*.json"):
+        old.unlink()
+
+    if inline:
+        tag = f'<script id="site-bundle" type="application/json">{payload}</script>'
+    else:
+        bundle_path = BUNDLE_DIR / f"{BUNDLE_PREFIX}{digest}.json"
+        bundle_path.write_bytes(data)
+        href = "/" + bundle_path.relative_to(PROJECT_ROOT).as_posix()
+        tag = f'<link rel="preload" id="site-bundle" href="{href}" as="fetch" crossorigin="anonymous">'
+        print(f"Bundle written to {bundle_path}")
+
+    html = INDEX_HTML.read_text()
+    INDEX_HTML.write_text(replace_block(html, f"{MARKER_START}{tag}{MARKER_END}"))
+    print(f"Updated {INDEX_HTML}{' (inline)' if inline else ''}")
+
+    # Requests the page no longer makes: site.json plus every referenced file,
+    # minus the one bundle fetch when not inlined
+    files = referenced_files(site)
+    removed = len(files) + 1 - (0 if inline else 1)
+    source_bytes = SITE_JSON.stat().st_size + sum((PROJECT_ROOT / rel.split("?")[0]).stat().st_size for rel in files)
+    print(f"Bundled {len(files) + 1} files: {source_bytes:,} bytes -> {len(data):,} bytes "
+          f"({len(gzip.compress(data, 9)):,} gzipped)")
+    print(f"Removed {removed} sequential requests from first render")
+
+
+def refresh_bundle() -> None:
+    """Rebuild the bundle in its current mode, or do nothing if index.html has none."""
+    html = INDEX_HTML.read_text()
+    if MARKER_START not in html:
+        print("No site bundle in index.html; nothing to refresh")
+        return
+    write_bundle(inline='<script id="site-bundle"' in html)
+
+
+def remove_bundle() -> None:
+    """Delete bundle files and the index.html block so script.js fetches files individually."""
+    for old in BUNDLE_DIR.glob(f"{BUNDLE_PREFIX}*.json"):
+        old.unlink()
+        print(f"Removed {old}")
+    INDEX_HTML.write_text(replace_block(INDEX_HTML.read_text(), ""))
+    print(f"Updated {INDEX_HTML}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bundle site data into a single payload")
+    parser.add_argument("--inline", action="store_true", help="Inline the bundle into index.html")
+    parser.add_argument("--refresh", action="store_true", help="Rebuild only if index.html already uses a bundle")
+    parser.add_argument("--remove", action="store_true", help="Remove the bundle and its index.html block")
+    args = parser.parse_args()
+
+    if args.remove:
+        remove_bundle()
+    elif args.refresh:
+        refresh_bundle()
+    else:
+        write_bundle(args.inline)
@@ -0,0 +1,424 @@
+#!/usr/bin/env python3
+"""
+Local preview server with caching, compression and live regeneration.
+
+Serves the repository like GitHub Pages does, with a few dev conveniences:
+
+- File bytes are held in an in-memory LRU cache keyed by path and mtime, so
+  repeat requests skip the disk; an edited file is re-read on its next request.
+- Every response carries an ETag and Cache-Control: no-cache, and conditional
+  GETs (If-None-Match) are answered with 304 Not Modified.
+- Text responses are gzip- or brotli-compressed when the client accepts it
+  (brotli only if the `brotli` module is installed). Fresh .gz/.br siblings
+  written by tools/precompress_assets.py are served as-is; otherwise the
+  compressed bytes are computed once and cached alongside the original.
+- A watcher thread polls the tree. When a generator input changes it reruns
+  the matching tool (see GENERATORS): bbref_stats.csv -> process_stats.py,
+  resume.json -> generate_resume_pdf.py, site.json and data files -> bundle
+  and prerender refresh, styles.css and the scripts -> minified build
+  refresh. Any change then live-reloads open pages over
+  Server-Sent Events (a small script is injected into HTML responses).
+- Each request is logged with status, bytes, encoding, cache hit/miss and
+  latency; anything slower than --slow-ms is flagged.
+
+Uses only the standard library.
+
+Usage:
+    python tools/dev_server.py                  # http://localhost:8000
+    python tools/dev_server.py --port 4000 --no-generators
+"""
+
+import argparse
+import fnmatch
+import gzip
+import hashlib
+import mimetypes
+import os
+import subprocess
+import sys
+import threading
+import time
+from collections import OrderedDict
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlsplit
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+DEFAULT_PORT = 8000
+DEFAULT_CACHE_MB = 64
+DEFAULT_SLOW_MS = 50
+POLL_INTERVAL = 0.5
+
+# Changed input (glob relative to the project root) -> tool commands to rerun.
+# Outputs are watched too, so process_stats.py writing career_stats.csv goes on
+# to refresh the bundle and prerendered page, as does a new placeholders.json.
+GENERATORS = [
+    ("assets/documents/bbref_stats.csv", [["tools/process_stats.py"]]),
+    ("assets/documents/supplemental/*.csv", [["tools/process_stats.py"]]),
+    ("assets/documents/pitches/*.csv*", [["tools/process_stats.py"]]),
+    ("data/resume.json", [["tools/generate_resume_pdf.py"]]),
+    ("data/*.json", [
+        ["tools/generate_placeholders.py"], ["tools/generate_responsive_images.py"], ["tools/subset_fonts.py"],
+        ["tools/bundle_site_data.py", "--refresh"], ["tools/prerender_site.py", "--refresh"],
+        ["tools/minify_assets.py", "--refresh"],
+    ]),
+    ("styles.css", [["tools/minify_assets.py", "--refresh"]]),
+    ("script.js", [["tools/subset_fonts.py"], ["tools/minify_assets.py", "--refresh"]]),
+    ("resume/*.*", [["tools/subset_fonts.py"], ["tools/minify_assets.py", "--refresh"]]),
+    ("assets/images/headshot/*", [["tools/generate_placeholders.py"], ["tools/generate_responsive_images.py"]]),
+    ("assets/images/instagram/*", [["tools/generate_placeholders.py"], ["tools/generate_responsive_images.py"]]),
+    ("assets/documents/career_stats.csv", [
+        ["tools/generate_stat_charts.py"], ["tools/bundle_site_data.py", "--refresh"], ["tools/prerender_site.py", "--refresh"],
+    ]),
+]
+
+# Generated files that should not themselves trigger generators
+GENERATED = [
+    "data/site-data.*.json", "data/asset-manifest.json", "data/image-manifest.json", "assets/images/charts/*",
+    "assets/build/*", "assets/images/responsive/*",
+]
+
+# Directories the watcher ignores
+IGNORE_DIRS = {".git", "node_modules", "__pycache__", ".cache", ".venv"}
+
+COMPRESSIBLE_TYPES = ("text/", "application/json", "application/javascript", "image/svg+xml", "application/xml")
+MIN_COMPRESS_BYTES = 256
+
+LIVE_RELOAD_PATH = "/__livereload"
+LIVE_RELOAD_SCRIPT = (
+    b'<script>new EventSource("' + LIVE_RELOAD_PATH.encode() + b'")'
+    b'.onmessage = () => location.reload();</script>'
+)
+
+
+class FileCache:
+    """Thread-safe LRU of file bytes and compressed variants, bounded by total size."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path: Path, stat: os.stat_result) -> tuple[dict, bool]:
+        """
+        Return the cache entry for a file, reading it if absent or stale.
+
+        Returns:
+            (entry dict with "body", "etag" and "variants", whether it was a hit)
+        """
+        key = str(path)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry and entry["mtime"] == stat.st_mtime_ns and entry["length"] == stat.st_size:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry, True
+
+        body = path.read_bytes()
+        entry = {
+            "mtime": stat.st_mtime_ns,
+            "length": stat.st_size,
+            "body": body,
+            "etag": '"' + hashlib.sha1(body).hexdigest()[:16] + '"',
+            "variants": {},
+        }
+        with self.lock:
+            self.misses += 1
+            self._store(key, entry)
+        return entry, False
+
+    def variant(self, path: Path, entry: dict, encoding: str) -> bytes:
+        """
+        Compressed body for an encoding, computed once per cached file version.
+
+        A fresh precompressed sibling (styles.css.br / .gz from
+        tools/precompress_assets.py) is used as-is instead of compressing.
+        """
+        if encoding not in entry["variants"]:
+            precompressed = path.with_name(path.name + (".br" if encoding == "br" else ".gz"))
+            try:
+                fresh = precompressed.stat().st_mtime_ns >= entry["mtime"]
+            except FileNotFoundError:
+                fresh = False
+            if fresh:
+                data = precompressed.read_bytes()
+            elif encoding == "br":
+                data = brotli.compress(entry["body"], quality=11)
+            else:
+                data = gzip.compress(entry["body"], compresslevel=9, mtime=0)
+            with self.lock:
+                entry["variants"][encoding] = data
+                self.size += len(data)
+                self._evict()
+        return entry["variants"][encoding]
+
+    def _store(self, key: str, entry: dict) -> None:
+        old = self.entries.pop(key, None)
+        if old:
+            self.size -= self._entry_size(old)
+        self.entries[key] = entry
+        self.size += self._entry_size(entry)
+        self._evict()
+
+    def _evict(self) -> None:
+        while self.size > self.max_bytes and len(self.entries) > 1:
+            _, old = self.entries.popitem(last=False)
+            self.size -= self._entry_size(old)
+
+    @staticmethod
+    def _entry_size(entry: dict) -> int:
+        return len(entry["body"]) + sum(len(v) for v in entry["variants"].values())
+
+
+class LiveReload:
+    """Counter that SSE clients block on; bumped whenever the tree changes."""
+
+    def __init__(self):
+        self.version = 0
+        self.condition = threading.Condition()
+
+    def notify(self) -> None:
+        with self.condition:
+            self.version += 1
+            self.condition.notify_all()
+
+    def wait(self, seen: int, timeout: float) -> int:
+        with self.condition:
+            self.condition.wait_for(lambda: self.version != seen, timeout=timeout)
+            return self.version
+
+
+def snapshot(root: Path) -> dict[str, int]:
+    """Map every watched file (project-relative POSIX path) to its mtime."""
+    mtimes = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in IGNORE_DIRS]
+        for name in filenames:
+            path = Path(dirpath) / name
+            try:
+                mtimes[path.relative_to(root).as_posix()] = path.stat().st_mtime_ns
+            except FileNotFoundError:
+                continue
+    return mtimes
+
+
+def generators_for(changed: set[str]) -> list[list[str]]:
+    """Commands to run for a set of changed files, deduplicated, in GENERATORS order."""
+    commands = []
+    for pattern, tool_commands in GENERATORS:
+        triggered = any(
+            fnmatch.fnmatch(rel, pattern) and not any(fnmatch.fnmatch(rel, g) for g in GENERATED)
+            for rel in changed
+        )
+        if triggered:
+            commands.extend(cmd for cmd in tool_commands if cmd not in commands)
+    return commands
+
+
+def run_generator(command: list[str]) -> None:
+    """Run one tool script with the current interpreter and report how it went."""
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, *command], cwd=PROJECT_ROOT, capture_output=True, text=True)
+    elapsed = (time.perf_counter() - start) * 1000
+    label = " ".join(command)
+    if result.returncode == 0:
+        print(f"[regen] {label} ({elapsed:.0f}ms)")
+    else:
+        print(f"[regen] {label} FAILED ({elapsed:.0f}ms)\n{result.stderr.strip()}")
+
+
+def watch(root: Path, live_reload: LiveReload, run_generators: bool) -> None:
+    """Poll the tree forever, rerunning generators and triggering live reload on changes."""
+    previous = snapshot(root)
+    while True:
+        time.sleep(POLL_INTERVAL)
+        current = snapshot(root)
+        changed = {rel for rel in current.keys() | previous.keys() if current.get(rel) != previous.get(rel)}
+        if not changed:
+            continue
+
+        print(f"[watch] changed: {', '.join(sorted(changed)[:5])}{' ...' if len(changed) > 5 else ''}")
+
+        # Rerun generators until their outputs stop triggering new ones; each
+        # command runs at most once per change
+        ran = []
+        while run_generators and changed:
+            commands = [cmd for cmd in generators_for(changed) if cmd not in ran]
+            if not commands:
+                break
+            for command in commands:
+                run_generator(command)
+                ran.append(command)
+            after = snapshot(root)
+            changed = {rel for rel in after.keys() | current.keys() if after.get(rel) != current.get(rel)}
+            current = after
+
+        previous = snapshot(root)
+        live_reload.notify()
+
+
+def accepted_encoding(header: str) -> str | None:
+    """Pick br or gzip from an Accept-Encoding header (ignores q-values other than 0)."""
+    offered = {}
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        if params.strip().startswith("q="):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                q = 0.0
+        offered[name.strip().lower()] = q
+    if brotli is not None and offered.get("br", 0) > 0:
+        return "br"
+    if offered.get("gzip", 0) > 0:
+        return "gzip"
+    return None
+
+
+class DevRequestHandler(SimpleHTTPRequestHandler):
+    """Static file handler backed by FileCache with ETags, compression and live reload."""
+
+    cache: FileCache = None
+    live_reload: LiveReload = None
+    slow_ms: float = DEFAULT_SLOW_MS
+
+    def do_GET(self):
+        self.serve(head=False)
+
+    def do_HEAD(self):
+        self.serve(head=True)
+
+    def serve(self, head: bool) -> None:
+        start = time.perf_counter()
+        url_path = urlsplit(self.path).path
+        if url_path == LIVE_RELOAD_PATH:
+            self.stream_reloads()
+            return
+
+        status, length, encoding, hit = self.respond(url_path, head)
+        elapsed = (time.perf_counter() - start) * 1000
+        flag = "  SLOW" if elapsed > self.slow_ms else ""
+        cache = "hit " if hit else "miss" if hit is not None else "-   "
+        print(f"{int(status)} {self.command:<4} {url_path:<50} {length:>9,}B {encoding or '-':<4} {cache} {elapsed:7.1f}ms{flag}")
+
+    def respond(self, url_path: str, head: bool) -> tuple[int, int, str | None, bool | None]:
+        """Send one response; returns (status, body bytes, encoding, cache hit)."""
+        path = Path(self.translate_path(url_path))
+        if path.is_dir():
+            if not url_path.endswith("/"):
+                self.send_response(HTTPStatus.MOVED_PERMANENTLY)
+                self.send_header("Location", url_path + "/")
+                self.end_headers()
+                return HTTPStatus.MOVED_PERMANENTLY, 0, None, None
+            path = path / "index.html"
+
+        try:
+            stat = path.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return HTTPStatus.NOT_FOUND, 0, None, None
+
+        entry, hit = self.cache.get(path, stat)
+        content_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        is_html = content_type == "text/html"
+
+        if self.headers.get("If-None-Match") == entry["etag"] and not is_html:
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", entry["etag"])
+            self.send_header("Cache-Control", "no-cache")
+            self.end_headers()
+            return HTTPStatus.NOT_MODIFIED, 0, None, hit
+
+        body = entry["body"]
+        encoding = None
+        if is_html:
+            # Inject the live-reload client (HTML is small; not worth caching the result)
+            body = body.replace(b"</body>", LIVE_RELOAD_SCRIPT + b"</body>", 1)
+        elif content_type.startswith(COMPRESSIBLE_TYPES) and len(body) >= MIN_COMPRESS_BYTES:
+            encoding = accepted_encoding(self.headers.get("Accept-Encoding", ""))
+            if encoding:
+                body = self.cache.variant(path, entry, encoding)
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", content_type + ("; charset=utf-8" if content_type.startswith("text/") else ""))
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Vary", "Accept-Encoding")
+        if not is_html:
+            self.send_header("ETag", entry["etag"])
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self.end_headers()
+        if not head:
+            self.wfile.write(body)
+        return HTTPStatus.OK, len(body), encoding, hit
+
+    def stream_reloads(self) -> None:
+        """Hold a Server-Sent Events stream open and send a message per tree change."""
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        seen = self.live_reload.version
+        try:
+            while True:
+                version = self.live_reload.wait(seen, timeout=15)
+                # A comment line keeps idle connections alive
+                self.wfile.write(b"data: reload\n\n" if version != seen else b": ping\n\n")
+                self.wfile.flush()
+                seen = version
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format, *args):
+        # Requests are logged by serve(); keep errors from send_error quiet too
+        pass
+
+
+def run_server(port: int, cache_mb: int, slow_ms: float, run_generators: bool) -> None:
+    """Start the watcher thread and serve PROJECT_ROOT until interrupted."""
+    live_reload = LiveReload()
+    handler = type("Handler", (DevRequestHandler,), {
+        "cache": FileCache(cache_mb * 1024 * 1024),
+        "live_reload": live_reload,
+        "slow_ms": slow_ms,
+    })
+    handler_factory = lambda *args, **kwargs: handler(*args, directory=str(PROJECT_ROOT), **kwargs)
+
+    threading.Thread(target=watch, args=(PROJECT_ROOT, live_reload, run_generators), daemon=True).start()
+
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler_factory)
+    server.daemon_threads = True
+    print(f"Serving {PROJECT_ROOT.resolve()} at http://localhost:{port}/")
+    print(f"Compression: gzip{', br' if brotli else ' (install brotli for br)'}; "
+          f"generators {'on' if run_generators else 'off'}; slow threshold {slow_ms:.0f}ms")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        cache = handler.cache
+        print(f"\nCache: {cache.hits} hits, {cache.misses} misses, {cache.size / 1024:.0f} KB held")
+        server.server_close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Preview the site locally with live regeneration")
+    parser.add_argument("-p", "--port", type=int, default=DEFAULT_PORT, help=f"Port (default: {DEFAULT_PORT})")
+    parser.add_argument("--cache-mb", type=int, default=DEFAULT_CACHE_MB,
+                        help=f"In-memory cache size in MB (default: {DEFAULT_CACHE_MB})")
+    parser.add_argument("--slow-ms", type=float, default=DEFAULT_SLOW_MS,
+                        help=f"Flag requests slower than this (default: {DEFAULT_SLOW_MS}ms)")
+    parser.add_argument("--no-generators", action="store_true", help="Only live-reload; don't rerun tools on changes")
+    args = parser.parse_args()
+
+    run_server(args.port, args.cache_mb, args.slow_ms, not args.no_generators)
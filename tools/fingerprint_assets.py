@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""Fingerprint static assets with content-hash query strings.
+
+Replaces hand-bumped ?v=12 cache busting. Every local reference to a static
+file (favicons, CSS, JS, data JSON, the stats CSV, fonts, images, PDFs) in
+the pages and the files they load is rewritten to /path?v=<hash>, where the
+hash is the first 10 hex digits of the file's SHA-256. A URL therefore only
+changes when its content does, so everything can be cached as immutable.
+
+References are rewritten in:
+- index.html and resume/index.html (<link>, <script>, <img>, <a>)
+- styles.css (url(...) for fonts and images)
+- script.js and resume/script.js ("/data/site.json", "/data/resume.json")
+- data/*.json (site.json's statsFile/dataFile/headshot paths, posters, pdfUrl)
+
+Files are processed dependencies first: a data file's hash lands in
+site.json, site.json's in script.js, and script.js's in index.html, so a
+change anywhere propagates up to the page that loads it. The query string is
+ignored when serving files, so nothing is renamed and GitHub Pages serves
+the tree as-is.
+
+data/asset-manifest.json maps every static asset URL to its fingerprinted URL.
+
+Usage:
+    python tools/fingerprint_assets.py           # rewrite references + manifest
+    python tools/fingerprint_assets.py --check   # exit 1 if any reference is stale (CI)
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+MANIFEST_PATH = PROJECT_ROOT / "data" / "asset-manifest.json"
+
+# Files whose references get rewritten
+REWRITE_GLOBS = ["index.html", "resume/index.html", "styles.css", "script.js", "resume/script.js", "data/*.json"]
+
+# Static assets listed in the manifest
+ASSET_GLOBS = ["styles.css", "script.js", "resume/script.js", "data/*.json", "assets/**/*"]
+
+# Generated files that already carry their own hash or must not be versioned,
+# and the .gz/.br siblings written by precompress_assets.py
+EXCLUDE = re.compile(
+    r"^data/(site-data\.[0-9a-f]+\.json|asset-manifest\.json|image-manifest\.json|placeholders\.json)$"
+    r"|^assets/build/|\.(gz|br)$"
+)
+
+# Quoted or url()-wrapped local path with a static file extension,
+# optionally carrying a previous ?v= query
+ASSET_REF = re.compile(
+    r"""(?<=["'(])(?P<path>(?:\.{0,2}/)?\w[\w./-]*\.(?:css|js|json|csv|png|jpe?g|gif|ico|svg|webp|avif|woff2?|ttf|otf|pdf))"""
+    r"""(?:\?v=[\w.-]*)?(?=["')])""",
+    re.IGNORECASE,
+)
+
+HASH_LENGTH = 10
+
+
+def file_version(path: Path) -> str:
+    """Short content hash used as the ?v= value."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()[:HASH_LENGTH]
+
+
+def project_path(path: Path) -> str:
+    """Project-relative POSIX path."""
+    return path.relative_to(PROJECT_ROOT).as_posix()
+
+
+def is_versioned(path: Path) -> bool:
+    """Whether a file is a static asset that should carry a fingerprint."""
+    try:
+        rel = project_path(path)
+    except ValueError:
+        return False
+    return path.is_file() and not EXCLUDE.match(rel)
+
+
+def resolve_ref(ref: str, source: Path) -> Path:
+    """
+    Resolve a reference to a file on disk.
+
+    Paths starting with "/" are root-relative. In HTML and CSS other paths are
+    relative to the file; in JSON and JS they are root-relative, because
+    script.js fetches them as "/" + path.
+    """
+    if ref.startswith("/"):
+        return (PROJECT_ROOT / ref.lstrip("/")).resolve()
+    if source.suffix in (".html", ".css"):
+        return (source.parent / ref).resolve()
+    return (PROJECT_ROOT / ref).resolve()
+
+
+class Fingerprinter:
+    """Rewrites references depth-first so every file is hashed after its dependencies."""
+
+    def __init__(self, write: bool = True):
+        self.write = write
+        self.rewritable = {
+            path.resolve()
+            for pattern in REWRITE_GLOBS
+            for path in PROJECT_ROOT.glob(pattern)
+            if is_versioned(path)
+        }
+        self.versions = {}
+        self.visiting = set()
+        self.stale = []
+
+    def version(self, path: Path) -> str:
+        """Fingerprint a file, rewriting its own references first if it has any."""
+        if path in self.versions:
+            return self.versions[path]
+        if path in self.visiting:
+            raise ValueError(f"Circular asset reference through {project_path(path)}")
+
+        self.visiting.add(path)
+        if path in self.rewritable:
+            self.rewrite(path)
+        self.visiting.discard(path)
+
+        # rewrite() already recorded the hash of pending content in --check mode
+        return self.versions.setdefault(path, file_version(path))
+
+    def rewrite(self, path: Path) -> None:
+        """Update every fingerprinted reference inside one text file."""
+        original = path.read_text()
+
+        def replace(match):
+            ref = match.group("path")
+            target = resolve_ref(ref, path)
+            if not is_versioned(target):
+                return match.group(0)
+            return f"{ref}?v={self.version(target)}"
+
+        updated = ASSET_REF.sub(replace, original)
+        if updated == original:
+            return
+
+        self.stale.append(project_path(path))
+        if self.write:
+            path.write_text(updated)
+            print(f"Updated references in {project_path(path)}")
+        else:
+            # Hash the would-be content so dependents see the right version
+            self.versions[path] = hashlib.sha256(updated.encode()).hexdigest()[:HASH_LENGTH]
+
+    def run(self) -> dict[str, str]:
+        """Fingerprint every asset and return the URL -> fingerprinted URL manifest."""
+        for path in sorted(self.rewritable):
+            self.version(path)
+
+        manifest = {}
+        for pattern in ASSET_GLOBS:
+            for path in PROJECT_ROOT.glob(pattern):
+                path = path.resolve()
+                if is_versioned(path):
+                    url = "/" + project_path(path)
+                    manifest[url] = f"{url}?v={self.version(path)}"
+        return dict(sorted(manifest.items()))
+
+
+def write_manifest(manifest: dict[str, str]) -> None:
+    """Write the manifest only when it changed (it is itself a data file)."""
+    text = json.dumps(manifest, indent=2) + "\n"
+    if MANIFEST_PATH.exists() and MANIFEST_PATH.read_text() == text:
+        return
+    MANIFEST_PATH.write_text(text)
+    print(f"Manifest written to {MANIFEST_PATH} ({len(manifest)} assets)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fingerprint static asset references with content hashes")
+    parser.add_argument("--check", action="store_true", help="Report stale references without writing; exit 1 if any")
+    args = parser.parse_args()
+
+    fingerprinter = Fingerprinter(write=not args.check)
+    manifest = fingerprinter.run()
+
+    if args.check:
+        for rel in fingerprinter.stale:
+            print(f"Stale asset references in {rel}")
+        sys.exit(1 if fingerprinter.stale else 0)
+
+    write_manifest(manifest)
+    if not fingerprinter.stale:
+        print("All asset references are up to date")
@@ -1,29 +1,297 @@
 #!/usr/bin/env python3
-"""Convert pasted tweet text to JSON-safe string with escaped newlines."""
+"""
+Convert pasted tweet text to JSON-safe string with escaped newlines, or bulk
+import tweets from an X/Twitter archive into data/writing-shortform.json.
 
+Bulk mode streams the archive's tweets.js (`window.YTD.tweets.part0 = [...]`)
+or a JSON-lines file one tweet at a time, so memory stays flat however large
+the export is. Selected tweets are normalized:
+
+- HTML entities decoded, t.co links expanded, media links removed
+- the first photo becomes `image` (pbs.twimg.com ...?format=jpg&name=medium)
+- `date`, `url`, `retweets` and `likes` filled in; `title` defaults to the
+  first line of the text (edit it afterwards)
+
+Tweets already in writing-shortform.json (matched by the status ID in their
+url) are skipped, and only new entries are appended; existing entries keep
+their exact bytes. The site sorts tweets by date, so file order doesn't matter.
+The archive has no bookmark counts, so imported entries have none.
+
+Replies and retweets are skipped unless --include-replies is given.
+
+Usage:
+    python tools/format_tweet.py                                    # paste one tweet
+    python tools/format_tweet.py --archive tweets.js --id 1941610153154928872 --id 1932171511982338381
+    python tools/format_tweet.py --archive tweets.js --ids-file ids.txt
+    python tools/format_tweet.py --archive tweets.jsonl --since 2025-01-01 --min-likes 50 --dry-run
+"""
+
+import argparse
+import html
 import json
+import re
+import unicodedata
+from datetime import datetime
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+SHORTFORM_PATH = PROJECT_ROOT / "data" / "writing-shortform.json"
+
+DEFAULT_HANDLE = "hedgertronic"
+CHUNK_SIZE = 1 << 20
+TITLE_LENGTH = 70
+
+STATUS_ID = re.compile(r"/status/(\d+)")
+MEDIA_URL = re.compile(r"^(https://pbs\.twimg\.com/media/[\w-]+)\.(\w+)$")
+
+
+def paste_tweet() -> None:
+    """Interactive mode: read pasted text from stdin and print it as a JSON string."""
+    print("Paste your tweet text below. Press Ctrl+D (Mac/Linux) or Ctrl+Z (Windows) when done:\n")
+
+    try:
+        lines = []
+        while True:
+            try:
+                line = input()
+                lines.append(line)
+            except EOFError:
+                break
+
+        text = "\n".join(lines)
+
+        # Use json.dumps to properly escape the string
+        json_safe = json.dumps(text)
+
+        print("\n" + "=" * 50)
+        print("JSON-safe string (copy everything between the quotes):")
+        print("=" * 50)
+        print(json_safe)
+        print("=" * 50)
+
+    except KeyboardInterrupt:
+        print("\nCancelled.")
+
+
+def stream_tweets(path: Path, chunk_size: int = CHUNK_SIZE):
+    """
+    Yield tweet dicts from tweets.js or JSON lines, one at a time.
+
+    The file is read in chunks and each object is decoded as soon as it is
+    complete, so memory is bounded by the chunk size plus the largest tweet.
+    Archive entries wrapped as {"tweet": {...}} are unwrapped.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    started = False
+    eof = False
+
+    with open(path, "r", encoding="utf-8") as f:
+        while True:
+            # Skip whitespace and commas between objects
+            while pos < len(buffer) and (buffer[pos].isspace() or buffer[pos] == ","):
+                pos += 1
+
+            if not started:
+                # Drop a `window.YTD.tweets.part0 = ` prefix and the opening bracket
+                starts = [i for i in (buffer.find("[", pos), buffer.find("{", pos)) if i >= 0]
+                if starts:
+                    pos = min(starts)
+                    pos += buffer[pos] == "["
+                    started = True
+                    continue
+            elif pos < len(buffer):
+                if buffer[pos] == "]":
+                    return
+                try:
+                    obj, end = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    # Incomplete object: read more unless the file is exhausted
+                    if eof:
+                        raise
+                else:
+                    pos = end
+                    yield obj.get("tweet", obj)
+                    continue
+
+            if eof:
+                return
+            chunk = f.read(chunk_size)
+            eof = not chunk
+            buffer = buffer[pos:] + chunk
+            pos = 0
+
+
+def tweet_id(url: str) -> str | None:
+    """Status ID from an x.com / twitter.com status URL."""
+    match = STATUS_ID.search(url or "")
+    return match.group(1) if match else None
+
+
+def is_reply_or_retweet(tweet: dict) -> bool:
+    return bool(tweet.get("in_reply_to_status_id_str")) or tweet.get("full_text", "").startswith("RT @")
+
+
+def normalize_text(tweet: dict) -> str:
+    """Decode entities, expand t.co links and drop the links to attached media."""
+    text = tweet.get("full_text") or tweet.get("text", "")
+    entities = tweet.get("entities", {})
+    for url in entities.get("urls", []):
+        text = text.replace(url["url"], url.get("expanded_url") or url["url"])
+    for media in tweet.get("extended_entities", entities).get("media", []):
+        text = text.replace(media["url"], "")
+
+    text = html.unescape(text).replace("\r\n", "\n")
+    text = "\n".join(line.rstrip() for line in text.split("\n"))
+    return unicodedata.normalize("NFC", text).strip()
+
+
+def first_image(tweet: dict) -> str | None:
+    """URL of the first attached photo in the format the site uses."""
+    media = tweet.get("extended_entities", tweet.get("entities", {})).get("media", [])
+    for item in media:
+        if item.get("type", "photo") != "photo":
+            continue
+        match = MEDIA_URL.match(item.get("media_url_https", ""))
+        if match:
+            return f"{match.group(1)}?format={match.group(2)}&name=medium"
+    return None
+
+
+def default_title(text: str) -> str:
+    """First line of the text, cut at a word boundary."""
+    line = text.split("\n", 1)[0]
+    if len(line) <= TITLE_LENGTH:
+        return line
+    return line[:TITLE_LENGTH].rsplit(" ", 1)[0].rstrip(",.:;") + "..."
+
+
+def tweet_entry(tweet: dict, handle: str) -> dict:
+    """Build a writing-shortform.json entry (same key order as the file) from an archive tweet."""
+    text = normalize_text(tweet)
+    created = datetime.strptime(tweet["created_at"], "%a %b %d %H:%M:%S %z %Y")
+    entry = {
+        "title": default_title(text),
+        "text": text,
+        "date": created.date().isoformat(),
+        "url": f"https://x.com/{handle}/status/{tweet['id_str']}",
+    }
+    image = first_image(tweet)
+    if image:
+        entry["image"] = image
+    entry["retweets"] = int(tweet.get("retweet_count", 0))
+    entry["likes"] = int(tweet.get("favorite_count", 0))
+    return entry
+
+
+def select(tweet: dict, ids: set[str], since: str | None, min_likes: int, include_replies: bool) -> bool:
+    """Whether an archive tweet matches the requested filters."""
+    if ids and tweet.get("id_str") not in ids:
+        return False
+    # Explicitly requested IDs may be replies (e.g. the rest of a thread)
+    if not include_replies and not ids and is_reply_or_retweet(tweet):
+        return False
+    if int(tweet.get("favorite_count", 0)) < min_likes:
+        return False
+    if since:
+        created = datetime.strptime(tweet["created_at"], "%a %b %d %H:%M:%S %z %Y")
+        if created.date().isoformat() < since:
+            return False
+    return True
+
+
+def append_entries(path: Path, entries: list[dict]) -> None:
+    """
+    Append entries to a JSON array file without re-serializing what is there.
+
+    New entries are formatted like the rest of the file (2-space indent, UTF-8).
+    """
+    original = path.read_text(encoding="utf-8")
+    body = original.rstrip()
+    if not body.endswith("]"):
+        raise ValueError(f"{path} is not a JSON array")
+    body = body[:-1].rstrip()
+
+    blocks = []
+    for entry in entries:
+        lines = json.dumps(entry, indent=2, ensure_ascii=False).split("\n")
+        blocks.append("\n".join("  " + line for line in lines))
+
+    separator = ",\n" if body != "[" else "\n"
+    path.write_text(body + separator + ",\n".join(blocks) + "\n]\n", encoding="utf-8")
+
+
+def ingest_archive(archive: Path, ids: set[str], since: str = None, min_likes: int = 0,
+                   include_replies: bool = False, handle: str = DEFAULT_HANDLE, dry_run: bool = False) -> None:
+    """
+    Stream an archive and append the selected tweets missing from writing-shortform.json.
+
+    Args:
+        archive: tweets.js or JSON-lines file
+        ids: Tweet IDs to import (empty for every tweet that passes the filters)
+        since: Earliest date to import (YYYY-MM-DD)
+        min_likes: Minimum like count
+        include_replies: Import replies and retweets too
+        handle: Account used to build status URLs
+        dry_run: Print the entries instead of writing them
+    """
+    with open(SHORTFORM_PATH, "r", encoding="utf-8") as f:
+        known = {tweet_id(item.get("url")) for item in json.load(f)}
+
+    scanned = 0
+    new_entries = []
+    for tweet in stream_tweets(archive):
+        scanned += 1
+        if tweet.get("id_str") in known or not select(tweet, ids, since, min_likes, include_replies):
+            continue
+        known.add(tweet["id_str"])
+        new_entries.append(tweet_entry(tweet, handle))
+
+    print(f"Scanned {scanned:,} tweets, {len(new_entries)} new")
+    found = {tweet_id(entry["url"]) for entry in new_entries}
+    missing = ids - found - known
+    if missing:
+        print(f"Not found in archive: {', '.join(sorted(missing))}")
+    if not new_entries:
+        return
+
+    for entry in new_entries:
+        print(f"  + {entry['date']}  {entry['title']}")
+    if dry_run:
+        print(json.dumps(new_entries, indent=2, ensure_ascii=False))
+        return
+
+    append_entries(SHORTFORM_PATH, new_entries)
+    print(f"Appended {len(new_entries)} entries to {SHORTFORM_PATH}; edit their titles as needed")
 
-print("Paste your tweet text below. Press Ctrl+D (Mac/Linux) or Ctrl+Z (Windows) when done:\n")
 
-try:
-    lines = []
-    while True:
-        try:
-            line = input()
-            lines.append(line)
-        except EOFError:
-            break
+def main():
+    parser = argparse.ArgumentParser(
+        description="Format pasted tweet text, or import tweets from an archive",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument("--archive", type=Path, help="tweets.js or JSON-lines file to import from")
+    parser.add_argument("--id", action="append", default=[], help="Tweet ID to import (repeatable)")
+    parser.add_argument("--ids-file", type=Path, help="File with one tweet ID or status URL per line")
+    parser.add_argument("--since", help="Only tweets on or after this date (YYYY-MM-DD)")
+    parser.add_argument("--min-likes", type=int, default=0, help="Only tweets with at least this many likes")
+    parser.add_argument("--include-replies", action="store_true", help="Also import replies and retweets")
+    parser.add_argument("--handle", default=DEFAULT_HANDLE, help=f"Account for status URLs (default: {DEFAULT_HANDLE})")
+    parser.add_argument("--dry-run", action="store_true", help="Print new entries without writing")
+    args = parser.parse_args()
 
-    text = "\n".join(lines)
+    if not args.archive:
+        paste_tweet()
+        return
 
-    # Use json.dumps to properly escape the string
-    json_safe = json.dumps(text)
+    ids = set(args.id)
+    if args.ids_file:
+        for line in args.ids_file.read_text().split():
+            ids.add(tweet_id(line) or line)
+    ingest_archive(args.archive, ids, args.since, args.min_likes, args.include_replies, args.handle, args.dry_run)
 
-    print("\n" + "=" * 50)
-    print("JSON-safe string (copy everything between the quotes):")
-    print("=" * 50)
-    print(json_safe)
-    print("=" * 50)
 
-except KeyboardInterrupt:
-    print("\nCancelled.")
+if __name__ == "__main__":
+    main()
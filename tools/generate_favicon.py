@@ -11,23 +11,79 @@ Usage:
 
     # Do both in one go (convenience command)
     uv run --with pillow tools/generate_favicon.py all assets/images/headshot/headshot.jpg -o assets/images/favicons/
+
+    # Compare time/memory of the fast decode path against full-resolution decoding
+    uv run --with pillow tools/generate_favicon.py compare
+
+    # Favicon sets for every headshot in data/site.json (one directory per theme)
+    uv run --with pillow tools/generate_favicon.py batch -o assets/images/favicons/themes/
+
+    # Text favicon as a modern SVG-based set (favicon.svg + favicon.ico + apple-touch-icon.png)
+    uv run --with pillow --with fonttools tools/generate_favicon.py text JH assets/fonts/DMSans.ttf --svg
 """
 
 import argparse
+import contextlib
+import functools
+import hashlib
+import io
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
+from image_cache import image_cache
+from raster_export import (
+    FAVICON_SIZES,
+    ICO_SIZES,
+    build_pyramid,
+    composite_layers,
+    encode_png,
+    export_favicon_set,
+    hex_to_rgb,
+    psnr,
+)
+from svg_export import hex_to_svg, path, rounded_rect, svg_document, text_outline, write_modern_favicon_set
+
+PROJECT_ROOT = Path(__file__).parent.parent
+SITE_JSON = PROJECT_ROOT / "data" / "site.json"
+IMAGE_SUFFIXES = {".jpg", ".jpeg", ".png", ".webp"}
+
+# Fast path works at 2x the largest favicon so LANCZOS still supersamples it
+FAST_WORKING_SIZE = 2 * max(FAVICON_SIZES.values())
+
+# Text favicon layout on a 512x512 canvas (shared by the PNG and SVG renderers)
+TEXT_CANVAS_SIZE = 512
+TEXT_FONT_SCALE = 0.65
 
-def create_circular_image(input_path: Path, output_path: Path) -> None:
+
+def load_circular(input_path: Path, working_size: int = None):
     """
-    Take a square image and crop it into a circle with transparent background.
+    Load a photo, center-crop it to a square and mask it into a circle.
+
+    With working_size=None the source is decoded and masked at full
+    resolution. Otherwise the fast path is used: JPEGs are decoded in draft
+    mode (libjpeg scales by 1/2, 1/4 or 1/8 while decoding), the square crop
+    happens before the RGBA conversion, the crop is resized to working_size,
+    and the circle is masked there with a supersampled, anti-aliased mask.
 
     Args:
-        input_path: Path to the source image (should be square for best results)
-        output_path: Path to save the circular PNG with transparency
+        input_path: Path to the source image
+        working_size: Edge length to work at, or None for full resolution
+
+    Returns:
+        Square RGBA PIL image with a transparent background outside the circle
     """
     from PIL import Image, ImageDraw
 
-    img = Image.open(input_path).convert("RGBA")
+    img = Image.open(input_path)
+
+    if working_size is None:
+        img = img.convert("RGBA")
+    else:
+        # Smallest JPEG scale that still covers working_size (no-op for PNG)
+        img.draft("RGB", (working_size, working_size))
 
     # Use the smaller dimension to ensure we get a proper circle
     size = min(img.size)
@@ -38,20 +94,62 @@ def create_circular_image(input_path: Path, output_path: Path) -> None:
         top = (img.size[1] - size) // 2
         img = img.crop((left, top, left + size, top + size))
 
-    # Create circular mask (white = visible, black = transparent)
-    mask = Image.new("L", (size, size), 0)
-    draw = ImageDraw.Draw(mask)
-    draw.ellipse((0, 0, size, size), fill=255)
+    if working_size is None:
+        # Create circular mask (white = visible, black = transparent)
+        mask = Image.new("L", (size, size), 0)
+        draw = ImageDraw.Draw(mask)
+        draw.ellipse((0, 0, size, size), fill=255)
+    else:
+        if img.mode not in ("RGB", "RGBA"):
+            img = img.convert("RGBA")
+        if size > working_size:
+            img = img.resize((working_size, working_size), Image.LANCZOS)
+            size = working_size
+        img = img.convert("RGBA")
+        mask = circular_mask(size)
 
     # Apply mask to create transparent background
     output = Image.new("RGBA", (size, size), (0, 0, 0, 0))
     output.paste(img, (0, 0), mask)
+    return output
+
+
+def cached_circular(input_path: Path, working_size: int = FAST_WORKING_SIZE):
+    """Fast-path load_circular() through the shared image cache."""
+    return image_cache().image(
+        input_path,
+        [("circular", working_size)],
+        lambda: load_circular(input_path, working_size),
+    )
+
+
+def circular_mask(size: int, supersample: int = 4):
+    """Anti-aliased circular "L" mask, drawn at supersample x size and box-reduced."""
+    from PIL import Image, ImageDraw
+
+    big = size * supersample
+    mask = Image.new("L", (big, big), 0)
+    ImageDraw.Draw(mask).ellipse((0, 0, big - 1, big - 1), fill=255)
+    # Box averaging gives each pixel its exact coverage fraction
+    return mask.reduce(supersample)
 
+
+def create_circular_image(input_path: Path, output_path: Path, size: int = None) -> None:
+    """
+    Take a square image and crop it into a circle with transparent background.
+
+    Args:
+        input_path: Path to the source image (should be square for best results)
+        output_path: Path to save the circular PNG with transparency
+        size: Output edge length; uses the fast reduced-resolution path when set
+            (default: full source resolution)
+    """
+    output = load_circular(input_path) if size is None else cached_circular(input_path, size)
     output.save(output_path, "PNG")
-    print(f"Created circular image: {output_path} ({size}x{size})")
+    print(f"Created circular image: {output_path} ({output.size[0]}x{output.size[1]})")
 
 
-def generate_favicons(input_path: Path, output_dir: Path) -> None:
+def generate_favicons(input_path: Path, output_dir: Path, verify: bool = False) -> None:
     """
     Generate all favicon sizes from a source image.
 
@@ -65,6 +163,7 @@ def generate_favicons(input_path: Path, output_dir: Path) -> None:
     Args:
         input_path: Path to source image (ideally already circular with transparency)
         output_dir: Directory to save favicon files
+        verify: Check the downscale pyramid against direct resizes
     """
     from PIL import Image
 
@@ -73,75 +172,78 @@ def generate_favicons(input_path: Path, output_dir: Path) -> None:
 
     img = Image.open(input_path).convert("RGBA")
 
-    # Define sizes to generate
-    png_sizes = {
-        "favicon-16.png": 16,
-        "favicon-32.png": 32,
-        "favicon-180.png": 180,
-        "apple-touch-icon.png": 180,
-    }
+    # PNG favicons (with transparency) and ICO, all from one downscale pyramid
+    export_favicon_set(img, output_dir, verify=verify)
 
-    # Generate PNG favicons (with transparency)
-    for filename, size in png_sizes.items():
-        resized = img.resize((size, size), Image.LANCZOS)
-        output_path = output_dir / filename
-        resized.save(output_path, "PNG")
-        print(f"Created {output_path} ({size}x{size})")
 
-    # Generate ICO file (needs RGB with white background for Safari compatibility)
-    # But we'll try RGBA first since it worked
-    img_32 = img.resize((32, 32), Image.LANCZOS)
-    img_16 = img.resize((16, 16), Image.LANCZOS)
+def text_favicon_svg(text: str, font_path: Path, bg_color: str = "#0a0e1a", text_color: str = "#ffffff", corner_radius: float = 0.2, stroke_width: float = 0.0) -> str:
+    """
+    Describe a text favicon as an SVG document with outlined glyphs.
 
-    ico_path = output_dir / "favicon.ico"
-    img_32.save(ico_path, format="ICO", append_images=[img_16])
-    print(f"Created {ico_path} (16x16 + 32x32 embedded)")
+    Uses the same layout as generate_text_favicon: a rounded square with the
+    text's ink box centered, and faux-bold as a round-joined stroke.
+    """
+    size = TEXT_CANVAS_SIZE
+    font_size = int(size * TEXT_FONT_SCALE)
+    radius = int(size * corner_radius)
+    stroke_px = int(font_size * stroke_width) if stroke_width > 0 else 0
 
+    outline = text_outline(text, font_path, font_size)
+    x0, y0, x1, y1 = outline["bbox"]
+    dx = (size - (x1 - x0)) / 2 - x0
+    dy = (size - (y1 - y0)) / 2 - y0
 
-def generate_text_favicon(text: str, font_path: Path, output_dir: Path, bg_color: str = "#0a0e1a", text_color: str = "#ffffff", corner_radius: float = 0.2, stroke_width: float = 0.0) -> None:
-    """
-    Generate a text-based favicon using a specified font.
+    fill = hex_to_svg(text_color)
+    return svg_document(size, [
+        rounded_rect(0, 0, size, size, radius, hex_to_svg(bg_color)),
+        # PIL strokes outward by stroke_px; an SVG stroke is centered on the outline
+        path(outline["d"], fill, dx, dy, stroke_width=2 * stroke_px),
+    ])
 
-    Args:
-        text: The text to render (e.g., "JH")
-        font_path: Path to the TTF font file
-        bg_color: Background color (hex)
-        text_color: Text color (hex)
-        output_dir: Directory to save favicon files
-        corner_radius: Corner radius as a fraction of size (0.0 = square, 0.5 = circle)
-        stroke_width: Stroke width as fraction of font size to simulate bold (0.0 = none)
+
+@functools.lru_cache(maxsize=None)
+def load_font(font_path: Path, font_size: int):
+    """Load a TrueType font once per (path, size) per process."""
+    from PIL import ImageFont
+
+    return ImageFont.truetype(str(font_path), font_size)
+
+
+@functools.lru_cache(maxsize=None)
+def text_favicon_layers(text: str, font_path: Path, corner_radius: float = 0.2, stroke_width: float = 0.0) -> tuple:
     """
-    from PIL import Image, ImageDraw, ImageFont
+    Rasterize the text favicon geometry as ("bg", mask) and ("text", mask) layers.
 
-    # Convert hex colors to RGB tuples
-    def hex_to_rgb(hex_color):
-        hex_color = hex_color.lstrip('#')
-        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+    Cached per geometry (in memory and in the shared image cache, keyed by the
+    font file), so color variants only pay for compositing.
+    """
+    ops = [("text-layers", text, TEXT_CANVAS_SIZE, TEXT_FONT_SCALE, corner_radius, stroke_width)]
+    return image_cache().layers(
+        font_path, ops, lambda: draw_text_favicon_layers(text, font_path, corner_radius, stroke_width)
+    )
 
-    bg_rgb = hex_to_rgb(bg_color)
-    text_rgb = hex_to_rgb(text_color)
 
-    output_dir = Path(output_dir)
-    output_dir.mkdir(parents=True, exist_ok=True)
+def draw_text_favicon_layers(text: str, font_path: Path, corner_radius: float, stroke_width: float) -> tuple:
+    """Draw the uncached ("bg", mask) and ("text", mask) layers of a text favicon."""
+    from PIL import Image, ImageDraw
 
-    # Create a large canvas first (512x512) for better quality
-    size = 512
+    size = TEXT_CANVAS_SIZE
     radius = int(size * corner_radius)
 
-    # Create transparent canvas and draw rounded rectangle
-    img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-
     # Draw rounded rectangle background
-    draw.rounded_rectangle(
+    bg_mask = Image.new("L", (size, size), 0)
+    ImageDraw.Draw(bg_mask).rounded_rectangle(
         [(0, 0), (size - 1, size - 1)],
         radius=radius,
-        fill=(*bg_rgb, 255)
+        fill=255
     )
 
     # Load font at a size that fills most of the canvas
-    font_size = int(size * 0.65)
-    font = ImageFont.truetype(str(font_path), font_size)
+    font_size = int(size * TEXT_FONT_SCALE)
+    font = load_font(font_path, font_size)
+
+    text_mask = Image.new("L", (size, size), 0)
+    draw = ImageDraw.Draw(text_mask)
 
     # Get text bounding box for centering
     bbox = draw.textbbox((0, 0), text, font=font)
@@ -156,101 +258,253 @@ def generate_text_favicon(text: str, font_path: Path, output_dir: Path, bg_color
     stroke_px = int(font_size * stroke_width) if stroke_width > 0 else 0
 
     # Draw the text with optional stroke for faux-bold effect
-    draw.text(
-        (x, y),
-        text,
-        font=font,
-        fill=(*text_rgb, 255),
-        stroke_width=stroke_px,
-        stroke_fill=(*text_rgb, 255)
-    )
+    draw.text((x, y), text, font=font, fill=255, stroke_width=stroke_px, stroke_fill=255)
+
+    return (("bg", bg_mask), ("text", text_mask))
+
+
+def render_text_favicon(text: str, font_path: Path, bg_color: str = "#0a0e1a", text_color: str = "#ffffff", corner_radius: float = 0.2, stroke_width: float = 0.0):
+    """Composite the cached text favicon layers in the given colors into a 512x512 RGBA image."""
+    layers = text_favicon_layers(text, Path(font_path), corner_radius, stroke_width)
+    return composite_layers(layers, {"bg": hex_to_rgb(bg_color), "text": hex_to_rgb(text_color)})
 
-    bold_info = f", stroke={stroke_px}px" if stroke_px > 0 else ""
-    print(f"Created text favicon base image with '{text}' ({size}x{size}, radius={radius}px{bold_info})")
 
-    # Generate all favicon sizes
-    png_sizes = {
-        "favicon-16.png": 16,
-        "favicon-32.png": 32,
-        "favicon-180.png": 180,
-        "apple-touch-icon.png": 180,
-    }
+def generate_text_favicon(text: str, font_path: Path, output_dir: Path, bg_color: str = "#0a0e1a", text_color: str = "#ffffff", corner_radius: float = 0.2, stroke_width: float = 0.0, svg: bool = False) -> None:
+    """
+    Generate a text-based favicon using a specified font.
+
+    Args:
+        text: The text to render (e.g., "JH")
+        font_path: Path to the TTF font file
+        bg_color: Background color (hex)
+        text_color: Text color (hex)
+        output_dir: Directory to save favicon files
+        corner_radius: Corner radius as a fraction of size (0.0 = square, 0.5 = circle)
+        stroke_width: Stroke width as fraction of font size to simulate bold (0.0 = none)
+        svg: Write the modern SVG-based favicon set instead of the full PNG set
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Create a large canvas first (512x512) for better quality
+    size = TEXT_CANVAS_SIZE
+    radius = int(size * corner_radius)
+    stroke_px = int(int(size * TEXT_FONT_SCALE) * stroke_width) if stroke_width > 0 else 0
+
+    img = render_text_favicon(text, font_path, bg_color, text_color, corner_radius, stroke_width)
 
-    for filename, sz in png_sizes.items():
-        resized = img.resize((sz, sz), Image.LANCZOS)
-        output_path = output_dir / filename
-        resized.save(output_path, "PNG")
-        print(f"Created {output_path} ({sz}x{sz})")
+    bold_info = f", stroke={stroke_px}px" if stroke_px > 0 else ""
+    print(f"Created text favicon base image with '{text}' ({size}x{size}, radius={radius}px{bold_info})")
 
-    # ICO file
-    img_32 = img.resize((32, 32), Image.LANCZOS)
-    img_16 = img.resize((16, 16), Image.LANCZOS)
-    ico_path = output_dir / "favicon.ico"
-    img_32.save(ico_path, format="ICO", append_images=[img_16])
-    print(f"Created {ico_path} (16x16 + 32x32 embedded)")
+    if svg:
+        svg_text = text_favicon_svg(text, font_path, bg_color, text_color, corner_radius, stroke_width)
+        write_modern_favicon_set(svg_text, img, output_dir)
+    else:
+        # Generate all favicon sizes
+        export_favicon_set(img, output_dir)
 
-    print(f"\nDone! Don't forget to bump the cache version (?v=X) in your HTML if updating existing favicons.")
+    print("\nDone! Run tools/fingerprint_assets.py to refresh the ?v= hashes in the HTML.")
 
 
-def generate_all(input_path: Path, output_dir: Path) -> None:
+def generate_all(input_path: Path, output_dir: Path, full_res: bool = False, verify: bool = False) -> None:
     """
     Convenience function: create circular image and generate all favicons in one step.
 
     Args:
         input_path: Path to source headshot image
         output_dir: Directory to save favicon files
+        full_res: Decode and mask at full source resolution instead of FAST_WORKING_SIZE
+        verify: Check the downscale pyramid against direct resizes
     """
+    # Create circular image in memory (no intermediate file needed)
+    circular = load_circular(input_path) if full_res else cached_circular(input_path)
+    size = circular.size[0]
+
+    print(f"Created circular image from {input_path} ({size}x{size})")
+
+    # Now generate favicons from circular image
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    export_favicon_set(circular, output_dir, verify=verify)
+
+    print("\nDone! Run tools/fingerprint_assets.py to refresh the ?v= hashes in the HTML.")
+
+
+def _measure_circular(input_path: Path, working_size: int) -> tuple[float, int, dict]:
+    """
+    Time one circular favicon build and measure its peak memory growth.
+
+    Meant to run in a fresh process so ru_maxrss reflects only this build.
+
+    Returns:
+        Wall time (s), peak RSS growth (bytes), and PNG bytes per output size
+    """
+    import resource
+    import sys
+
+    from PIL import Image  # noqa: F401 - import before the baseline reading
+
+    rss_unit = 1 if sys.platform == "darwin" else 1024
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    start = time.perf_counter()
+    circular = load_circular(input_path, working_size)
+    pyramid = build_pyramid(circular, [*FAVICON_SIZES.values(), *ICO_SIZES])
+    elapsed = time.perf_counter() - start
+
+    peak = (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - before) * rss_unit
+    outputs = {size: encode_png(pyramid[size]) for size in sorted(set(FAVICON_SIZES.values()) | set(ICO_SIZES))}
+    return elapsed, peak, outputs
+
+
+def compare_decode_paths(sources: dict[str, Path], min_psnr: float = 35.0) -> None:
+    """
+    Report wall time and peak memory of the full-resolution and fast paths.
+
+    Each path runs in its own fresh process per image. The favicon-size
+    outputs of both paths are compared by PSNR to confirm they still match.
+
+    Args:
+        sources: Mapping of label to source image path
+        min_psnr: Minimum PSNR (dB) for the outputs to count as visually equal
+    """
+    import multiprocessing
+
     from PIL import Image
-    import io
 
-    # Create circular image in memory (no intermediate file needed)
-    from PIL import ImageDraw
+    context = multiprocessing.get_context("spawn")
 
-    img = Image.open(input_path).convert("RGBA")
-    size = min(img.size)
+    def run(input_path, working_size):
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            return pool.submit(_measure_circular, input_path, working_size).result()
 
-    # Center crop if not square
-    if img.size[0] != img.size[1]:
-        left = (img.size[0] - size) // 2
-        top = (img.size[1] - size) // 2
-        img = img.crop((left, top, left + size, top + size))
+    print(f"{'Image':<12}{'Full':>10}{'Fast':>10}{'Full RSS':>12}{'Fast RSS':>12}{'Min PSNR':>11}  Match")
+    for key, input_path in sorted(sources.items()):
+        full_time, full_peak, full_out = run(input_path, None)
+        fast_time, fast_peak, fast_out = run(input_path, FAST_WORKING_SIZE)
 
-    # Create circular mask
-    mask = Image.new("L", (size, size), 0)
-    draw = ImageDraw.Draw(mask)
-    draw.ellipse((0, 0, size, size), fill=255)
+        # Flatten onto white so fully transparent pixels don't count
+        def flatten(data):
+            img = Image.open(io.BytesIO(data)).convert("RGBA")
+            return Image.alpha_composite(Image.new("RGBA", img.size, "white"), img).convert("RGB")
 
-    # Apply mask
-    circular = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-    circular.paste(img, (0, 0), mask)
+        worst = min(psnr(flatten(full_out[size]), flatten(fast_out[size])) for size in full_out)
+        match = "yes" if worst >= min_psnr else "NO"
+        print(
+            f"{key:<12}{full_time * 1000:>8.0f}ms{fast_time * 1000:>8.0f}ms"
+            f"{full_peak / 2**20:>10.1f}MB{fast_peak / 2**20:>10.1f}MB{worst:>9.1f}dB  {match}"
+        )
 
-    print(f"Created circular image from {input_path} ({size}x{size})")
 
-    # Now generate favicons from circular image
-    output_dir = Path(output_dir)
-    output_dir.mkdir(parents=True, exist_ok=True)
+def load_batch_sources(source: Path = None) -> dict[str, Path]:
+    """
+    Resolve the images for a batch run.
 
-    png_sizes = {
-        "favicon-16.png": 16,
-        "favicon-32.png": 32,
-        "favicon-180.png": 180,
-        "apple-touch-icon.png": 180,
-    }
+    Args:
+        source: A directory of images (keyed by file stem), or None to use
+            profile.headshots from data/site.json (keyed by theme)
 
-    for filename, sz in png_sizes.items():
-        resized = circular.resize((sz, sz), Image.LANCZOS)
-        output_path = output_dir / filename
-        resized.save(output_path, "PNG")
-        print(f"Created {output_path} ({sz}x{sz})")
+    Returns:
+        Mapping of output key to image path
+    """
+    if source is not None and source.is_dir():
+        return {
+            path.stem: path
+            for path in sorted(source.iterdir())
+            if path.suffix.lower() in IMAGE_SUFFIXES
+        }
+
+    site_json = source or SITE_JSON
+    with open(site_json, "r") as f:
+        headshots = json.load(f)["profile"].get("headshots", {})
+
+    return {key: PROJECT_ROOT / rel.split("?")[0].lstrip("/") for key, rel in headshots.items()}
+
+
+def site_url(path: Path) -> str:
+    """Root-relative URL for a file under the project, or its plain path otherwise."""
+    try:
+        return "/" + path.resolve().relative_to(PROJECT_ROOT.resolve()).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+def _batch_worker(input_path: Path, output_dir: Path) -> tuple[float, int, int]:
+    """Run generate_all quietly in a worker process; returns wall time and image cache hits/misses."""
+    cache = image_cache()
+    hits, misses = cache.hits, cache.misses
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        generate_all(input_path, output_dir)
+    return time.perf_counter() - start, cache.hits - hits, cache.misses - misses
+
+
+def generate_batch(sources: dict[str, Path], output_dir: Path, workers: int = None, force: bool = False) -> None:
+    """
+    Generate one favicon set per source image in parallel.
 
-    # ICO file
-    img_32 = circular.resize((32, 32), Image.LANCZOS)
-    img_16 = circular.resize((16, 16), Image.LANCZOS)
-    ico_path = output_dir / "favicon.ico"
-    img_32.save(ico_path, format="ICO", append_images=[img_16])
-    print(f"Created {ico_path} (16x16 + 32x32 embedded)")
+    Each set is written to output_dir/<key>/. A manifest.json in output_dir
+    maps every key to its icon URLs so the site can swap sets per theme.
+    Sources whose content hash matches the manifest (and whose files still
+    exist) are skipped.
 
-    print(f"\nDone! Don't forget to bump the cache version (?v=X) in your HTML if updating existing favicons.")
+    Args:
+        sources: Mapping of output key to source image path
+        output_dir: Parent directory for the per-key favicon sets
+        workers: Process pool size (default: one per CPU)
+        force: Regenerate every set even if its source is unchanged
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = output_dir / "manifest.json"
+
+    previous = {}
+    if manifest_path.exists():
+        with open(manifest_path, "r") as f:
+            previous = json.load(f)
+
+    filenames = ["favicon.ico", *FAVICON_SIZES]
+    manifest = {}
+    pending = {}
+    for key, input_path in sorted(sources.items()):
+        digest = hashlib.sha256(input_path.read_bytes()).hexdigest()
+        key_dir = output_dir / key
+        manifest[key] = {
+            "source": site_url(input_path),
+            "hash": digest,
+            "icons": {name: site_url(key_dir / name) for name in filenames},
+        }
+
+        cached = previous.get(key, {}).get("hash") == digest
+        if cached and not force and all((key_dir / name).exists() for name in filenames):
+            print(f"{key:<12} unchanged, skipped")
+        else:
+            pending[key] = input_path
+
+    cache_hits = cache_misses = 0
+    total_start = time.perf_counter()
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+            futures = {
+                pool.submit(_batch_worker, input_path, output_dir / key): key
+                for key, input_path in pending.items()
+            }
+            for future in as_completed(futures):
+                key = futures[future]
+                elapsed, hits, misses = future.result()
+                cache_hits += hits
+                cache_misses += misses
+                print(f"{key:<12} {elapsed * 1000:>8.0f}ms  {sources[key].name}{'  (cached)' if hits else ''}")
+
+    with open(manifest_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+        f.write("\n")
+
+    elapsed = time.perf_counter() - total_start
+    print(f"\nGenerated {len(pending)} of {len(sources)} favicon sets in {elapsed:.2f}s")
+    print(f"Image cache: {cache_hits} hits, {cache_misses} misses across workers")
+    print(f"Manifest written to {manifest_path}")
 
 
 def main():
@@ -274,6 +528,12 @@ def main():
         default=Path("circular.png"),
         help="Output path (default: circular.png)"
     )
+    circle_parser.add_argument(
+        "--size",
+        type=int,
+        default=None,
+        help="Output edge length; enables the fast reduced-resolution decode (default: full source size)"
+    )
 
     # Subcommand: favicons
     favicons_parser = subparsers.add_parser(
@@ -287,6 +547,11 @@ def main():
         default=Path("assets/images/favicons"),
         help="Output directory (default: assets/images/favicons)"
     )
+    favicons_parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Compare each downscale step with a direct resize (PSNR) and fall back where it is worse"
+    )
 
     # Subcommand: all
     all_parser = subparsers.add_parser(
@@ -300,6 +565,63 @@ def main():
         default=Path("assets/images/favicons"),
         help="Output directory (default: assets/images/favicons)"
     )
+    all_parser.add_argument(
+        "--full-res",
+        action="store_true",
+        help="Decode and mask at full source resolution instead of the fast path"
+    )
+    all_parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Compare each downscale step with a direct resize (PSNR) and fall back where it is worse"
+    )
+
+    # Subcommand: compare
+    compare_parser = subparsers.add_parser(
+        "compare",
+        help="Compare wall time, peak memory and output of the full-resolution and fast decode paths"
+    )
+    compare_parser.add_argument(
+        "input",
+        type=Path,
+        nargs="?",
+        help="Directory of images, or a site.json path (default: data/site.json)"
+    )
+    compare_parser.add_argument(
+        "--min-psnr",
+        type=float,
+        default=35.0,
+        help="Minimum PSNR in dB for outputs to count as visually equal (default: 35.0)"
+    )
+
+    # Subcommand: batch
+    batch_parser = subparsers.add_parser(
+        "batch",
+        help="Generate a favicon set per headshot in site.json (or per image in a directory) in parallel"
+    )
+    batch_parser.add_argument(
+        "input",
+        type=Path,
+        nargs="?",
+        help="Directory of images, or a site.json path (default: data/site.json)"
+    )
+    batch_parser.add_argument(
+        "-o", "--output-dir",
+        type=Path,
+        default=Path("assets/images/favicons/themes"),
+        help="Parent output directory for per-key sets (default: assets/images/favicons/themes)"
+    )
+    batch_parser.add_argument(
+        "-j", "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: CPU count)"
+    )
+    batch_parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate every set even if its source hash is unchanged"
+    )
 
     # Subcommand: text
     text_parser = subparsers.add_parser(
@@ -338,17 +660,29 @@ def main():
         default=0.0,
         help="Faux-bold stroke width as fraction of font size (default: 0.0, try 0.03-0.05)"
     )
+    text_parser.add_argument(
+        "--svg",
+        action="store_true",
+        help="Write a modern favicon set built on favicon.svg (requires fonttools)"
+    )
 
     args = parser.parse_args()
 
     if args.command == "circle":
-        create_circular_image(args.input, args.output)
+        create_circular_image(args.input, args.output, args.size)
     elif args.command == "favicons":
-        generate_favicons(args.input, args.output_dir)
+        generate_favicons(args.input, args.output_dir, args.verify)
     elif args.command == "all":
-        generate_all(args.input, args.output_dir)
+        generate_all(args.input, args.output_dir, args.full_res, args.verify)
+    elif args.command == "compare":
+        compare_decode_paths(load_batch_sources(args.input), args.min_psnr)
+    elif args.command == "batch":
+        generate_batch(load_batch_sources(args.input), args.output_dir, args.workers, args.force)
     elif args.command == "text":
-        generate_text_favicon(args.text, args.font, args.output_dir, args.bg_color, args.text_color, args.radius, args.bold)
+        generate_text_favicon(args.text, args.font, args.output_dir, args.bg_color, args.text_color, args.radius, args.bold, args.svg)
+
+    if args.command in ("circle", "all", "text"):
+        print(image_cache().summary())
 
 
 if __name__ == "__main__":
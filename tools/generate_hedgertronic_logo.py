@@ -2,161 +2,200 @@
 """
 Generate a hedgertronic camera logo inspired by the Edgertronic high-speed camera.
 Creates an Instagram-style simplified icon with the camera body and lens.
+
+Pass --svg to emit a modern favicon set (favicon.svg + favicon.ico +
+apple-touch-icon.png) built from the same geometry as a vector file.
 """
 
+import functools
 from pathlib import Path
 
-
-def generate_hedgertronic_logo(output_dir: Path, bg_color: str = "#FFA300", body_color: str = "#0a0a0a", simplified: bool = False) -> None:
+from image_cache import image_cache
+from raster_export import composite_layers, export_favicon_set, hex_to_rgb
+from svg_export import (
+    circle,
+    hex_to_svg,
+    path,
+    rgb_to_svg,
+    rounded_rect,
+    svg_document,
+    text_outline,
+    write_modern_favicon_set,
+)
+
+# Logo geometry on a 512x512 canvas (shared by the PNG and SVG renderers)
+SIZE = 512
+MARGIN = 20
+CORNER_RADIUS = 90
+LENS_RADIUS = 145
+LENS_CENTER = (SIZE - (MARGIN + LENS_RADIUS + 30), MARGIN + LENS_RADIUS + 30)
+INNER_RADIUS = 115
+INNER_COLOR = (40, 40, 45)
+GLASS_RADIUS = 85
+GLASS_COLOR = (25, 25, 30)
+HIGHLIGHT_RADIUS = 20
+HIGHLIGHT_CENTER = (LENS_CENTER[0] - 30, LENS_CENTER[1] - 35)
+HIGHLIGHT_COLOR = (60, 60, 70)
+INDICATOR_RADIUS = 18
+INDICATOR_CENTER = (MARGIN + 65, SIZE // 2 - 60)
+LOGO_TEXT = "hedgertronic"
+LOGO_FONT_SIZE = 42
+LOGO_FONT_PATH = Path(__file__).parent.parent / "assets/fonts/DMSans.ttf"
+
+# Bump when the drawing below changes, so cached layers are redrawn
+LOGO_VERSION = 1
+
+
+def hedgertronic_logo_svg(bg_color: str = "#FFA300", body_color: str = "#0a0a0a", simplified: bool = False) -> str:
     """
-    Generate hedgertronic camera logo as favicon.
+    Describe the hedgertronic camera logo as an SVG document.
 
-    The design is a simplified front view of the Edgertronic camera:
-    - Rounded square body (like Instagram icon style)
-    - Large circular lens on the right
-    - Small indicator/screw on the left
-    - "hedgertronic" text at bottom
+    Uses the same geometry as generate_hedgertronic_logo. The "hedgertronic"
+    wordmark is outlined from DMSans.ttf, so the file needs no web font.
     """
-    from PIL import Image, ImageDraw, ImageFont
+    bg = hex_to_svg(bg_color)
+    body = hex_to_svg(body_color)
+    lens_x, lens_y = LENS_CENTER
+
+    elements = [
+        rounded_rect(MARGIN, MARGIN, SIZE - 2 * MARGIN, SIZE - 2 * MARGIN, CORNER_RADIUS, bg),
+        circle(lens_x, lens_y, LENS_RADIUS, body),
+        circle(lens_x, lens_y, INNER_RADIUS, rgb_to_svg(INNER_COLOR)),
+        circle(lens_x, lens_y, GLASS_RADIUS, rgb_to_svg(GLASS_COLOR)),
+        circle(*HIGHLIGHT_CENTER, HIGHLIGHT_RADIUS, rgb_to_svg(HIGHLIGHT_COLOR)),
+    ]
 
-    output_dir = Path(output_dir)
-    output_dir.mkdir(parents=True, exist_ok=True)
+    if not simplified:
+        elements.append(circle(*INDICATOR_CENTER, INDICATOR_RADIUS, body))
 
-    def hex_to_rgb(hex_color):
-        hex_color = hex_color.lstrip('#')
-        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+        # Match PIL placement: centered by ink width, ascender line at text_y
+        outline = text_outline(LOGO_TEXT, LOGO_FONT_PATH, LOGO_FONT_SIZE)
+        x0, y0, x1, y1 = outline["bbox"]
+        text_x = (SIZE - (x1 - x0)) // 2
+        text_y = SIZE - MARGIN - (y1 - y0) - 20
+        elements.append(path(outline["d"], body, text_x, text_y + outline["ascent"]))
 
-    bg_rgb = hex_to_rgb(bg_color)
-    body_rgb = hex_to_rgb(body_color)
+    return svg_document(SIZE, elements)
 
-    # Create large canvas for quality
-    size = 512
-    img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
 
-    # Rounded rectangle body (Instagram-style rounded corners)
-    margin = 20
-    corner_radius = 90
-    draw.rounded_rectangle(
-        [(margin, margin), (size - margin, size - margin)],
-        radius=corner_radius,
-        fill=(*bg_rgb, 255)
-    )
+@functools.lru_cache(maxsize=None)
+def load_logo_font():
+    """Load the wordmark font once per process (DM Sans, then system fallbacks)."""
+    from PIL import ImageFont
 
-    # Main lens position (same for both versions)
-    lens_radius = 145
-    lens_margin = margin + lens_radius + 30
-    lens_center_x = size - lens_margin
-    lens_center_y = lens_margin
-
-    # Lens outer ring (dark)
-    draw.ellipse(
-        [
-            lens_center_x - lens_radius,
-            lens_center_y - lens_radius,
-            lens_center_x + lens_radius,
-            lens_center_y + lens_radius
-        ],
-        fill=(*body_rgb, 255)
-    )
+    try:
+        # Try to use DM Sans
+        if LOGO_FONT_PATH.exists():
+            return ImageFont.truetype(str(LOGO_FONT_PATH), LOGO_FONT_SIZE)
+        # Fallback to system sans
+        return ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 36)
+    except OSError:
+        return ImageFont.load_default()
 
-    # Lens inner ring
-    inner_radius = 115
-    draw.ellipse(
-        [
-            lens_center_x - inner_radius,
-            lens_center_y - inner_radius,
-            lens_center_x + inner_radius,
-            lens_center_y + inner_radius
-        ],
-        fill=(40, 40, 45, 255)
-    )
 
-    # Lens glass
-    glass_radius = 85
-    draw.ellipse(
-        [
-            lens_center_x - glass_radius,
-            lens_center_y - glass_radius,
-            lens_center_x + glass_radius,
-            lens_center_y + glass_radius
-        ],
-        fill=(25, 25, 30, 255)
-    )
+@functools.lru_cache(maxsize=None)
+def logo_layers(simplified: bool = False) -> tuple:
+    """
+    Rasterize the logo geometry as alpha masks, one per color layer.
+
+    Layers are returned in paint order as (role, mask) pairs. The roles are
+    "bg" and "body" (recolorable), plus "inner", "glass" and "highlight"
+    (fixed lens colors). Results are cached per geometry (in memory and in
+    the shared image cache), so color variants only pay for compositing.
+    """
+    font = LOGO_FONT_PATH if LOGO_FONT_PATH.exists() else None
+    ops = [("logo-layers", LOGO_VERSION, SIZE, simplified)]
+    return image_cache().layers(font, ops, lambda: draw_logo_layers(simplified))
 
-    # Lens highlight/reflection (small bright spot) - on both versions
-    highlight_radius = 20
-    highlight_x = lens_center_x - 30
-    highlight_y = lens_center_y - 35
-    draw.ellipse(
-        [
-            highlight_x - highlight_radius,
-            highlight_y - highlight_radius,
-            highlight_x + highlight_radius,
-            highlight_y + highlight_radius
-        ],
-        fill=(60, 60, 70, 255)
+
+def draw_logo_layers(simplified: bool = False) -> tuple:
+    """Draw the uncached logo layers (see logo_layers)."""
+    from PIL import Image, ImageDraw
+
+    size = SIZE
+    layers = []
+
+    def layer(role):
+        mask = Image.new("L", (size, size), 0)
+        layers.append((role, mask))
+        return ImageDraw.Draw(mask)
+
+    def disc(draw, center, radius):
+        x, y = center
+        draw.ellipse([x - radius, y - radius, x + radius, y + radius], fill=255)
+
+    # Rounded rectangle body (Instagram-style rounded corners)
+    layer("bg").rounded_rectangle(
+        [(MARGIN, MARGIN), (size - MARGIN, size - MARGIN)],
+        radius=CORNER_RADIUS,
+        fill=255
     )
 
+    # Lens outer ring (dark), inner ring, glass, and highlight (same for both versions)
+    disc(layer("body"), LENS_CENTER, LENS_RADIUS)
+    disc(layer("inner"), LENS_CENTER, INNER_RADIUS)
+    disc(layer("glass"), LENS_CENTER, GLASS_RADIUS)
+    disc(layer("highlight"), HIGHLIGHT_CENTER, HIGHLIGHT_RADIUS)
+
     if not simplified:
         # Full version additions: dot and text
+        draw = layer("body")
 
         # Small indicator dot on the left (like the screw on the real camera)
-        indicator_radius = 18
-        indicator_x = margin + 65
-        indicator_y = size // 2 - 60
-        draw.ellipse(
-            [
-                indicator_x - indicator_radius,
-                indicator_y - indicator_radius,
-                indicator_x + indicator_radius,
-                indicator_y + indicator_radius
-            ],
-            fill=(*body_rgb, 255)
-        )
+        disc(draw, INDICATOR_CENTER, INDICATOR_RADIUS)
 
         # "hedgertronic" text at bottom (centered)
-        try:
-            # Try to use DM Sans
-            ttf_path = Path(__file__).parent.parent / "assets/fonts/DMSans.ttf"
-            if ttf_path.exists():
-                font = ImageFont.truetype(str(ttf_path), 42)
-            else:
-                # Fallback to system sans
-                font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 36)
-        except:
-            font = ImageFont.load_default()
-
-        text = "hedgertronic"
-        bbox = draw.textbbox((0, 0), text, font=font)
+        font = load_logo_font()
+        bbox = draw.textbbox((0, 0), LOGO_TEXT, font=font)
         text_width = bbox[2] - bbox[0]
         text_height = bbox[3] - bbox[1]
         text_x = (size - text_width) // 2  # Centered
-        text_y = size - margin - text_height - 20  # Position near bottom, inside rounded rect
-        draw.text((text_x, text_y), text, font=font, fill=(*body_rgb, 255))
+        text_y = size - MARGIN - text_height - 20  # Position near bottom, inside rounded rect
+        draw.text((text_x, text_y), LOGO_TEXT, font=font, fill=255)
 
-    print(f"Created hedgertronic logo ({size}x{size})")
+    return tuple(layers)
 
-    # Generate all favicon sizes
-    png_sizes = {
-        "favicon-16.png": 16,
-        "favicon-32.png": 32,
-        "favicon-180.png": 180,
-        "apple-touch-icon.png": 180,
+
+def render_logo(bg_color: str = "#FFA300", body_color: str = "#0a0a0a", simplified: bool = False):
+    """Composite the cached logo layers in the given colors into a 512x512 RGBA image."""
+    colors = {
+        "bg": hex_to_rgb(bg_color),
+        "body": hex_to_rgb(body_color),
+        "inner": INNER_COLOR,
+        "glass": GLASS_COLOR,
+        "highlight": HIGHLIGHT_COLOR,
     }
+    return composite_layers(logo_layers(simplified), colors)
+
+
+def generate_hedgertronic_logo(output_dir: Path, bg_color: str = "#FFA300", body_color: str = "#0a0a0a", simplified: bool = False, svg: bool = False, verify: bool = False) -> None:
+    """
+    Generate hedgertronic camera logo as favicon.
+
+    The design is a simplified front view of the Edgertronic camera:
+    - Rounded square body (like Instagram icon style)
+    - Large circular lens on the right
+    - Small indicator/screw on the left
+    - "hedgertronic" text at bottom
 
-    for filename, sz in png_sizes.items():
-        resized = img.resize((sz, sz), Image.LANCZOS)
-        output_path = output_dir / filename
-        resized.save(output_path, "PNG")
-        print(f"Created {output_path} ({sz}x{sz})")
+    With svg=True, writes the modern SVG-based favicon set instead of the
+    full PNG set. With verify=True, the PNG set's downscale pyramid is
+    checked against direct resizes.
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Create large canvas for quality
+    size = SIZE
+    img = render_logo(bg_color, body_color, simplified)
+
+    print(f"Created hedgertronic logo ({size}x{size})")
 
-    # ICO file
-    img_32 = img.resize((32, 32), Image.LANCZOS)
-    img_16 = img.resize((16, 16), Image.LANCZOS)
-    ico_path = output_dir / "favicon.ico"
-    img_32.save(ico_path, format="ICO", append_images=[img_16])
-    print(f"Created {ico_path} (16x16 + 32x32 embedded)")
+    if svg:
+        write_modern_favicon_set(hedgertronic_logo_svg(bg_color, body_color, simplified), img, output_dir)
+    else:
+        # Generate all favicon sizes
+        export_favicon_set(img, output_dir, verify=verify)
 
     # Also save a large preview version
     preview_path = output_dir / "hedgertronic-logo-preview.png"
@@ -193,6 +232,17 @@ if __name__ == "__main__":
         action="store_true",
         help="Generate simplified version (centered lens only, no text/dot)"
     )
+    parser.add_argument(
+        "--svg",
+        action="store_true",
+        help="Write a modern favicon set built on favicon.svg (requires fonttools unless --simplified)"
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Compare each downscale step with a direct resize (PSNR) and fall back where it is worse"
+    )
 
     args = parser.parse_args()
-    generate_hedgertronic_logo(args.output_dir, args.bg_color, args.text_color, args.simplified)
+    generate_hedgertronic_logo(args.output_dir, args.bg_color, args.text_color, args.simplified, args.svg, args.verify)
+    print(image_cache().summary())
@@ -5,66 +5,359 @@ Generate Open Graph image from site data.
 Uses Playwright to render an HTML template and screenshot it.
 The resulting image matches the site's hero section styling.
 
+Before rendering, each headshot in site.json is cropped to a square at the
+template's display size (1x and 2x) so Chromium never has to decode the
+full-resolution originals. Derivatives are kept by source hash in the
+shared image cache (tools/image_cache.py).
+
+After rendering, the screenshot goes through an encoding stage: an optimized
+truecolor PNG, a palette-quantized PNG, and WebP/AVIF siblings. Each variant
+is checked against a byte budget and a PSNR floor, and the smallest accepted
+PNG becomes og-image.png (the URL crawlers are given). Every variant is listed
+in og-manifest.json.
+
 Usage:
-    pip install playwright
+    pip install playwright pillow
     playwright install chromium
     python generate_og_image.py
 
 Output:
-    assets/images/og-image.png (1200x630)
+    assets/images/og/og-image.png (1200x630)
+    assets/images/og/og-image.webp
+    assets/images/og/og-image.avif
+    assets/images/og/og-manifest.json
 """
 
+import argparse
+import io
 import json
+import math
+import shutil
+import subprocess
+import tempfile
+import time
 from pathlib import Path
 
-def main():
-    # Import here so we get a clear error if not installed
-    from playwright.sync_api import sync_playwright
+from image_cache import ImageCache, image_cache
+from raster_export import psnr
 
-    # Paths
-    root = Path(__file__).parent.parent
-    template_path = Path(__file__).parent / "og-template.html"
-    output_path = root / "assets" / "images" / "og" / "og-image.png"
-    site_json_path = root / "data" / "site.json"
+# Content box of .headshot in og-template.html (160px minus the 4px border)
+HEADSHOT_DISPLAY_SIZE = 152
+HEADSHOT_SCALES = (1, 2)
 
-    # Load site data
-    with open(site_json_path, "r") as f:
-        site_data = json.load(f)
+# Encoding thresholds for the rendered card
+BYTE_BUDGET = 300_000
+MIN_PSNR = 38.0
+
+
+def prepare_headshot(source: Path, cache: ImageCache = None) -> dict[int, Path]:
+    """
+    Center-crop a headshot to a square at the template's display size.
+
+    One derivative is stored per scale in HEADSHOT_SCALES, as PNG in the
+    shared image cache so Chromium can load it by file:// URL. Entries are
+    keyed by the source hash, so an unchanged photo is never decoded again.
+
+    Args:
+        source: Path to the original headshot
+        cache: Image cache to use (default: the shared one)
+
+    Returns:
+        Mapping of scale factor to derivative path
+    """
+    cache = cache or image_cache()
+    keys = {
+        scale: cache.key(source, [("square",), ("resize", HEADSHOT_DISPLAY_SIZE * scale)])
+        for scale in HEADSHOT_SCALES
+    }
+    outputs = {scale: cache.lookup(key, "PNG") for scale, key in keys.items()}
+    if all(outputs.values()):
+        return outputs
+
+    from PIL import Image
+
+    largest = HEADSHOT_DISPLAY_SIZE * max(HEADSHOT_SCALES)
+
+    with Image.open(source) as img:
+        # Let the JPEG decoder downscale by 1/2, 1/4 or 1/8 (no-op for PNG)
+        img.draft("RGB", (largest, largest))
+        img = img.convert("RGBA" if "A" in img.getbands() else "RGB")
+
+    # Same framing as object-fit: cover on a square box
+    size = min(img.size)
+    left = (img.size[0] - size) // 2
+    top = (img.size[1] - size) // 2
+    img = img.crop((left, top, left + size, top + size))
+
+    for scale, key in keys.items():
+        px = HEADSHOT_DISPLAY_SIZE * scale
+        outputs[scale] = cache.store(key, img.resize((px, px), Image.LANCZOS), "PNG")
+
+    return outputs
+
+
+def prepare_headshots(profile: dict, root: Path) -> dict[str, dict[int, Path]]:
+    """
+    Build display-size derivatives for every headshot in the profile.
+
+    Covers each entry in profile.headshots plus profile.headshot.
+
+    Returns:
+        Mapping of site.json headshot path to its derivatives by scale
+    """
+    sources = set(profile.get("headshots", {}).values())
+    sources.add(profile["headshot"])
+
+    derivatives = {}
+    for rel in sorted(sources):
+        source = root / rel.split("?")[0].lstrip("/")
+        derivatives[rel] = prepare_headshot(source)
+        print(f"Prepared headshot: {rel}")
+
+    return derivatives
+
+
+def optimize_png_bytes(data: bytes) -> bytes:
+    """Run oxipng over PNG bytes if it is installed, otherwise return them unchanged."""
+    oxipng = shutil.which("oxipng")
+    if not oxipng:
+        return data
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "image.png"
+        path.write_bytes(data)
+        subprocess.run([oxipng, "-o", "4", "--strip", "safe", "-q", str(path)], check=True)
+        return path.read_bytes()
+
+
+def encode_variants(screenshot: bytes) -> list[dict]:
+    """
+    Encode a rendered PNG screenshot into every candidate output format.
+
+    Returns:
+        One dict per variant with its name, format, bytes and encode time (ms)
+    """
+    from PIL import Image, features
+
+    img = Image.open(io.BytesIO(screenshot)).convert("RGB")
+
+    def png_truecolor():
+        buf = io.BytesIO()
+        img.save(buf, "PNG", optimize=True)
+        return optimize_png_bytes(buf.getvalue())
+
+    def png_palette():
+        buf = io.BytesIO()
+        quantized = img.quantize(colors=256, method=Image.Quantize.MEDIANCUT, dither=Image.Dither.FLOYDSTEINBERG)
+        quantized.save(buf, "PNG", optimize=True)
+        return optimize_png_bytes(buf.getvalue())
+
+    def webp():
+        buf = io.BytesIO()
+        img.save(buf, "WEBP", quality=90, method=6)
+        return buf.getvalue()
 
-    profile = site_data["profile"]
-    name = profile["name"]
-    bio = profile["bio"]
-    # Convert headshot path to absolute file:// URL
-    headshot_rel = profile["headshot"].lstrip("/")
-    headshot_abs = (root / headshot_rel).resolve()
+    def avif():
+        buf = io.BytesIO()
+        img.save(buf, "AVIF", quality=80, speed=4)
+        return buf.getvalue()
+
+    encoders = [
+        ("png-truecolor", "png", png_truecolor),
+        ("png-palette", "png", png_palette),
+    ]
+    if features.check("webp"):
+        encoders.append(("webp", "webp", webp))
+    if features.check("avif"):
+        encoders.append(("avif", "avif", avif))
+
+    variants = []
+    for name, fmt, encode in encoders:
+        start = time.perf_counter()
+        data = encode()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        variants.append({"name": name, "format": fmt, "data": data, "encode_ms": elapsed_ms})
+
+    return variants
+
+
+def write_og_outputs(screenshot: bytes, output_path: Path, byte_budget: int = BYTE_BUDGET,
+                     min_psnr: float = MIN_PSNR) -> None:
+    """
+    Encode, check and write the OG image variants plus their manifest.
+
+    Each variant is decoded again and compared against the screenshot. A variant
+    is accepted if it fits the byte budget and meets the PSNR floor. The
+    smallest accepted PNG is written to output_path; the smallest accepted file
+    of each other format is written alongside it with that format's suffix,
+    and a format with no accepted variant has its old file removed.
+    Encode times are printed but kept out of the manifest so reruns on the same
+    input produce identical files.
+
+    Args:
+        screenshot: Raw PNG bytes from the Playwright screenshot
+        output_path: Canonical PNG path (e.g. assets/images/og/og-image.png)
+        byte_budget: Maximum accepted size in bytes
+        min_psnr: Minimum accepted PSNR in dB against the screenshot
+    """
+    from PIL import Image
+
+    reference = Image.open(io.BytesIO(screenshot)).convert("RGB")
+    variants = encode_variants(screenshot)
+
+    for variant in variants:
+        decoded = Image.open(io.BytesIO(variant["data"])).convert("RGB")
+        variant["psnr"] = psnr(reference, decoded)
+        variant["bytes"] = len(variant["data"])
+        variant["accepted"] = variant["bytes"] <= byte_budget and variant["psnr"] >= min_psnr
+
+    print(f"\n{'Variant':<16}{'Bytes':>10}{'Encode':>10}{'PSNR':>9}  Status")
+    print(f"{'(screenshot)':<16}{len(screenshot):>10,}")
+    for v in variants:
+        status = "ok" if v["accepted"] else "rejected"
+        print(f"{v['name']:<16}{v['bytes']:>10,}{v['encode_ms']:>8.0f}ms{v['psnr']:>7.1f}dB  {status}")
+
+    # Best accepted variant per format; the truecolor PNG is always a lossless fallback
+    chosen = {}
+    for v in sorted(variants, key=lambda v: v["bytes"]):
+        if v["accepted"] and v["format"] not in chosen:
+            chosen[v["format"]] = v
+    if "png" not in chosen:
+        chosen["png"] = next(v for v in variants if v["name"] == "png-truecolor")
+        print(f"Warning: no PNG variant met the thresholds, falling back to {chosen['png']['name']}")
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    files = {}
+    for fmt, v in chosen.items():
+        path = output_path.with_suffix(f".{fmt}")
+        path.write_bytes(v["data"])
+        files[fmt] = path.name
+        print(f"Wrote {path} ({v['name']}, {v['bytes']:,} bytes)")
+
+    # A format with no accepted variant this time must not leave an old file behind
+    for fmt in sorted({v["format"] for v in variants} - set(chosen)):
+        stale = output_path.with_suffix(f".{fmt}")
+        if stale.exists():
+            stale.unlink()
+            print(f"Removed {stale} (no {fmt} variant met the thresholds)")
+
+    manifest = {
+        "canonical": output_path.name,
+        "source_bytes": len(screenshot),
+        "byte_budget": byte_budget,
+        "min_psnr": min_psnr,
+        "files": files,
+        "variants": [
+            {
+                "name": v["name"],
+                "format": v["format"],
+                "bytes": v["bytes"],
+                "psnr": None if math.isinf(v["psnr"]) else round(v["psnr"], 2),
+                "accepted": v["accepted"],
+                "selected": chosen.get(v["format"]) is v,
+            }
+            for v in variants
+        ],
+    }
+    manifest_path = output_path.parent / "og-manifest.json"
+    with open(manifest_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+        f.write("\n")
+    print(f"Wrote {manifest_path}")
+
+
+def populate_template(template_path: Path, profile: dict, root: Path) -> str:
+    """Fill the OG template with the profile's name, bio and pre-sized headshot."""
+    # Point the template at the pre-sized derivatives, not the original
+    headshot = prepare_headshots(profile, root)[profile["headshot"]]
+    headshot_1x = headshot[1].resolve()
+    headshot_2x = headshot[2].resolve()
 
     # Read and populate template
     with open(template_path, "r") as f:
         html = f.read()
 
-    html = html.replace("{{NAME}}", name)
-    html = html.replace("{{BIO}}", bio)
-    html = html.replace("{{HEADSHOT}}", f"file://{headshot_abs}")
+    html = html.replace("{{NAME}}", profile["name"])
+    html = html.replace("{{BIO}}", profile["bio"])
+    html = html.replace("{{HEADSHOT}}", f"file://{headshot_1x}")
+    html = html.replace("{{HEADSHOT_2X}}", f"file://{headshot_2x}")
+    return html
+
 
+def render_screenshot(html: str, page=None, settle_ms: int = 500) -> bytes:
+    """
+    Render the populated template in headless Chromium and return a 1200x630 PNG screenshot.
+
+    Args:
+        html: Populated template
+        page: Open 1200x630 Playwright page to reuse (default: launch a browser)
+        settle_ms: Extra wait after fonts report ready
+    """
     # Write temporary HTML file (Playwright needs a file to load fonts properly)
     temp_html = Path(__file__).parent / "og-temp.html"
     with open(temp_html, "w") as f:
         f.write(html)
 
     # Generate screenshot
-    with sync_playwright() as p:
-        browser = p.chromium.launch()
-        page = browser.new_page(viewport={"width": 1200, "height": 630})
-        page.goto(f"file://{temp_html.resolve()}")
-        # Wait for fonts to load
-        page.wait_for_timeout(500)
-        page.screenshot(path=str(output_path))
-        browser.close()
-
-    # Clean up temp file
-    temp_html.unlink()
-
-    print(f"Generated: {output_path}")
+    try:
+        if page is not None:
+            return screenshot_page(page, temp_html, settle_ms)
+
+        # Import here so we get a clear error if not installed
+        from playwright.sync_api import sync_playwright
+
+        with sync_playwright() as p:
+            browser = p.chromium.launch()
+            page = browser.new_page(viewport={"width": 1200, "height": 630})
+            screenshot = screenshot_page(page, temp_html, settle_ms)
+            browser.close()
+    finally:
+        # Clean up temp file
+        temp_html.unlink()
+
+    return screenshot
+
+
+def screenshot_page(page, html_path: Path, settle_ms: int = 500) -> bytes:
+    """Load an HTML file in a page, wait for its images and fonts, and screenshot it."""
+    # goto() returns after the load event, so images are decoded
+    page.goto(f"file://{html_path.resolve()}")
+    page.evaluate("() => document.fonts.ready.then(() => null)")
+    if settle_ms:
+        page.wait_for_timeout(settle_ms)
+    return page.screenshot()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the Open Graph image from site data")
+    parser.add_argument(
+        "--max-bytes",
+        type=int,
+        default=BYTE_BUDGET,
+        help=f"Byte budget for each encoded variant (default: {BYTE_BUDGET})"
+    )
+    parser.add_argument(
+        "--min-psnr",
+        type=float,
+        default=MIN_PSNR,
+        help=f"Minimum PSNR in dB against the raw screenshot (default: {MIN_PSNR})"
+    )
+    args = parser.parse_args()
+
+    # Paths
+    root = Path(__file__).parent.parent
+    template_path = Path(__file__).parent / "og-template.html"
+    output_path = root / "assets" / "images" / "og" / "og-image.png"
+    site_json_path = root / "data" / "site.json"
+
+    # Load site data
+    with open(site_json_path, "r") as f:
+        site_data = json.load(f)
+
+    html = populate_template(template_path, site_data["profile"], root)
+    screenshot = render_screenshot(html)
+    write_og_outputs(screenshot, output_path, args.max_bytes, args.min_psnr)
+    print(image_cache().summary())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Generate low-quality image placeholders for the site's images.
+
+Images referenced from data/site.json and the other data files (headshots,
+training posters) pop in late and shift the layout on slow connections.
+For each one this script records in data/placeholders.json:
+
+- intrinsic width/height, so the page can reserve the image's box
+- dominant color, painted first
+- a tiny (PREVIEW_SIZE px) WebP preview as a base64 data URI, which the
+  browser scales up behind the image until the real file arrives
+
+script.js (and tools/prerender_site.py for the prerendered page) set the
+width/height attributes and a background of color + preview on every image
+with an entry, and clear the background once the image loads. script.js
+reads the manifest from the site bundle (tools/bundle_site_data.py) and never
+fetches it on its own, so it adds no request before first paint.
+
+Images are processed on a process pool. An entry whose source hash (plus
+the preview settings) is unchanged is kept without decoding the image again,
+and entries for images that are no longer referenced are dropped.
+
+Usage:
+    python tools/generate_placeholders.py
+    python tools/generate_placeholders.py --all      # every photo under assets/images
+    python tools/generate_placeholders.py --force -j 4
+"""
+
+import argparse
+import base64
+import gzip
+import hashlib
+import io
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from generate_responsive_images import IMAGE_REF, IMAGES_DIR, dominant_color, is_photo, site_url
+
+PROJECT_ROOT = Path(__file__).parent.parent
+MANIFEST_PATH = PROJECT_ROOT / "data" / "placeholders.json"
+
+# Files whose image references get placeholders
+DATA_GLOBS = ["data/site.json", "data/*.json"]
+
+# Generated data files that list every asset rather than what the page shows
+SKIP_FILES = {"asset-manifest.json", "image-manifest.json", MANIFEST_PATH.name}
+
+# Longest side of the preview in pixels, and its WebP settings
+# (part of the cache key, so changing them regenerates every entry)
+PREVIEW_SIZE = 20
+PREVIEW_OPTIONS = {"quality": 50, "method": 6}
+
+
+def referenced_images() -> list[Path]:
+    """Local photos referenced from the data files, in first-seen order."""
+    found = []
+    for pattern in DATA_GLOBS:
+        for data_file in sorted(PROJECT_ROOT.glob(pattern)):
+            if data_file.name in SKIP_FILES or data_file.name.startswith("site-data."):
+                continue
+            for match in IMAGE_REF.finditer(data_file.read_text(errors="ignore")):
+                path = PROJECT_ROOT / match.group(1)
+                if path not in found and path.exists() and is_photo(path):
+                    found.append(path)
+    return found
+
+
+def source_hash(path: Path) -> str:
+    """Hash a source together with the settings that shape its preview."""
+    settings = json.dumps({"size": PREVIEW_SIZE, "options": PREVIEW_OPTIONS}, sort_keys=True).encode()
+    return hashlib.sha256(path.read_bytes() + settings).hexdigest()[:16]
+
+
+def preview_uri(img) -> str:
+    """Downscale to PREVIEW_SIZE on the longest side and encode as a WebP data URI."""
+    from PIL import Image
+
+    width, height = img.size
+    scale = PREVIEW_SIZE / max(width, height)
+    size = (max(1, round(width * scale)), max(1, round(height * scale)))
+    small = img.resize(size, Image.BOX, reducing_gap=2.0)
+
+    buffer = io.BytesIO()
+    small.save(buffer, "WEBP", **PREVIEW_OPTIONS)
+    return "data:image/webp;base64," + base64.b64encode(buffer.getvalue()).decode("ascii")
+
+
+def process_image(source: Path) -> dict:
+    """
+    Build the placeholder entry for one image.
+
+    Args:
+        source: Image under assets/images
+
+    Returns:
+        Manifest entry (width, height, color, preview)
+    """
+    from PIL import Image, ImageOps
+
+    with Image.open(source) as original:
+        width, height = original.size
+        if original.getexif().get(0x0112, 1) in (5, 6, 7, 8):
+            width, height = height, width
+
+        # JPEGs decode at a fraction of full size; the preview only needs a few pixels
+        original.draft("RGB", (PREVIEW_SIZE * 8, PREVIEW_SIZE * 8))
+        img = ImageOps.exif_transpose(original)
+        has_alpha = img.mode in ("RGBA", "LA", "PA") or (img.mode == "P" and "transparency" in img.info)
+        img = img.convert("RGBA" if has_alpha else "RGB")
+
+    return {
+        "width": width,
+        "height": height,
+        "color": dominant_color(img),
+        "preview": preview_uri(img),
+    }
+
+
+def _worker(source: Path) -> tuple[dict, float]:
+    """Process one image in a worker process and return (entry, wall time)."""
+    start = time.perf_counter()
+    entry = process_image(source)
+    return entry, time.perf_counter() - start
+
+
+def generate_placeholders(include_all: bool = False, workers: int = None, force: bool = False) -> None:
+    """
+    Build placeholders for every referenced image (or every photo) and write the manifest.
+
+    Args:
+        include_all: Process every photo under assets/images, not just referenced ones
+        workers: Process pool size (default: one per CPU)
+        force: Regenerate even if the source is unchanged
+    """
+    if include_all:
+        sources = sorted(p for p in IMAGES_DIR.rglob("*") if p.is_file() and is_photo(p))
+    else:
+        sources = referenced_images()
+
+    previous = {}
+    if MANIFEST_PATH.exists():
+        with open(MANIFEST_PATH, "r") as f:
+            previous = json.load(f)
+
+    manifest = {}
+    pending = {}
+    for source in sources:
+        url = site_url(source)
+        digest = source_hash(source)
+        cached = previous.get(url)
+        if cached and cached.get("hash") == digest and not force:
+            manifest[url] = cached
+        else:
+            pending[url] = (source, digest)
+
+    start = time.perf_counter()
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+            futures = {pool.submit(_worker, source): url for url, (source, _) in pending.items()}
+            for future in as_completed(futures):
+                url = futures[future]
+                entry, elapsed = future.result()
+                manifest[url] = {"hash": pending[url][1], **entry}
+                print(f"{url:<55} {elapsed * 1000:>6.0f}ms  {entry['width']}x{entry['height']} {entry['color']}")
+
+    for url in sorted(set(previous) - set(manifest)):
+        print(f"{url:<55} no longer referenced, removed")
+
+    manifest = dict(sorted(manifest.items()))
+    text = json.dumps(manifest, indent=2) + "\n"
+    if not MANIFEST_PATH.exists() or MANIFEST_PATH.read_text() != text:
+        MANIFEST_PATH.write_text(text)
+
+    elapsed = time.perf_counter() - start
+    preview_bytes = sum(len(entry["preview"]) for entry in manifest.values())
+    data = text.encode()
+    print(f"\nProcessed {len(pending)} of {len(sources)} images in {elapsed:.2f}s "
+          f"({len(sources) - len(pending)} unchanged)")
+    print(f"Previews: {preview_bytes:,} bytes as data URIs "
+          f"({preview_bytes // max(len(manifest), 1):,} per image)")
+    print(f"Manifest: {MANIFEST_PATH} ({len(data):,} bytes, {len(gzip.compress(data, 9, mtime=0)):,} gzipped)")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate blurred previews, dominant colors and sizes for site images",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument("--all", action="store_true", help="Process every photo under assets/images")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="Regenerate even if sources are unchanged")
+    args = parser.parse_args()
+
+    generate_placeholders(args.all, args.workers, args.force)
+
+
+if __name__ == "__main__":
+    main()
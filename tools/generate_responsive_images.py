@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+Generate responsive AVIF/WebP/JPEG variants for the site's photos.
+
+Each image referenced by the pages (index.html, resume/index.html and the
+data files they load) is resized to every width in WIDTHS that it can fill
+and encoded as AVIF, WebP and a JPEG fallback (PNG for images with
+transparency). Variants go to assets/images/responsive/, mirroring the
+source folders, and data/image-manifest.json records for every source:
+
+- intrinsic width/height and dominant color (for placeholders and to
+  reserve layout space)
+- a ready-to-use srcset string per format (URLs carry the source hash as
+  ?v=, since a variant keeps its file name when the source changes)
+- every variant's URL, size and byte count
+
+The pages don't fetch this file: tools/bundle_site_data.py copies just the
+srcsets into the site bundle, where script.js (showResponsive()) and
+tools/prerender_site.py read them.
+
+Sources are processed in parallel. A source whose content hash (plus the
+encoder settings) matches the manifest, and whose variants still exist, is
+skipped. Icons and generated images (favicons, logos, OG image) are left
+alone.
+
+The report at the end sums, per page, the bytes of the original images
+versus the variant a phone would pick (--report-width, default 750px, about
+a 375pt screen at 2x).
+
+Usage:
+    uv run --with pillow tools/generate_responsive_images.py
+    uv run --with pillow tools/generate_responsive_images.py --all      # every photo under assets/images
+    uv run --with pillow tools/generate_responsive_images.py --force -j 4
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+IMAGES_DIR = PROJECT_ROOT / "assets" / "images"
+OUTPUT_DIR = IMAGES_DIR / "responsive"
+MANIFEST_PATH = PROJECT_ROOT / "data" / "image-manifest.json"
+
+# Target widths in pixels; each source gets the widths below its own width
+# plus its own width (capped at the largest entry)
+WIDTHS = (320, 640, 960, 1280, 1920)
+
+# Encoder settings (part of the cache key, so changing them re-encodes)
+ENCODE_OPTIONS = {
+    "avif": {"quality": 55, "speed": 6},
+    "webp": {"quality": 80, "method": 6},
+    "jpeg": {"quality": 82, "optimize": True, "progressive": True},
+    "png": {"optimize": True},
+}
+
+# Raster formats we know how to resize
+SOURCE_SUFFIXES = {".jpg", ".jpeg", ".png", ".webp", ".avif"}
+
+# Icons and generated artwork that must keep their exact files
+SKIP_DIRS = {"favicons", "logos", "og", "responsive"}
+
+# Pages and the files whose image references they load
+PAGES = {
+    "index.html": ["index.html", "script.js", "styles.css", "data/site.json", "data/*.json"],
+    "resume/index.html": ["resume/index.html", "resume/*.js", "resume/*.css", "data/resume.json"],
+}
+
+# Generated data files that list every asset rather than what a page shows
+SKIP_FILES = {"asset-manifest.json", "placeholders.json", MANIFEST_PATH.name}
+
+IMAGE_REF = re.compile(r"/?(assets/images/[\w./-]+\.(?:jpe?g|png|webp|avif))", re.IGNORECASE)
+
+DEFAULT_REPORT_WIDTH = 750
+
+
+def site_url(path: Path) -> str:
+    """Convert a project path to a root-relative URL."""
+    return "/" + path.relative_to(PROJECT_ROOT).as_posix()
+
+
+def is_photo(path: Path) -> bool:
+    """Whether a file under assets/images is a source photo this pipeline handles."""
+    rel = path.relative_to(IMAGES_DIR)
+    return path.suffix.lower() in SOURCE_SUFFIXES and rel.parts[0] not in SKIP_DIRS
+
+
+def page_references() -> dict[str, list[Path]]:
+    """
+    Find the images each page loads.
+
+    Returns:
+        Mapping of page name to existing image paths, in first-seen order
+    """
+    pages = {}
+    for page, patterns in PAGES.items():
+        found = []
+        for pattern in patterns:
+            for text_file in sorted(PROJECT_ROOT.glob(pattern)):
+                if text_file.name in SKIP_FILES or text_file.name.startswith("site-data."):
+                    continue
+                for match in IMAGE_REF.finditer(text_file.read_text(errors="ignore")):
+                    path = PROJECT_ROOT / match.group(1)
+                    if path not in found and path.exists() and is_photo(path):
+                        found.append(path)
+        pages[page] = found
+    return pages
+
+
+def target_widths(source_width: int) -> list[int]:
+    """Widths to generate for a source, smallest first; never upscales."""
+    widths = [w for w in WIDTHS if w < source_width]
+    widths.append(min(source_width, WIDTHS[-1]))
+    return sorted(set(widths))
+
+
+def source_hash(path: Path) -> str:
+    """Hash a source together with the settings that shape its variants."""
+    settings = json.dumps({"widths": WIDTHS, "options": ENCODE_OPTIONS}, sort_keys=True).encode()
+    return hashlib.sha256(path.read_bytes() + settings).hexdigest()[:16]
+
+
+def dominant_color(img) -> str:
+    """Most common color after reducing the image to a five-color palette."""
+    from PIL import Image
+
+    small = img.convert("RGB").resize((64, 64), Image.BILINEAR)
+    palette_img = small.quantize(colors=5, method=Image.Quantize.MEDIANCUT)
+    count, index = max(palette_img.getcolors())
+    r, g, b = palette_img.getpalette()[index * 3:index * 3 + 3]
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+def encode(img, fmt: str, icc_profile: bytes | None) -> bytes:
+    """Encode one variant with the shared settings."""
+    options = dict(ENCODE_OPTIONS[fmt])
+    if icc_profile:
+        options["icc_profile"] = icc_profile
+    buffer = io.BytesIO()
+    img.save(buffer, fmt.upper(), **options)
+    return buffer.getvalue()
+
+
+def process_image(source: Path, output_dir: Path = OUTPUT_DIR) -> dict:
+    """
+    Write every width/format variant of one source image.
+
+    Args:
+        source: Image under assets/images
+        output_dir: Root of the variant tree
+
+    Returns:
+        Manifest entry (size, color, fallback format, variants)
+    """
+    from PIL import Image, ImageOps
+
+    with Image.open(source) as original:
+        icc_profile = original.info.get("icc_profile")
+        img = ImageOps.exif_transpose(original)
+        has_alpha = img.mode in ("RGBA", "LA", "PA") or (img.mode == "P" and "transparency" in img.info)
+        img = img.convert("RGBA" if has_alpha else "RGB")
+
+    # Drop an alpha channel that is fully opaque so photos get JPEG fallbacks
+    if has_alpha and img.getchannel("A").getextrema() == (255, 255):
+        img = img.convert("RGB")
+        has_alpha = False
+
+    fallback = "png" if has_alpha else "jpeg"
+    formats = ("avif", "webp", fallback)
+    rel = source.relative_to(IMAGES_DIR)
+    variant_dir = output_dir / rel.parent
+    variant_dir.mkdir(parents=True, exist_ok=True)
+
+    width, height = img.size
+    variants = {fmt: [] for fmt in formats}
+    for target in target_widths(width):
+        target_height = round(height * target / width)
+        resized = img if target == width else img.resize((target, target_height), Image.LANCZOS, reducing_gap=3.0)
+        for fmt in formats:
+            data = encode(resized, fmt, icc_profile)
+            ext = "jpg" if fmt == "jpeg" else fmt
+            path = variant_dir / f"{source.stem}-{target}.{ext}"
+            path.write_bytes(data)
+            variants[fmt].append({
+                "width": target,
+                "height": target_height,
+                "src": site_url(path),
+                "bytes": len(data),
+            })
+
+    return {
+        "width": width,
+        "height": height,
+        "color": dominant_color(img),
+        "fallback": fallback,
+        "bytes": source.stat().st_size,
+        "variants": variants,
+    }
+
+
+def srcsets(variants: dict, version: str) -> dict:
+    """srcset string per format, each URL fingerprinted with the source hash."""
+    return {
+        fmt: ", ".join(f"{v['src']}?v={version} {v['width']}w" for v in entries)
+        for fmt, entries in variants.items()
+    }
+
+
+def _worker(source: Path) -> tuple[dict, float]:
+    """Process one image in a worker process and return (entry, wall time)."""
+    start = time.perf_counter()
+    entry = process_image(source)
+    return entry, time.perf_counter() - start
+
+
+def variants_exist(entry: dict) -> bool:
+    """Whether every file a manifest entry points to is still on disk."""
+    return all(
+        (PROJECT_ROOT / v["src"].lstrip("/")).exists()
+        for entries in entry.get("variants", {}).values()
+        for v in entries
+    )
+
+
+def pick_variant(entries: list[dict], width: int) -> dict:
+    """The variant a browser would choose for a slot `width` pixels wide."""
+    for entry in entries:
+        if entry["width"] >= width:
+            return entry
+    return entries[-1]
+
+
+def report(manifest: dict, pages: dict[str, list[Path]], width: int) -> None:
+    """Print original vs. responsive bytes per page for a phone-sized slot."""
+    print(f"\nPer-page image bytes at {width}px (original -> variant a phone downloads):")
+    print(f"  {'Page':<20} {'Images':>6} {'Original':>12} {'AVIF':>12} {'WebP':>12} {'Fallback':>12}")
+    for page, paths in pages.items():
+        entries = [manifest[site_url(path)] for path in paths if site_url(path) in manifest]
+        original = sum(e["bytes"] for e in entries)
+
+        cells = []
+        for fmt in ("avif", "webp", None):
+            total = sum(pick_variant(e["variants"][fmt or e["fallback"]], width)["bytes"] for e in entries)
+            share = f" ({total / original:.0%})" if original else ""
+            cells.append(f"{total:,}{share}".rjust(12))
+
+        print(f"  {page:<20} {len(entries):>6} {original:>12,} {' '.join(cells)}")
+
+
+def generate_responsive_images(include_all: bool = False, workers: int = None, force: bool = False,
+                               report_width: int = DEFAULT_REPORT_WIDTH) -> None:
+    """
+    Build variants for every referenced image (or every photo) and write the manifest.
+
+    Args:
+        include_all: Process every photo under assets/images, not just referenced ones
+        workers: Process pool size (default: one per CPU)
+        force: Re-encode even if the source is unchanged
+        report_width: Slot width used for the per-page byte report
+    """
+    pages = page_references()
+    if include_all:
+        sources = sorted(p for p in IMAGES_DIR.rglob("*") if p.is_file() and is_photo(p))
+    else:
+        sources = sorted({path for paths in pages.values() for path in paths})
+
+    previous = {}
+    if MANIFEST_PATH.exists():
+        with open(MANIFEST_PATH, "r") as f:
+            previous = json.load(f)
+
+    manifest = {}
+    pending = {}
+    for source in sources:
+        url = site_url(source)
+        digest = source_hash(source)
+        cached = previous.get(url)
+        if cached and cached.get("hash") == digest and not force and variants_exist(cached):
+            manifest[url] = cached
+            print(f"{url:<55} unchanged, skipped")
+        else:
+            pending[url] = (source, digest)
+
+    total_start = time.perf_counter()
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+            futures = {pool.submit(_worker, source): url for url, (source, _) in pending.items()}
+            for future in as_completed(futures):
+                url = futures[future]
+                entry, elapsed = future.result()
+                digest = pending[url][1]
+                manifest[url] = {"hash": digest, **entry, "srcset": srcsets(entry["variants"], digest[:10])}
+                count = sum(len(v) for v in entry["variants"].values())
+                print(f"{url:<55} {elapsed * 1000:>7.0f}ms  {count} variants")
+
+    # Remove variants whose source is gone or whose widths changed
+    keep = {v["src"] for entry in manifest.values() for entries in entry["variants"].values() for v in entries}
+    if OUTPUT_DIR.exists():
+        for stale in OUTPUT_DIR.rglob("*"):
+            if stale.is_file() and site_url(stale) not in keep:
+                stale.unlink()
+        for folder in sorted(OUTPUT_DIR.rglob("*"), reverse=True):
+            if folder.is_dir() and not any(folder.iterdir()):
+                folder.rmdir()
+
+    manifest = dict(sorted(manifest.items()))
+    MANIFEST_PATH.write_text(json.dumps(manifest, indent=2) + "\n")
+
+    elapsed = time.perf_counter() - total_start
+    print(f"\nProcessed {len(pending)} of {len(sources)} images in {elapsed:.2f}s")
+    print(f"Manifest written to {MANIFEST_PATH}")
+
+    report(manifest, pages, report_width)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate responsive image variants and a srcset manifest",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument("--all", action="store_true", help="Process every photo under assets/images")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="Re-encode even if sources are unchanged")
+    parser.add_argument(
+        "--report-width",
+        type=int,
+        default=DEFAULT_REPORT_WIDTH,
+        help=f"Slot width in pixels for the per-page report (default: {DEFAULT_REPORT_WIDTH})"
+    )
+    args = parser.parse_args()
+
+    generate_responsive_images(args.all, args.workers, args.force, args.report_width)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Generate static SVG sparklines and trend charts from career_stats.csv.
+
+Built from the rows tools/process_stats.py writes, so the page needs no
+charting library to show them. The stats section shows the trend charts of
+the selected category (plus the level charts on the Minors tab) above the
+table and the sparklines in its overview cards, as plain <img> elements
+(renderStatsSection() in script.js and tools/prerender_site.py), sized from
+charts.json in the site bundle:
+
+- spark-<category>-<stat>.svg   120x32 sparkline of the season series
+- trend-<category>-<stat>.svg   320x140 chart with season and value labels
+- levels-<stat>.svg             bar chart of the minor league level totals
+
+for ERA, WHIP and K/9 of every category with at least two seasons. Files go
+to assets/images/charts/ with a charts.json manifest recording each chart's
+data hash, byte size, pixel size and alt text. A chart is rewritten only
+when the rows it plots change, and charts for series that no longer exist
+are removed. SVGs are written compactly (rounded coordinates, no
+whitespace, one <style> block), and their raw and gzipped sizes are
+reported.
+
+Usage:
+    python tools/generate_stat_charts.py
+    python tools/generate_stat_charts.py --force
+"""
+
+import argparse
+import csv
+import gzip
+import hashlib
+import json
+import re
+from html import escape, unescape
+from pathlib import Path
+
+from process_stats import LEVEL_ORDER, OUTPUT_FILE, parse_ip
+
+PROJECT_ROOT = Path(__file__).parent.parent
+CHARTS_DIR = PROJECT_ROOT / "assets" / "images" / "charts"
+MANIFEST_PATH = CHARTS_DIR / "charts.json"
+
+CATEGORIES = ["College", "Summer", "Independent", "Minors"]
+
+# Stat label -> (file slug, value from a career_stats row, decimals)
+STATS = {
+    "ERA": ("era", lambda row: float(row["ERA"]), 2),
+    "WHIP": ("whip", lambda row: float(row["WHIP"]), 2),
+    "K/9": ("k9", lambda row: int(row["SO"]) * 9 / parse_ip(row["IP"]) if parse_ip(row["IP"]) else 0.0, 1),
+}
+
+ACCENT = "#3b82f6"
+MUTED = "#9ca3af"
+GRID = "#4b5563"
+
+# Every site theme has a dark background, so text is always drawn light
+# (an <img> can't see the page's theme or CSS variables)
+STYLE = f"<style>text{{font:9px system-ui,sans-serif;fill:{MUTED}}}.v{{fill:#f3f4f6}}</style>"
+
+# Bump to regenerate every chart when the drawing code changes
+CHART_VERSION = 2
+
+SVG_SIZE = re.compile(r'width="(\d+)" height="(\d+)"')
+SVG_TITLE = re.compile(r"<title>(.*?)</title>")
+
+SPARK_SIZE = (120, 32)
+TREND_SIZE = (320, 140)
+BAR_WIDTH = 320
+BAR_ROW_HEIGHT = 20
+
+
+def num(value: float) -> str:
+    """Compact coordinate: one decimal, no trailing zeros."""
+    text = f"{value:.1f}".rstrip("0").rstrip(".")
+    return "0" if text == "-0" else text
+
+
+def svg(width: int, height: int, title: str, body: str, styled: bool = True) -> str:
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" width="{width}" '
+        f'height="{height}" role="img"><title>{escape(title)}</title>{STYLE if styled else ""}{body}</svg>'
+    )
+
+
+def scale(values: list[float], low: float, high: float) -> list[float]:
+    """Map values onto [high, low] pixel rows (SVG y grows downward)."""
+    lo, hi = min(values), max(values)
+    span = hi - lo or 1.0
+    return [high - (v - lo) / span * (high - low) for v in values]
+
+
+def x_positions(count: int, left: float, right: float) -> list[float]:
+    if count == 1:
+        return [(left + right) / 2]
+    step = (right - left) / (count - 1)
+    return [left + i * step for i in range(count)]
+
+
+def sparkline(label: str, seasons: list[str], values: list[float], decimals: int) -> str:
+    width, height = SPARK_SIZE
+    pad = 3
+    xs = x_positions(len(values), pad, width - pad)
+    ys = scale(values, pad, height - pad)
+    points = " ".join(f"{num(x)},{num(y)}" for x, y in zip(xs, ys))
+    title = f"{label} by season: " + ", ".join(f"{s} {v:.{decimals}f}" for s, v in zip(seasons, values))
+    body = (
+        f'<polyline points="{points}" fill="none" stroke="{ACCENT}" stroke-width="1.5" '
+        f'stroke-linejoin="round" stroke-linecap="round"/>'
+        f'<circle cx="{num(xs[-1])}" cy="{num(ys[-1])}" r="2.5" fill="{ACCENT}"/>'
+    )
+    return svg(width, height, title, body, styled=False)
+
+
+def trend_chart(label: str, seasons: list[str], values: list[float], decimals: int) -> str:
+    width, height = TREND_SIZE
+    left, right, top, bottom = 34, width - 14, 16, height - 20
+    xs = x_positions(len(values), left, right)
+    ys = scale(values, top, bottom)
+    lo, hi = min(values), max(values)
+
+    parts = [
+        # Min/max gridlines with their values
+        f'<path d="M{left} {top}H{right}M{left} {bottom}H{right}" stroke="{GRID}" stroke-dasharray="2 3"/>',
+        f'<text x="{left - 4}" y="{top + 3}" text-anchor="end">{hi:.{decimals}f}</text>',
+        f'<text x="{left - 4}" y="{bottom + 3}" text-anchor="end">{lo:.{decimals}f}</text>',
+        f'<polyline points="{" ".join(f"{num(x)},{num(y)}" for x, y in zip(xs, ys))}" fill="none" '
+        f'stroke="{ACCENT}" stroke-width="2" stroke-linejoin="round"/>',
+    ]
+    for x, y, season, value in zip(xs, ys, seasons, values):
+        parts.append(f'<circle cx="{num(x)}" cy="{num(y)}" r="3" fill="{ACCENT}"/>')
+        parts.append(f'<text class="v" x="{num(x)}" y="{num(y - 6)}" text-anchor="middle">{value:.{decimals}f}</text>')
+        parts.append(f'<text x="{num(x)}" y="{height - 6}" text-anchor="middle">\'{season[-2:]}</text>')
+
+    title = f"{label} by season: " + ", ".join(f"{s} {v:.{decimals}f}" for s, v in zip(seasons, values))
+    return svg(width, height, title, "".join(parts))
+
+
+def level_chart(label: str, levels: list[str], values: list[float], decimals: int) -> str:
+    label_width, value_width = 36, 40
+    height = BAR_ROW_HEIGHT * len(levels) + 4
+    span = max(values) or 1.0
+    bar_space = BAR_WIDTH - label_width - value_width
+
+    parts = []
+    for i, (level, value) in enumerate(zip(levels, values)):
+        y = 2 + i * BAR_ROW_HEIGHT
+        bar = max(1.0, value / span * bar_space)
+        parts.append(f'<text x="{label_width - 6}" y="{y + 13}" text-anchor="end">{escape(level)}</text>')
+        parts.append(f'<rect x="{label_width}" y="{y + 4}" width="{num(bar)}" height="12" rx="2" fill="{ACCENT}"/>')
+        parts.append(f'<text class="v" x="{num(label_width + bar + 4)}" y="{y + 13}">{value:.{decimals}f}</text>')
+
+    title = f"{label} by level: " + ", ".join(f"{lv} {v:.{decimals}f}" for lv, v in zip(levels, values))
+    return svg(BAR_WIDTH, height, title, "".join(parts))
+
+
+def read_rows() -> list[dict]:
+    with open(OUTPUT_FILE, newline='') as f:
+        return list(csv.DictReader(f))
+
+
+def chart_specs(rows: list[dict]) -> dict[str, tuple]:
+    """
+    Every chart to draw, with the rows it depends on.
+
+    Returns:
+        Mapping of file name to (draw function, label, x labels, source rows, stat)
+    """
+    specs = {}
+    for category in CATEGORIES:
+        # Season aggregate rows ("1 team", "3 teams") for this category
+        seasons = [r for r in rows if r["Season"].isdigit() and r["Level"] == category and r["Team"].endswith(("team", "teams"))]
+        if len(seasons) < 2:
+            continue
+        for stat, (slug, _, _) in STATS.items():
+            x_labels = [r["Season"] for r in seasons]
+            specs[f"spark-{category.lower()}-{slug}.svg"] = (sparkline, f"{category} {stat}", x_labels, seasons, stat)
+            specs[f"trend-{category.lower()}-{slug}.svg"] = (trend_chart, f"{category} {stat}", x_labels, seasons, stat)
+
+    # Level totals have an empty Season
+    levels = {r["Level"]: r for r in rows if r["Season"] == "" and r["Level"] in LEVEL_ORDER}
+    level_rows = [levels[level] for level in LEVEL_ORDER if level in levels]
+    if len(level_rows) >= 2:
+        for stat, (slug, _, _) in STATS.items():
+            x_labels = [r["Level"] for r in level_rows]
+            specs[f"levels-{slug}.svg"] = (level_chart, f"Minors {stat}", x_labels, level_rows, stat)
+    return specs
+
+
+def rows_hash(rows: list[dict], stat: str) -> str:
+    payload = json.dumps({"version": CHART_VERSION, "stat": stat, "rows": rows}, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def generate_stat_charts(force: bool = False) -> None:
+    """Draw every chart whose rows changed, prune stale ones and report sizes."""
+    specs = chart_specs(read_rows())
+
+    previous = {}
+    if MANIFEST_PATH.exists() and not force:
+        with open(MANIFEST_PATH, "r") as f:
+            previous = json.load(f)
+
+    CHARTS_DIR.mkdir(parents=True, exist_ok=True)
+    manifest = {}
+    written = 0
+    for name, (draw, label, x_labels, source_rows, stat) in sorted(specs.items()):
+        digest = rows_hash(source_rows, stat)
+        path = CHARTS_DIR / name
+        cached = previous.get(name)
+        if cached and cached["hash"] == digest and path.exists():
+            manifest[name] = cached
+            continue
+
+        _, value, decimals = STATS[stat]
+        chart = draw(label, x_labels, [value(r) for r in source_rows], decimals)
+        data = chart.encode()
+        path.write_bytes(data)
+        written += 1
+        width, height = SVG_SIZE.search(chart).groups()
+        manifest[name] = {
+            "hash": digest,
+            "bytes": len(data),
+            "gzip": len(gzip.compress(data, 9, mtime=0)),
+            "width": int(width),
+            "height": int(height),
+            "alt": unescape(SVG_TITLE.search(chart).group(1)),
+        }
+
+    for stale in CHARTS_DIR.glob("*.svg"):
+        if stale.name not in manifest:
+            stale.unlink()
+            print(f"Removed {stale.name}")
+
+    MANIFEST_PATH.write_text(json.dumps(manifest, indent=2) + "\n")
+
+    print(f"{'Chart':<28} {'Bytes':>7} {'Gzip':>6}")
+    for name, entry in manifest.items():
+        print(f"{name:<28} {entry['bytes']:>7,} {entry['gzip']:>6,}")
+    total = sum(e["bytes"] for e in manifest.values())
+    total_gzip = sum(e["gzip"] for e in manifest.values())
+    print(f"{'Total':<28} {total:>7,} {total_gzip:>6,}")
+    print(f"\nWrote {written} of {len(manifest)} charts to {CHARTS_DIR}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate SVG stat charts from career_stats.csv")
+    parser.add_argument("--force", action="store_true", help="Redraw every chart even if its rows are unchanged")
+    args = parser.parse_args()
+
+    generate_stat_charts(args.force)
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Shared content-addressed cache of decoded and derived images.
+
+The favicon, logo and OG generators keep deriving the same rasters from the
+same inputs: circular headshot composites, square headshot crops for the OG
+card, and the rasterized geometry of the text favicon and the logo. This
+module stores those rasters on disk under tools/.cache/images/ so repeated
+builds (and the worker processes of a batch) load them instead of decoding
+and drawing again.
+
+An entry is keyed by the SHA-256 of its source file (or None for drawings
+with no source file) plus the chain of operations that produced it, e.g.
+("circular", 360) or ("square",), ("resize", 304). Any change to the source
+bytes or to an operation's parameters gives a new key; nothing needs
+invalidating.
+
+Entries are written as uncompressed TIFF by default. It is lossless and
+loads in a few milliseconds, where PNG spends most of its time in zlib.
+Files a browser has to read (the OG headshots) are stored as PNG instead.
+Writes are atomic (temp file + rename), so parallel workers can share the
+directory. A hit refreshes the entry's mtime, and when the directory grows
+past its size limit the least recently used entries are deleted.
+
+Environment:
+    IMAGE_CACHE_DIR   cache directory (default: tools/.cache/images)
+    IMAGE_CACHE_MB    size limit in MB (default: 256)
+
+Usage:
+    python tools/image_cache.py              # entries, size and limit
+    python tools/image_cache.py --trim 64    # evict down to 64 MB
+    python tools/image_cache.py --clear
+"""
+
+import argparse
+import hashlib
+import json
+import os
+from pathlib import Path
+
+DEFAULT_CACHE_DIR = Path(__file__).parent / ".cache" / "images"
+DEFAULT_MAX_MB = 256
+
+# Bump to orphan every entry when the meaning of an operation changes
+CACHE_VERSION = 1
+
+FORMATS = {"TIFF": ".tiff", "PNG": ".png"}
+
+
+class ImageCache:
+    """On-disk LRU of derived rasters keyed by source hash plus operation chain."""
+
+    def __init__(self, directory: Path = None, max_bytes: int = None):
+        self.directory = Path(directory or os.environ.get("IMAGE_CACHE_DIR") or DEFAULT_CACHE_DIR)
+        self.max_bytes = max_bytes or int(os.environ.get("IMAGE_CACHE_MB", DEFAULT_MAX_MB)) * 1024 * 1024
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self._source_hashes = {}
+
+    def source_hash(self, source: Path) -> str:
+        """SHA-256 of a file's bytes, computed once per (path, mtime, size) per process."""
+        stat = source.stat()
+        memo_key = (str(Path(source).resolve()), stat.st_mtime_ns, stat.st_size)
+        if memo_key not in self._source_hashes:
+            self._source_hashes[memo_key] = hashlib.sha256(Path(source).read_bytes()).hexdigest()
+        return self._source_hashes[memo_key]
+
+    def key(self, source: Path | None, ops) -> str:
+        """Cache key for a source file (or None) and its operation chain."""
+        payload = json.dumps({
+            "version": CACHE_VERSION,
+            "source": self.source_hash(source) if source else None,
+            "ops": ops,
+        }, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+    def path(self, key: str, fmt: str = "TIFF") -> Path:
+        return self.directory / f"{key}{FORMATS[fmt]}"
+
+    def lookup(self, key: str, fmt: str = "TIFF") -> Path | None:
+        """Path of a cached entry (refreshing its LRU position), or None on a miss."""
+        path = self.path(key, fmt)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return path
+
+    def store(self, key: str, img, fmt: str = "TIFF", description: str = None) -> Path:
+        """Write an image under a key, then evict old entries if over the limit."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.path(key, fmt)
+        temp = path.with_name(f".{path.name}.{os.getpid()}")
+        options = {"description": description} if description else {}
+        img.save(temp, fmt, **options)
+        os.replace(temp, path)
+        self.writes += 1
+        self.evict()
+        return path
+
+    def image(self, source: Path | None, ops, build, fmt: str = "TIFF"):
+        """
+        Return the cached raster for (source, ops), building and storing it on a miss.
+
+        Args:
+            source: File the raster is derived from, or None
+            ops: JSON-serializable operation chain
+            build: Zero-argument function producing the PIL image on a miss
+            fmt: Storage format ("TIFF" or "PNG")
+        """
+        key = self.key(source, ops)
+        path = self.lookup(key, fmt)
+        if path is not None:
+            return load(path)
+        img = build()
+        self.store(key, img, fmt)
+        return img
+
+    def layers(self, source: Path | None, ops, build) -> tuple:
+        """
+        Cached ((role, "L" mask), ...) layers, stored as one horizontal strip.
+
+        The roles are kept in the TIFF's ImageDescription tag.
+        """
+        from PIL import Image
+
+        key = self.key(source, ops)
+        path = self.lookup(key)
+        if path is not None:
+            strip = load(path)
+            roles = json.loads(strip.tag_v2[270])
+            width = strip.width // len(roles)
+            return tuple(
+                (role, strip.crop((i * width, 0, (i + 1) * width, strip.height)))
+                for i, role in enumerate(roles)
+            )
+
+        layers = build()
+        width, height = layers[0][1].size
+        strip = Image.new("L", (width * len(layers), height))
+        for i, (_, mask) in enumerate(layers):
+            strip.paste(mask, (i * width, 0))
+        self.store(key, strip, description=json.dumps([role for role, _ in layers]))
+        return layers
+
+    def entries(self) -> list[tuple[int, int, Path]]:
+        """(mtime, bytes, path) of every stored entry."""
+        if not self.directory.is_dir():
+            return []
+        found = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and not entry.name.startswith("."):
+                stat = entry.stat()
+                found.append((stat.st_mtime_ns, stat.st_size, Path(entry.path)))
+        return found
+
+    def evict(self, max_bytes: int = None) -> int:
+        """Delete least recently used entries until the cache fits; returns how many went."""
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        entries = sorted(self.entries())
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in entries:
+            if total <= limit:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        self.evictions += removed
+        return removed
+
+    def summary(self) -> str:
+        """One-line hit/miss report for the end of a tool's run."""
+        lookups = self.hits + self.misses
+        rate = f" ({self.hits / lookups:.0%} hits)" if lookups else ""
+        evicted = f", {self.evictions} evicted" if self.evictions else ""
+        return f"Image cache: {self.hits} hits, {self.misses} misses{rate}, {self.writes} written{evicted}"
+
+
+def load(path: Path):
+    """Fully decode a cached file and close it."""
+    from PIL import Image
+
+    with Image.open(path) as img:
+        img.load()
+    return img
+
+
+_shared = None
+
+
+def image_cache() -> ImageCache:
+    """The process-wide cache (configured from the environment on first use)."""
+    global _shared
+    if _shared is None:
+        _shared = ImageCache()
+    return _shared
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Inspect or trim the shared image cache",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument("--trim", type=float, metavar="MB", help="Evict least recently used entries down to MB")
+    parser.add_argument("--clear", action="store_true", help="Delete every entry")
+    args = parser.parse_args()
+
+    cache = image_cache()
+    if args.clear or args.trim is not None:
+        removed = cache.evict(0 if args.clear else int(args.trim * 1024 * 1024))
+        print(f"Removed {removed} entries")
+
+    entries = cache.entries()
+    total = sum(size for _, size, _ in entries)
+    by_format = {}
+    for _, size, path in entries:
+        count, nbytes = by_format.get(path.suffix, (0, 0))
+        by_format[path.suffix] = (count + 1, nbytes + size)
+
+    print(f"{cache.directory}: {len(entries)} entries, {total / 1024 / 1024:.1f} MB "
+          f"of {cache.max_bytes / 1024 / 1024:.0f} MB")
+    for suffix, (count, nbytes) in sorted(by_format.items()):
+        print(f"  {suffix:<6} {count:>5} entries {nbytes / 1024 / 1024:>8.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,724 @@
+#!/usr/bin/env python3
+"""
+Minify styles.css, script.js and resume/script.js and inline critical CSS.
+
+The pages load the hand-written sources as-is: an 86 KB render-blocking
+stylesheet (every rule, comments and indentation included) and two
+unminified scripts. This build stage writes content-hashed minified copies
+to assets/build/ and points the pages at them:
+
+- styles.<hash>.css: rules whose selectors can match something. A selector
+  is kept when every class and id in it appears in the pages' markup, in a
+  string literal of script.js / resume/script.js / the inline scripts, or in
+  data/*.json. Template literals like `${section.id}-icon` keep every class
+  ending in "-icon". Unused @keyframes go too.
+- script.<hash>.js, resume-script.<hash>.js: comments, indentation and
+  optional whitespace removed; strings, template literals and regex
+  literals are copied verbatim, and line breaks are kept wherever automatic
+  semicolon insertion could depend on them.
+
+index.html also gets its critical CSS inlined: the rules that apply to the
+header and hero (from the prerendered markup when present, otherwise the
+class names renderHeader() and renderHero() use), plus base element rules,
+theme variables, @font-face and the keyframes those rules animate with. The
+full stylesheet is then loaded without blocking render (preload + onload,
+with a <noscript> fallback). resume/index.html keeps a normal stylesheet
+link, pointed at the minified file.
+
+Output is deterministic. Minified results are cached in tools/.cache/minify/
+by the hash of their inputs, so unchanged sources are not minified again.
+The report lists bytes before and after (raw and gzipped) and the change in
+render-blocking CSS on the home page.
+
+Usage:
+    python tools/minify_assets.py            # build and point the pages at it (CI)
+    python tools/minify_assets.py --refresh  # rebuild only if the pages already use it
+    python tools/minify_assets.py --remove   # back to the unminified sources
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import re
+from pathlib import Path
+
+from fingerprint_assets import file_version
+
+PROJECT_ROOT = Path(__file__).parent.parent
+BUILD_DIR = PROJECT_ROOT / "assets" / "build"
+CACHE_DIR = Path(__file__).parent / ".cache" / "minify"
+
+STYLES_CSS = PROJECT_ROOT / "styles.css"
+INDEX_HTML = PROJECT_ROOT / "index.html"
+
+# Source script -> minified file name prefix
+SCRIPTS = {
+    "script.js": "script",
+    "resume/script.js": "resume-script",
+}
+
+# Pages, and whether their critical CSS is inlined
+PAGES = {
+    "index.html": True,
+    "resume/index.html": False,
+}
+
+DATA_GLOB = "data/*.json"
+
+# Bump to rebuild everything when the minifiers change
+MINIFY_VERSION = 1
+
+# Throughput used to turn render-blocking bytes into time (about a slow 3G link)
+SLOW_NETWORK_BPS = 1_600_000
+
+CSS_START = "<!-- minified-css:start -->"
+CSS_END = "<!-- minified-css:end -->"
+
+STYLESHEET_LINK = re.compile(r'<link rel="stylesheet" href="(?P<href>[^"]+)"[^>]*>')
+SCRIPT_TAG = re.compile(r'<script src="(?P<src>[^"]+)"(?: data-source="(?P<source>[^"]+)")?></script>')
+
+
+# =============================================================================
+# JavaScript
+# =============================================================================
+
+# Characters after which a regex literal (not division) can start
+REGEX_AFTER = set("(,=:[!&|?{};+-*%<>~^")
+REGEX_AFTER_WORDS = {"return", "typeof", "case", "do", "else", "in", "of", "new", "delete", "void", "throw"}
+
+# A line break can be dropped after these (the statement cannot end there)...
+JOIN_AFTER = set("{([,;:=&|?<>!~*%^")
+# ...or before these (they cannot start a statement)
+JOIN_BEFORE = set(")]},;:.?=&|")
+
+WORD_CHAR = re.compile(r"[\w$]")
+
+
+def scan_string(source: str, i: int) -> int:
+    """Index just past the quoted string starting at i."""
+    quote = source[i]
+    i += 1
+    while source[i] != quote:
+        i += 2 if source[i] == "\\" else 1
+    return i + 1
+
+
+def scan_template(source: str, i: int) -> int:
+    """Index just past the template literal starting at i, including nested ${...} code."""
+    i += 1
+    while source[i] != "`":
+        if source[i] == "\\":
+            i += 2
+        elif source.startswith("${", i):
+            i = scan_code(source, i + 2, until="}")
+        else:
+            i += 1
+    return i + 1
+
+
+def scan_regex(source: str, i: int) -> int:
+    """Index just past the regex literal (and flags) starting at i."""
+    i += 1
+    in_class = False
+    while in_class or source[i] != "/":
+        if source[i] == "\\":
+            i += 1
+        elif source[i] == "[":
+            in_class = True
+        elif source[i] == "]":
+            in_class = False
+        i += 1
+    i += 1
+    while i < len(source) and WORD_CHAR.match(source[i]):
+        i += 1
+    return i
+
+
+def scan_code(source: str, i: int, until: str) -> int:
+    """Index just past the `until` brace that closes the code starting at i."""
+    depth = 0
+    while True:
+        char = source[i]
+        if char in "'\"":
+            i = scan_string(source, i)
+        elif char == "`":
+            i = scan_template(source, i)
+        elif char == "{":
+            depth += 1
+            i += 1
+        elif char == until and depth == 0:
+            return i + 1
+        else:
+            depth -= char == "}"
+            i += 1
+
+
+def js_tokens(source: str):
+    """
+    Yield (kind, text) for a script: "code", "literal" (string, template or
+    regex), "comment" and "space".
+    """
+    i = 0
+    previous = ""  # last significant code text, for regex detection
+    while i < len(source):
+        char = source[i]
+        if char.isspace():
+            end = i
+            while end < len(source) and source[end].isspace():
+                end += 1
+            yield "space", source[i:end]
+        elif source.startswith("//", i):
+            end = source.find("\n", i)
+            end = len(source) if end == -1 else end
+            yield "comment", source[i:end]
+        elif source.startswith("/*", i):
+            end = source.index("*/", i) + 2
+            yield "comment", source[i:end]
+        elif char in "'\"":
+            end = scan_string(source, i)
+            yield "literal", source[i:end]
+        elif char == "`":
+            end = scan_template(source, i)
+            yield "literal", source[i:end]
+        elif char == "/" and (not previous or previous[-1] in REGEX_AFTER or previous in REGEX_AFTER_WORDS):
+            end = scan_regex(source, i)
+            yield "literal", source[i:end]
+        else:
+            end = i + 1
+            if WORD_CHAR.match(char):
+                while end < len(source) and WORD_CHAR.match(source[end]):
+                    end += 1
+            yield "code", source[i:end]
+        if source[i:end].strip() and not source.startswith(("//", "/*"), i):
+            previous = source[i:end]
+        i = end
+
+
+def minify_js(source: str) -> str:
+    """Strip comments and optional whitespace, keeping ASI-relevant line breaks."""
+    out = []
+    pending = None  # whitespace seen since the last token: None, " " or "\n"
+    for kind, text in js_tokens(source):
+        if kind == "comment":
+            pending = pending or " "
+            continue
+        if kind == "space":
+            pending = "\n" if "\n" in text or pending == "\n" else (pending or " ")
+            continue
+
+        if pending and out:
+            last, first = out[-1][-1], text[0]
+            if pending == "\n" and last not in JOIN_AFTER and first not in JOIN_BEFORE:
+                out.append("\n")
+            elif WORD_CHAR.match(last) and WORD_CHAR.match(first):
+                out.append(" ")
+            elif last in "+-" and first in "+-" or last == "/" and first == "/":
+                out.append(" ")
+        out.append(text)
+        pending = None
+    return "".join(out) + "\n"
+
+
+def js_literal_text(source: str) -> tuple[list[str], list[str], list[str]]:
+    """
+    String contents of a script, plus the word fragments glued to ${...}.
+
+    Returns:
+        (literal texts, prefixes before a ${, suffixes after a })
+    """
+    texts, prefixes, suffixes = [], [], []
+    for kind, text in js_tokens(source):
+        if kind != "literal" or text[0] not in "'\"`":
+            continue
+        body = text[1:-1]
+        if text[0] == "`":
+            parts = re.split(r"\$\{(?:[^{}]|\{[^{}]*\})*\}", body)
+            for before, after in zip(parts, parts[1:]):
+                prefixes += re.findall(r"([\w-]*[a-zA-Z][\w-]*)$", before)
+                suffixes += re.findall(r"^([\w-]*[a-zA-Z][\w-]*)", after)
+            body = " ".join(parts)
+        texts.append(body)
+    return texts, prefixes, suffixes
+
+
+# =============================================================================
+# CSS
+# =============================================================================
+
+# At-rules whose blocks hold more rules (the rest hold declarations or frames)
+GROUP_RULES = ("@media", "@supports", "@layer", "@container")
+
+CSS_STRING = re.compile(r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')""")
+CSS_COMMENT_OR_STRING = re.compile(r"""(/\*.*?\*/)|("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')""", re.DOTALL)
+SELECTOR_IGNORED = re.compile(r":(?:not|is|where)\((?:[^()]|\([^()]*\))*\)|\[[^\]]*\]")
+CLASS_NAME = re.compile(r"\.(-?[_a-zA-Z][\w-]*)")
+ID_NAME = re.compile(r"#(-?[_a-zA-Z][\w-]*)")
+ANIMATION = re.compile(r"animation(?:-name)?\s*:([^;}]*)")
+
+
+def strip_css_comments(css: str) -> str:
+    """Remove comments, leaving strings (which may contain "/*") alone."""
+    return CSS_COMMENT_OR_STRING.sub(lambda m: "" if m.group(1) else m.group(2), css)
+
+
+def minify_css_text(css: str) -> str:
+    """Collapse whitespace in a selector, prelude or declaration block."""
+    parts = CSS_STRING.split(css)
+    for i in range(0, len(parts), 2):
+        text = re.sub(r"\s+", " ", parts[i])
+        text = re.sub(r"\s*([{};,>])\s*", r"\1", text)
+        text = re.sub(r"\(\s+", "(", text)
+        text = re.sub(r"\s+\)", ")", text)
+        text = re.sub(r":\s+", ":", text)
+        text = re.sub(r"\s+!important", "!important", text)
+        text = re.sub(r"(?<![\w.])0+\.(\d)", r".\1", text)
+        parts[i] = text.replace(";}", "}")
+    return "".join(parts).strip()
+
+
+def read_block(css: str, i: int) -> int:
+    """Index just past the } matching the { at i."""
+    depth = 0
+    while True:
+        if css[i] in "'\"":
+            i = CSS_STRING.match(css, i).end()
+            continue
+        depth += {"{": 1, "}": -1}.get(css[i], 0)
+        i += 1
+        if depth == 0:
+            return i
+
+
+def parse_css(css: str, i: int = 0, end: int = None) -> list[tuple]:
+    """
+    Parse a stylesheet (without comments) into a rule tree.
+
+    Returns:
+        List of ("rule", selectors, declarations), ("group", prelude, children),
+        ("at", prelude, block) or ("statement", text, None), in source order
+    """
+    end = len(css) if end is None else end
+    items = []
+    while i < end:
+        start = i
+        while i < end and css[i] not in "{;}":
+            i = CSS_STRING.match(css, i).end() if css[i] in "'\"" else i + 1
+        prelude = css[start:i].strip()
+        if i >= end or css[i] == "}":
+            break
+        if css[i] == ";":
+            items.append(("statement", prelude + ";", None))
+            i += 1
+            continue
+
+        close = read_block(css, i)
+        if prelude.startswith(GROUP_RULES):
+            items.append(("group", prelude, parse_css(css, i + 1, close - 1)))
+        elif prelude.startswith("@"):
+            items.append(("at", prelude, css[i + 1:close - 1]))
+        else:
+            items.append(("rule", split_selectors(prelude), css[i + 1:close - 1]))
+        i = close
+    return items
+
+
+def split_selectors(prelude: str) -> list[str]:
+    """Split a selector list on top-level commas."""
+    selectors, depth, start = [], 0, 0
+    for i, char in enumerate(prelude):
+        depth += {"(": 1, "[": 1, ")": -1, "]": -1}.get(char, 0)
+        if char == "," and depth == 0:
+            selectors.append(prelude[start:i].strip())
+            start = i + 1
+    selectors.append(prelude[start:].strip())
+    return selectors
+
+
+def selector_names(selector: str) -> tuple[set[str], set[str]]:
+    """Classes and ids a selector requires (ignoring :not(), :is(), :where() and attributes)."""
+    required = SELECTOR_IGNORED.sub("", selector)
+    return set(CLASS_NAME.findall(required)), set(ID_NAME.findall(required))
+
+
+def animation_names(declarations: str) -> set[str]:
+    names = set()
+    for value in ANIMATION.findall(declarations):
+        for part in value.split(","):
+            names.update(re.findall(r"[-\w]+", part))
+    return names
+
+
+def serialize(items: list[tuple]) -> str:
+    out = []
+    for kind, head, body in items:
+        if kind == "rule":
+            out.append(minify_css_text(",".join(head)) + "{" + minify_css_text(body) + "}")
+        elif kind == "group":
+            inner = serialize(body)
+            if inner:
+                out.append(minify_css_text(head) + "{" + inner + "}")
+        elif kind == "at":
+            out.append(minify_css_text(head) + "{" + minify_css_text(body) + "}")
+        else:
+            out.append(minify_css_text(head))
+    return "".join(out)
+
+
+class Vocabulary:
+    """Class and id names that can occur in the markup, including ${...} wildcards."""
+
+    def __init__(self, words=(), prefixes=(), suffixes=()):
+        self.words = set(words)
+        self.prefixes = tuple(sorted(p for p in prefixes if p))
+        self.suffixes = tuple(sorted(s for s in suffixes if s))
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.words or name.startswith(self.prefixes) or name.endswith(self.suffixes)
+
+    def matches(self, selector: str) -> bool:
+        classes, ids = selector_names(selector)
+        return all(name in self for name in classes | ids)
+
+    def key(self) -> list:
+        return [sorted(self.words), self.prefixes, self.suffixes]
+
+
+def filter_rules(items: list[tuple], keep) -> tuple[list[tuple], int, int]:
+    """
+    Keep rules with at least one selector satisfying keep(), pruning the rest.
+
+    Returns:
+        (kept items, selectors kept, selectors dropped)
+    """
+    kept, n_kept, n_dropped = [], 0, 0
+    for kind, head, body in items:
+        if kind == "rule":
+            selectors = [s for s in head if keep(s)]
+            n_kept += len(selectors)
+            n_dropped += len(head) - len(selectors)
+            if selectors:
+                kept.append((kind, selectors, body))
+        elif kind == "group":
+            children, k, d = filter_rules(body, keep)
+            n_kept, n_dropped = n_kept + k, n_dropped + d
+            if children:
+                kept.append((kind, head, children))
+        else:
+            kept.append((kind, head, body))
+    return kept, n_kept, n_dropped
+
+
+def prune_keyframes(items: list[tuple]) -> list[tuple]:
+    """Drop @keyframes no remaining rule animates with."""
+    used = set()
+
+    def collect(nodes):
+        for kind, _, body in nodes:
+            if kind == "rule":
+                used.update(animation_names(body))
+            elif kind == "group":
+                collect(body)
+
+    def prune(nodes):
+        result = []
+        for kind, head, body in nodes:
+            if kind == "at" and re.match(r"@(-\w+-)?keyframes\s", head):
+                if head.split()[-1] not in used:
+                    continue
+            elif kind == "group":
+                body = prune(body)
+            result.append((kind, head, body))
+        return result
+
+    collect(items)
+    return prune(items)
+
+
+def critical_rules(items: list[tuple], vocabulary: Vocabulary) -> list[tuple]:
+    """
+    Rules that style the header and hero: selectors whose classes and ids are
+    all in `vocabulary` (element-only selectors included), plus @font-face.
+    """
+    kept, _, _ = filter_rules(items, vocabulary.matches)
+    kept = [item for item in kept if item[0] != "at" or item[1].startswith(("@font-face", "@keyframes"))]
+    return prune_keyframes(kept)
+
+
+# =============================================================================
+# Markup vocabulary
+# =============================================================================
+
+HTML_CLASS = re.compile(r'\bclass="([^"]*)"')
+HTML_ID = re.compile(r'\bid="([^"]*)"')
+HTML_SCRIPT = re.compile(r"<script\b[^>]*>(.*?)</script>", re.DOTALL)
+WORD = re.compile(r"-?[_a-zA-Z][\w-]*")
+
+
+def markup_words(html: str) -> set[str]:
+    """Class and id names in HTML markup."""
+    words = set()
+    for value in HTML_CLASS.findall(html) + HTML_ID.findall(html):
+        words.update(value.split())
+    return words
+
+
+def script_vocabulary(sources: list[str]) -> Vocabulary:
+    """Every word in the scripts' string literals, plus ${...} prefixes and suffixes."""
+    words, prefixes, suffixes = set(), [], []
+    for source in sources:
+        texts, before, after = js_literal_text(source)
+        for text in texts:
+            words.update(WORD.findall(text))
+        prefixes += before
+        suffixes += after
+    return Vocabulary(words, prefixes, suffixes)
+
+
+def json_words(value) -> set[str]:
+    if isinstance(value, str):
+        return set(WORD.findall(value))
+    if isinstance(value, dict):
+        return set().union(set(), *(json_words(k) | json_words(v) for k, v in value.items()))
+    if isinstance(value, list):
+        return set().union(set(), *(json_words(v) for v in value))
+    return set()
+
+
+def site_vocabulary() -> Vocabulary:
+    """Names that can appear anywhere on either page."""
+    scripts = [(PROJECT_ROOT / rel).read_text() for rel in SCRIPTS]
+    words = set()
+    for page in PAGES:
+        html = (PROJECT_ROOT / page).read_text()
+        words |= markup_words(html)
+        scripts += HTML_SCRIPT.findall(html)
+    for path in sorted(PROJECT_ROOT.glob(DATA_GLOB)):
+        with open(path, "r") as f:
+            words |= json_words(json.load(f))
+
+    vocabulary = script_vocabulary(scripts)
+    vocabulary.words |= words
+    return vocabulary
+
+
+def function_source(source: str, name: str) -> str:
+    """Text of a top-level `function name(...) {...}` in a script."""
+    match = re.search(rf"^(?:async )?function {name}\(.*?^\}}", source, re.DOTALL | re.MULTILINE)
+    return match.group(0) if match else ""
+
+
+def above_the_fold_vocabulary(html: str) -> Vocabulary:
+    """Names used by the header, hero and page shell of index.html."""
+    script = (PROJECT_ROOT / "script.js").read_text()
+    vocabulary = script_vocabulary([function_source(script, "renderHeader"), function_source(script, "renderHero")])
+
+    body = re.search(r"<body\b.*?</body>", html, re.DOTALL).group(0)
+    body = re.sub(r"<footer\b.*?</footer>", "", body, flags=re.DOTALL)
+    body = re.sub(r'<section id="(?!about")[^"]*".*?</section>', "", body, flags=re.DOTALL)
+    vocabulary.words |= markup_words(body) | {"about", "top"}
+    return vocabulary
+
+
+# =============================================================================
+# Build
+# =============================================================================
+
+def content_hash(*parts) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode() if isinstance(part, str) else json.dumps(part, sort_keys=True).encode())
+        digest.update(b"\0")
+    return digest.hexdigest()[:16]
+
+
+def cached(key: str, suffix: str, build) -> tuple[str, bool]:
+    """Return (text, whether it came from the cache) for a cache key."""
+    path = CACHE_DIR / f"{key}{suffix}"
+    if path.exists():
+        return path.read_text(), True
+    text = build()
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    temp = path.with_suffix(path.suffix + ".tmp")
+    temp.write_text(text)
+    temp.replace(path)
+    return text, False
+
+
+def build_css(css: str, index_html: str) -> tuple[str, str, dict]:
+    """
+    Minified stylesheet and index.html's critical CSS.
+
+    Returns:
+        (full CSS, critical CSS, stats)
+    """
+    site = site_vocabulary()
+    fold = above_the_fold_vocabulary(index_html)
+
+    def build():
+        items = parse_css(strip_css_comments(css))
+        used, kept, dropped = filter_rules(items, site.matches)
+        used = prune_keyframes(used)
+        critical = critical_rules(used, fold)
+        return json.dumps({
+            "full": serialize(used),
+            "critical": serialize(critical),
+            "kept": kept,
+            "dropped": dropped,
+        })
+
+    key = content_hash(MINIFY_VERSION, css, site.key(), fold.key())
+    result, hit = cached(key, ".json", build)
+    result = json.loads(result)
+    return result["full"], result["critical"], {"kept": result["kept"], "dropped": result["dropped"], "cached": hit}
+
+
+def build_script(source: str) -> tuple[str, bool]:
+    return cached(content_hash(MINIFY_VERSION, source), ".js", lambda: minify_js(source))
+
+
+def write_output(prefix: str, suffix: str, text: str) -> str:
+    """Write a content-hashed build file (removing older ones) and return its URL."""
+    data = text.encode()
+    name = f"{prefix}.{hashlib.sha256(data).hexdigest()[:12]}{suffix}"
+    BUILD_DIR.mkdir(parents=True, exist_ok=True)
+    for old in BUILD_DIR.glob(f"{prefix}.*{suffix}"):
+        if old.name != name:
+            old.unlink()
+    path = BUILD_DIR / name
+    if not path.exists():
+        path.write_bytes(data)
+    return "/" + path.relative_to(PROJECT_ROOT).as_posix()
+
+
+def source_path(ref: str, page: str) -> str:
+    """Project-relative path a page's src/href refers to (query string dropped)."""
+    ref = ref.split("?")[0]
+    if ref.startswith("/"):
+        return ref.lstrip("/")
+    return (Path(page).parent / ref).as_posix()
+
+
+def css_block(href: str, critical: str | None) -> str:
+    if critical is None:
+        tag = f'<link rel="stylesheet" href="{href}">'
+    else:
+        tag = (
+            f"<style>{critical}</style>"
+            f'<link rel="preload" href="{href}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">'
+            f'<noscript><link rel="stylesheet" href="{href}"></noscript>'
+        )
+    return f"{CSS_START}{tag}{CSS_END}"
+
+
+def rewrite_page(html: str, page: str, stylesheet: str | None, scripts: dict[str, str], critical: str | None) -> str:
+    """
+    Point a page's stylesheet and scripts at the build files, or back at the
+    sources when `stylesheet` is None.
+    """
+    block = re.compile(re.escape(CSS_START) + r".*?" + re.escape(CSS_END), re.DOTALL)
+    source_link = f'<link rel="stylesheet" href="/styles.css?v={file_version(STYLES_CSS)}">'
+    replacement = css_block(stylesheet, critical) if stylesheet else source_link
+    if block.search(html):
+        html = block.sub(lambda _: replacement, html, count=1)
+    else:
+        html = STYLESHEET_LINK.sub(
+            lambda m: replacement if source_path(m.group("href"), page) == "styles.css" else m.group(0), html
+        )
+
+    def script(match):
+        # data-source keeps the page's original reference, so --remove restores it exactly
+        original = match.group("source") or match.group("src")
+        source = source_path(original, page)
+        if source not in SCRIPTS:
+            return match.group(0)
+        if scripts:
+            return f'<script src="{scripts[source]}" data-source="{original}"></script>'
+        return f'<script src="{original}"></script>'
+
+    return SCRIPT_TAG.sub(script, html)
+
+
+def gz(data: str) -> int:
+    return len(gzip.compress(data.encode(), 9, mtime=0))
+
+
+def minify_assets() -> None:
+    """Build the minified files, rewrite both pages and print the size report."""
+    css = STYLES_CSS.read_text()
+    index_html = INDEX_HTML.read_text()
+    full_css, critical, stats = build_css(css, index_html)
+
+    report = [("styles.css", css, full_css, stats["cached"])]
+    stylesheet = write_output("styles", ".css", full_css)
+
+    scripts = {}
+    for rel, prefix in SCRIPTS.items():
+        source = (PROJECT_ROOT / rel).read_text()
+        minified, hit = build_script(source)
+        scripts[rel] = write_output(prefix, ".js", minified)
+        report.append((rel, source, minified, hit))
+
+    for page, inline_critical in PAGES.items():
+        path = PROJECT_ROOT / page
+        before = path.read_text()
+        after = rewrite_page(before, page, stylesheet, scripts, critical if inline_critical else None)
+        if after != before:
+            path.write_text(after)
+            print(f"Updated {page}")
+
+    print(f"\n{'Asset':<18} {'Before':>8} {'Gzip':>7} {'After':>8} {'Gzip':>7} {'Saved':>6}")
+    for name, before, after, hit in report:
+        print(f"{name:<18} {len(before.encode()):>8,} {gz(before):>7,} {len(after.encode()):>8,} {gz(after):>7,} "
+              f"{1 - len(after.encode()) / len(before.encode()):>6.0%}{'  (cached)' if hit else ''}")
+    print(f"\nCSS selectors: kept {stats['kept']}, removed {stats['dropped']} that match no markup")
+
+    # Before: the whole stylesheet blocks the first paint. After: only the
+    # inlined critical rules do; they travel inside the HTML response.
+    blocking_before, blocking_after = gz(css), gz(critical)
+    saved_ms = (blocking_before - blocking_after) * 8 / SLOW_NETWORK_BPS * 1000
+    print(f"Critical CSS inlined into index.html: {len(critical.encode()):,} bytes ({blocking_after:,} gzipped)")
+    print(f"Render-blocking CSS on index.html: {blocking_before:,} -> {blocking_after:,} bytes gzipped, "
+          f"about {saved_ms:.0f} ms sooner at {SLOW_NETWORK_BPS / 1e6:.1f} Mbps plus one round trip")
+
+
+def uses_build(html: str) -> bool:
+    return CSS_START in html or 'data-source="' in html
+
+
+def remove_build() -> None:
+    """Point the pages back at the sources and delete the build files."""
+    for page in PAGES:
+        path = PROJECT_ROOT / page
+        before = path.read_text()
+        after = rewrite_page(before, page, None, {}, None)
+        if after != before:
+            path.write_text(after)
+            print(f"Updated {page}")
+    if BUILD_DIR.exists():
+        for old in BUILD_DIR.iterdir():
+            old.unlink()
+        BUILD_DIR.rmdir()
+        print(f"Removed {BUILD_DIR}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Minify CSS and JS and inline the home page's critical CSS",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument("--refresh", action="store_true", help="Rebuild only if the pages already use the build")
+    parser.add_argument("--remove", action="store_true", help="Point the pages back at the unminified sources")
+    args = parser.parse_args()
+
+    if args.remove:
+        remove_build()
+    elif args.refresh and not uses_build(INDEX_HTML.read_text()):
+        print("Pages use the unminified sources; nothing to refresh")
+    else:
+        minify_assets()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Precompress text assets into .gz and .br siblings.
+
+Every text asset the site serves (HTML, CSS, JS, data JSON, CSV, SVG) and
+every generated artifact (career_stats.csv, the site-data bundle) gets a
+styles.css.gz / styles.css.br file next to it, so a server can send
+precompressed bytes instead of compressing at request time (tools/dev_server.py
+picks them up automatically).
+
+- gzip uses Zopfli when the `zopfli` module is installed (same format,
+  roughly 5% smaller), otherwise the stdlib at level 9.
+- Brotli uses quality 11 with a large window; it needs the `brotli` module
+  and is skipped with a notice if it is missing.
+- A variant is kept only if it is smaller than the original; otherwise any
+  old sibling is deleted.
+- Files are compressed in parallel. A file whose content hash (plus the
+  codec settings) matches tools/.cache/precompress.json, and whose siblings
+  are still on disk, is skipped.
+- Siblings whose source no longer exists (e.g. an old site-data bundle) are
+  removed.
+
+A table of sizes, ratios and timings is printed at the end.
+
+Usage:
+    python tools/precompress_assets.py
+    python tools/precompress_assets.py --force -j 4
+    python tools/precompress_assets.py --clean    # delete every .gz/.br sibling
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zopfli.gzip
+except ImportError:
+    zopfli = None
+
+PROJECT_ROOT = Path(__file__).parent.parent
+CACHE_PATH = Path(__file__).parent / ".cache" / "precompress.json"
+
+# Text assets and generated artifacts to precompress
+TEXT_GLOBS = [
+    "*.html",
+    "resume/*.html",
+    "*.css",
+    "*.js",
+    "resume/*.css",
+    "resume/*.js",
+    "data/*.json",
+    "assets/documents/*.csv",
+    "assets/build/*.css",
+    "assets/build/*.js",
+    "assets/**/*.svg",
+    "assets/**/*.webmanifest",
+]
+
+# Codec settings (part of the cache key, so changing them recompresses)
+CODEC_SETTINGS = {
+    "gz": {"zopfli": zopfli is not None, "iterations": 15, "level": 9},
+    "br": {"quality": 11, "lgwin": 24},
+}
+
+# Files too small to be worth compressing (one TCP packet either way)
+MIN_BYTES = 256
+
+SIBLING_SUFFIXES = tuple(f".{codec}" for codec in CODEC_SETTINGS)
+
+
+def site_path(path: Path) -> str:
+    """Project-relative POSIX path."""
+    return path.relative_to(PROJECT_ROOT).as_posix()
+
+
+def sibling(path: Path, codec: str) -> Path:
+    """Path of the precompressed sibling, e.g. styles.css -> styles.css.gz."""
+    return path.with_name(f"{path.name}.{codec}")
+
+
+def find_sources() -> list[Path]:
+    """Every text asset matched by TEXT_GLOBS, sorted and deduplicated."""
+    sources = set()
+    for pattern in TEXT_GLOBS:
+        for path in PROJECT_ROOT.glob(pattern):
+            if path.is_file() and path.stat().st_size >= MIN_BYTES:
+                sources.add(path)
+    return sorted(sources)
+
+
+def content_hash(path: Path) -> str:
+    """Hash a file together with the codec settings and which encoders are installed."""
+    settings = json.dumps({"settings": CODEC_SETTINGS, "codecs": available_codecs()}, sort_keys=True).encode()
+    return hashlib.sha256(path.read_bytes() + settings).hexdigest()[:16]
+
+
+def compress(data: bytes, codec: str) -> bytes:
+    """Compress bytes with one codec at maximum effort."""
+    if codec == "br":
+        options = CODEC_SETTINGS["br"]
+        return brotli.compress(data, mode=brotli.MODE_TEXT, quality=options["quality"], lgwin=options["lgwin"])
+    if zopfli is not None:
+        return zopfli.gzip.compress(data, numiterations=CODEC_SETTINGS["gz"]["iterations"])
+    return gzip.compress(data, compresslevel=CODEC_SETTINGS["gz"]["level"], mtime=0)
+
+
+def available_codecs() -> list[str]:
+    """Codecs whose encoder is importable."""
+    return [codec for codec in CODEC_SETTINGS if codec != "br" or brotli is not None]
+
+
+def precompress_file(path: Path, codecs: list[str]) -> dict:
+    """
+    Write the siblings of one file, keeping only those smaller than the original.
+
+    Returns:
+        {"bytes": original size, "<codec>": compressed size or None, "ms": {codec: time}}
+    """
+    data = path.read_bytes()
+    result = {"bytes": len(data), "ms": {}}
+    for codec in codecs:
+        start = time.perf_counter()
+        compressed = compress(data, codec)
+        result["ms"][codec] = (time.perf_counter() - start) * 1000
+
+        target = sibling(path, codec)
+        if len(compressed) < len(data):
+            target.write_bytes(compressed)
+            result[codec] = len(compressed)
+        else:
+            target.unlink(missing_ok=True)
+            result[codec] = None
+    return result
+
+
+def _worker(path: Path, codecs: list[str]) -> dict:
+    """Compress one file in a worker process."""
+    return precompress_file(path, codecs)
+
+
+def siblings_exist(path: Path, entry: dict) -> bool:
+    """Whether every sibling a cache entry says was kept is still on disk."""
+    return all(sibling(path, codec).exists() for codec in CODEC_SETTINGS if entry.get(codec))
+
+
+def remove_orphans(sources: list[Path]) -> int:
+    """Delete .gz/.br files whose source is gone; returns how many were removed."""
+    keep = {sibling(path, codec) for path in sources for codec in CODEC_SETTINGS}
+    removed = 0
+    for pattern in TEXT_GLOBS:
+        for suffix in SIBLING_SUFFIXES:
+            for path in PROJECT_ROOT.glob(pattern + suffix):
+                if path not in keep:
+                    path.unlink()
+                    removed += 1
+    return removed
+
+
+def ratio(size: int | None, original: int) -> str:
+    """Format a compressed size as "bytes (percent of original)", or "-" if not kept."""
+    if size is None:
+        return "-"
+    return f"{size:,} ({size / original:.0%})"
+
+
+def report(results: dict[str, dict], codecs: list[str]) -> None:
+    """Print per-file sizes, ratios and compression times, plus totals."""
+    print(f"\n{'File':<42} {'Original':>10} " + " ".join(f"{codec:>16} {'ms':>6}" for codec in codecs))
+    totals = {"bytes": 0, **{codec: 0 for codec in codecs}}
+    for rel, entry in results.items():
+        cells = []
+        for codec in codecs:
+            ms = entry["ms"].get(codec)
+            cells.append(f"{ratio(entry.get(codec), entry['bytes']):>16} {'cached' if ms is None else f'{ms:.0f}':>6}")
+            # A dropped variant means the original is served
+            totals[codec] += entry.get(codec) or entry["bytes"]
+        totals["bytes"] += entry["bytes"]
+        print(f"{rel:<42} {entry['bytes']:>10,} " + " ".join(cells))
+
+    original = totals["bytes"]
+    print(f"{'Total':<42} {original:>10,} " + " ".join(f"{ratio(totals[codec], original):>16} {'':>6}" for codec in codecs))
+
+
+def precompress_assets(workers: int = None, force: bool = False) -> None:
+    """
+    Precompress every text asset, skipping files unchanged since the last run.
+
+    Args:
+        workers: Process pool size (default: one per CPU)
+        force: Recompress even if a file is unchanged
+    """
+    codecs = available_codecs()
+    if zopfli is None:
+        print("zopfli not installed; using gzip -9 (pip install zopfli for ~5% smaller .gz)")
+    if brotli is None:
+        print("brotli not installed; skipping .br (pip install brotli)")
+
+    sources = find_sources()
+    cache = {}
+    if CACHE_PATH.exists() and not force:
+        with open(CACHE_PATH, "r") as f:
+            cache = json.load(f)
+
+    results = {}
+    pending = {}
+    for path in sources:
+        rel = site_path(path)
+        digest = content_hash(path)
+        cached = cache.get(rel)
+        if cached and cached["hash"] == digest and siblings_exist(path, cached):
+            results[rel] = {**cached, "ms": {}}
+        else:
+            pending[rel] = (path, digest)
+
+    start = time.perf_counter()
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+            futures = {pool.submit(_worker, path, codecs): rel for rel, (path, _) in pending.items()}
+            for future in as_completed(futures):
+                rel = futures[future]
+                results[rel] = {"hash": pending[rel][1], **future.result()}
+    elapsed = time.perf_counter() - start
+
+    removed = remove_orphans(sources)
+
+    results = dict(sorted(results.items()))
+    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    CACHE_PATH.write_text(json.dumps(
+        {rel: {k: v for k, v in entry.items() if k != "ms"} for rel, entry in results.items()},
+        indent=2
+    ) + "\n")
+
+    report(results, codecs)
+    print(f"\nCompressed {len(pending)} of {len(sources)} files in {elapsed:.2f}s"
+          + (f"; removed {removed} orphaned siblings" if removed else ""))
+
+
+def clean() -> None:
+    """Delete every precompressed sibling and the hash cache."""
+    removed = remove_orphans([])
+    CACHE_PATH.unlink(missing_ok=True)
+    print(f"Removed {removed} precompressed files")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Write .gz and .br siblings for text assets",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument("-j", "--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="Recompress even if files are unchanged")
+    parser.add_argument("--clean", action="store_true", help="Delete all precompressed siblings")
+    args = parser.parse_args()
+
+    if args.clean:
+        clean()
+    else:
+        precompress_assets(args.workers, args.force)
+
+
+if __name__ == "__main__":
+    main()
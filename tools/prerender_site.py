@@ -0,0 +1,909 @@
+#!/usr/bin/env python3
+"""Prerender the home page sections into index.html at build time.
+
+script.js normally builds the header, hero, every section and the footer in
+the browser after fetching site.json and its data files, so the first paint
+is an empty page. This script renders the same markup (same elements, class
+names and order as script.js) from data/*.json and the stats CSV and writes
+it into index.html. The page is then complete before any JavaScript runs,
+and script.js only hydrates it: stats category tabs, carousel scroll
+shadows, theme switcher, navigation and scroll reveal.
+
+Lookup tables (icons, language colors, level/org badges) are read from
+script.js itself so the two renderers cannot drift apart.
+
+Output is deterministic, so rebuilding only changes index.html when the data
+does. The one date-dependent piece, the "New" badge, is left to script.js:
+cards carry a data-date attribute and hydrateNewBadges() adds the badge.
+
+Images with an entry in data/placeholders.json get the same width/height
+and preview background that showPlaceholder() sets in script.js, and images
+with an entry in data/image-manifest.json the same <picture> and srcsets
+as showResponsive().
+
+index.html gets data-prerendered on <body>; script.js checks for it.
+
+Usage:
+    python tools/prerender_site.py            # prerender index.html (CI)
+    python tools/prerender_site.py --refresh  # re-render only if already prerendered
+    python tools/prerender_site.py --clean    # restore the empty shell for client rendering
+"""
+
+import argparse
+import json
+import re
+from functools import partial
+from html import escape
+from pathlib import Path
+
+from bundle_site_data import build_bundle
+
+PROJECT_ROOT = Path(__file__).parent.parent
+SITE_JSON = PROJECT_ROOT / "data" / "site.json"
+INDEX_HTML = PROJECT_ROOT / "index.html"
+SCRIPT_JS = PROJECT_ROOT / "script.js"
+
+PRERENDER_ATTR = "data-prerendered"
+EMPTY_SHELL = {
+    "header": "",
+    "main": '\n        <section id="about"></section>\n    ',
+    "footer": "",
+}
+
+MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+STAT_COLUMNS = ["W", "L", "ERA", "G", "SV", "IP", "H", "SO", "BB", "WHIP"]
+CATEGORY_ORDER = ["College", "Summer", "Independent", "Minors"]
+DEFAULT_THEME = "driveline"
+TRUNCATE_AT = 280
+
+
+# =============================================================================
+# script.js constants
+# =============================================================================
+
+JS_TOKEN = re.compile(
+    r"""(?P<skip>\s+|//[^\n]*|/\*.*?\*/)"""
+    r"""|(?P<string>'(?:\\.|[^'\\])*'|"(?:\\.|[^"\\])*")"""
+    r"""|(?P<number>-?\d+(?:\.\d+)?)"""
+    r"""|(?P<ident>[A-Za-z_$][\w$]*)"""
+    r"""|(?P<punct>[{}\[\]:,])""",
+    re.DOTALL,
+)
+JS_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f", "v": "\v", "0": "\0"}
+
+
+def js_string(literal: str) -> str:
+    """Decode a quoted JavaScript string literal."""
+    def unescape(match):
+        seq = match.group(1)
+        if seq.startswith("u"):
+            return chr(int(seq[1:], 16))
+        return JS_ESCAPES.get(seq, seq)
+
+    return re.sub(r"\\(u[0-9a-fA-F]{4}|.)", unescape, literal[1:-1], flags=re.DOTALL)
+
+
+def parse_js_literal(source: str, pos: int):
+    """
+    Parse a JSON-like JavaScript literal (objects, arrays, strings, numbers).
+
+    Handles unquoted keys, single quotes, trailing commas and comments, which
+    covers the constant tables in script.js.
+
+    Returns:
+        (value, position after the literal)
+    """
+    def token(pos):
+        while True:
+            match = JS_TOKEN.match(source, pos)
+            if not match:
+                raise ValueError(f"Unexpected JavaScript at offset {pos}: {source[pos:pos + 20]!r}")
+            if match.lastgroup != "skip":
+                return match.lastgroup, match.group(), match.end()
+            pos = match.end()
+
+    def value(pos):
+        kind, text, pos = token(pos)
+        if kind == "string":
+            return js_string(text), pos
+        if kind == "number":
+            return float(text) if "." in text else int(text), pos
+        if kind == "ident":
+            return {"true": True, "false": False, "null": None}[text], pos
+        if text == "[":
+            items = []
+            while True:
+                kind, text, after = token(pos)
+                if text == "]":
+                    return items, after
+                if text == ",":
+                    pos = after
+                    continue
+                item, pos = value(pos)
+                items.append(item)
+        if text == "{":
+            obj = {}
+            while True:
+                kind, text, pos = token(pos)
+                if text == "}":
+                    return obj, pos
+                if text == ",":
+                    continue
+                key = js_string(text) if kind == "string" else text
+                _, colon, pos = token(pos)
+                if colon != ":":
+                    raise ValueError(f"Expected ':' after key {key!r}")
+                obj[key], pos = value(pos)
+        raise ValueError(f"Unexpected token {text!r}")
+
+    return value(pos)
+
+
+def js_constant(source: str, name: str):
+    """Read `const <name> = {...}` (top-level or local) from script.js."""
+    match = re.search(rf"\bconst {re.escape(name)} = ", source)
+    if not match:
+        raise KeyError(f"const {name} not found in {SCRIPT_JS.name}")
+    return parse_js_literal(source, match.end())[0]
+
+
+def load_js_constants() -> dict:
+    """Load every script.js lookup table the renderer needs."""
+    source = SCRIPT_JS.read_text()
+    names = [
+        "ICONS", "HERO_NAV_LABELS", "LANGUAGE_COLORS", "levelClasses", "orgClasses",
+        "orgDisplayNames", "levelToCategory", "highlightLabels", "categoryLeagues", "IMAGE_SIZES",
+        "STAT_CHARTS",
+    ]
+    return {name: js_constant(source, name) for name in names}
+
+
+# =============================================================================
+# HTML helpers
+# =============================================================================
+
+def text(value) -> str:
+    """Escape a value the way textContent would render it."""
+    if value is None:
+        return ""
+    return escape(str(value), quote=False)
+
+
+def el(tag: str, attrs: dict | None = None, *children: str) -> str:
+    """
+    Serialize one element. Attributes with a None value are omitted;
+    children are already-serialized HTML.
+    """
+    attr_text = "".join(
+        f' {name}="{escape(str(value))}"' for name, value in (attrs or {}).items() if value is not None
+    )
+    if tag == "img":
+        return f"<{tag}{attr_text}>"
+    return f"<{tag}{attr_text}>{''.join(children)}</{tag}>"
+
+
+IMG_SRC = re.compile(r'<img\b(?P<before>[^>]*?) src="(?P<src>[^"]*)"(?P<after>[^>]*)>')
+
+
+def with_placeholders(html: str, placeholders: dict) -> str:
+    """Match showPlaceholder(): intrinsic size plus color and preview background."""
+    def add(match):
+        entry = placeholders.get("/" + match.group("src").split("?")[0].lstrip("/"))
+        if not entry:
+            return match.group(0)
+        style = (f'background-color: {entry["color"]}; background-image: url("{entry["preview"]}"); '
+                 f'background-size: cover;')
+        extra = f' width="{entry["width"]}" height="{entry["height"]}" style="{escape(style)}"'
+        return f'<img{match.group("before")} src="{match.group("src")}"{match.group("after")}{extra}>'
+
+    return IMG_SRC.sub(add, html)
+
+
+def with_responsive_images(html: str, images: dict, sizes: dict) -> str:
+    """Match showResponsive(): AVIF/WebP <source>s and a fallback srcset in a <picture>."""
+    def wrap(match):
+        entry = images.get("/" + match.group("src").split("?")[0].lstrip("/"))
+        if not entry:
+            return match.group(0)
+        classes = re.search(r'\bclass="([^"]*)"', match.group(0))
+        names = classes.group(1).split() if classes else []
+        size = sizes[next((name for name in sizes if name in names), "default")]
+        sources = "".join(
+            f'<source type="image/{fmt}" srcset="{escape(entry["srcset"][fmt])}" sizes="{escape(size)}">'
+            for fmt in ("avif", "webp")
+        )
+        img = (f'<img{match.group("before")} src="{match.group("src")}"{match.group("after")}'
+               f' sizes="{escape(size)}" srcset="{escape(entry["srcset"][entry["fallback"]])}">')
+        return f"<picture>{sources}{img}</picture>"
+
+    return IMG_SRC.sub(wrap, html)
+
+
+def icon(icons: dict, name: str, class_name: str = "icon-wrapper") -> str:
+    """Match createIconElement(): trusted SVG markup from ICONS in a wrapper span."""
+    return f'<span class="{class_name}">{icons.get(name, "")}</span>'
+
+
+def muted_message(message: str) -> str:
+    """Match displayError()/displayEmptyState()."""
+    return el("p", {"style": "color: var(--text-muted); font-style: italic;"}, text(message))
+
+
+def js_length(value: str) -> int:
+    """String length in UTF-16 code units, as JavaScript counts it."""
+    return len(value.encode("utf-16-le")) // 2
+
+
+def truncate(value: str, limit: int = TRUNCATE_AT) -> str:
+    """Match `text.substring(0, 280).trim() + "..."` in script.js."""
+    if js_length(value) <= limit:
+        return value
+    head = value.encode("utf-16-le")[:limit * 2].decode("utf-16-le", errors="ignore")
+    return head.strip() + "..."
+
+
+def with_mentions(value: str, class_name: str) -> str:
+    """Split out @mentions into styled spans, like `split(/(@\\w+)/g)`."""
+    parts = re.split(r"(@\w+)", value, flags=re.ASCII)
+    return "".join(
+        el("span", {"class": class_name}, text(part)) if part.startswith("@") else text(part)
+        for part in parts
+    )
+
+
+def format_date(date_string: str) -> str:
+    """Match formatDate(): en-US short month, e.g. "Sep 13, 2025"."""
+    year, month, day = date_string.split("-")
+    return f"{MONTHS[int(month) - 1]} {int(day)}, {int(year)}"
+
+
+def format_count(value) -> str:
+    """Match Number.toLocaleString() in en-US."""
+    return f"{value:,}" if isinstance(value, (int, float)) else text(value)
+
+
+def sort_by_date(items: list) -> list:
+    """Match sortByDate(): pinned first, then newest first (stable)."""
+    by_date = sorted(items, key=lambda item: item["date"], reverse=True)
+    return sorted(by_date, key=lambda item: not item.get("pinned"))
+
+
+def parse_csv(csv_text: str) -> list[dict]:
+    """Match parseCSV() in script.js (plain comma split, missing cells -> None)."""
+    lines = csv_text.strip().split("\n")
+    headers = lines[0].split(",")
+    rows = []
+    for line in lines[1:]:
+        values = line.split(",")
+        rows.append({header: values[i] if i < len(values) else None for i, header in enumerate(headers)})
+    return rows
+
+
+def themed_headshot(config: dict) -> str:
+    """Headshot for the default theme; script.js swaps it for a saved theme."""
+    profile = config["profile"]
+    return profile.get("headshots", {}).get(DEFAULT_THEME) or profile["headshot"]
+
+
+# =============================================================================
+# Header, hero & footer
+# =============================================================================
+
+def render_header(config: dict, js: dict) -> str:
+    """Match renderHeader()."""
+    name = config["profile"]["name"]
+    logo = el(
+        "a", {"href": "#top", "class": "logo"},
+        el("img", {"src": themed_headshot(config), "alt": name, "class": "logo-headshot"}),
+        el("span", {"class": "logo-text"}, text(name)),
+    )
+    links = [
+        el(
+            "a", {"href": f"#{section['id']}", "data-section": section["id"]},
+            el("span", {"class": "nav-icon"}, icon(js["ICONS"], section["icon"])),
+            el("span", {"class": "nav-text"}, text(section["title"])),
+        )
+        for section in config["sections"]
+    ]
+    return el("nav", {"class": "container"}, logo, el("div", {"class": "nav-links"}, *links))
+
+
+def render_hero(config: dict, js: dict) -> str:
+    """Match renderHero(); returns the whole #about section."""
+    profile = config["profile"]
+
+    socials = []
+    for social in config["socials"]:
+        is_external = social["url"].startswith("http")
+        attrs = {
+            "href": social["url"],
+            "target": "_blank" if is_external else None,
+            "rel": "noopener noreferrer" if is_external else None,
+            "aria-label": social["label"],
+        }
+        if social["platform"] == "resume":
+            attrs["class"] = "resume-cta"
+            socials.append(el("a", attrs, el("span", None, text("Résumé"))))
+        else:
+            socials.append(el("a", attrs, icon(js["ICONS"], social["platform"])))
+
+    intro = el(
+        "div", {"class": "hero-intro"},
+        el("img", {"src": themed_headshot(config), "alt": profile["name"], "class": "hero-headshot"}),
+        el("h1", {"class": "hero-name"}, text(profile["name"])),
+        el("p", {"class": "hero-description"}, text(profile["bio"])),
+        el("div", {"class": "social-links"}, *socials),
+    )
+
+    nav_items = []
+    for section in config["sections"]:
+        label = js["HERO_NAV_LABELS"].get(section["id"]) or section["title"]
+        subtitle = el("span", {"class": "hero-nav-subtitle"}, text(section["subtitle"])) if section.get("subtitle") else ""
+        nav_items.append(el(
+            "a",
+            {
+                "href": f"#{section['id']}",
+                "class": "hero-nav-item",
+                "data-section": section["id"],
+                "style": f"--section-accent: {section['accentColor']};",
+            },
+            el("div", {"class": "hero-nav-icon"}, icon(js["ICONS"], section["icon"])),
+            el("div", {"class": "hero-nav-text"}, el("span", {"class": "hero-nav-label"}, text(label)), subtitle),
+            el("span", {"class": "hero-nav-arrow"}, text("↓")),
+        ))
+
+    container = el("div", {"class": "container"}, intro, el("nav", {"class": "hero-nav"}, *nav_items))
+    return el("section", {"id": "about", "class": "hero"}, container)
+
+
+def render_footer(config: dict) -> str:
+    """Match renderFooter()."""
+    buttons = [
+        el("button", {"class": "theme-btn", "data-theme": theme["id"]}, text(theme["label"]))
+        for theme in config["footer"]["themes"]
+    ]
+    switcher = el(
+        "div", {"class": "theme-switcher"},
+        el("span", {"class": "theme-label"}, text("Team colors")),
+        el("div", {"class": "theme-switcher-buttons"}, *buttons),
+    )
+    return el("div", {"class": "container"}, el("div", {"class": "footer-content"}, switcher))
+
+
+# =============================================================================
+# Sections
+# =============================================================================
+
+def section_header(section: dict, js: dict, intro: bool = True) -> str:
+    """Icon, title and subtitle block shared by every section (plus the intro paragraph)."""
+    header = el(
+        "div", {"class": "section-header"},
+        el("div", {"class": f"section-icon {section['id']}-icon"}, icon(js["ICONS"], section["icon"])),
+        el("div", None, el("h2", None, text(section["title"])),
+           el("p", {"class": "section-subtitle"}, text(section.get("subtitle")))),
+    )
+    if intro and section.get("description"):
+        header += el("p", {"class": "section-intro"}, text(section["description"]))
+    return header
+
+
+def stat_chart(charts: dict, name: str, category: str, class_name: str) -> str:
+    """Match createStatChart(): a lazy <img> from charts.json, hidden unless Minors."""
+    entry = charts.get(name)
+    if not entry:
+        return ""
+    return el("img", {
+        "src": f"/assets/images/charts/{name}?v={entry['hash'][:10]}",
+        "alt": entry["alt"],
+        "width": entry["width"],
+        "height": entry["height"],
+        "loading": "lazy",
+        "class": f"stat-chart {class_name}",
+        "data-category": category,
+        "style": None if category == "Minors" else "display: none;",
+    })
+
+
+def render_stats_section(section: dict, files: dict, js: dict, charts: dict | None = None) -> str:
+    """Match renderStatsSection(): career tabs, overview cards, charts, season table and training videos."""
+    charts = charts or {}
+    stats = parse_csv(files[section["statsFile"]])
+    season_re = re.compile(r"^\d{4}$")
+    teams_re = re.compile(r"\d+\s*teams?$", re.IGNORECASE)
+
+    career_rows = {
+        category: next((row for row in stats if row["Season"] == f"{category} Career"), None)
+        for category in CATEGORY_ORDER
+    }
+    season_rows = [
+        row for row in stats
+        if season_re.match(row["Season"] or "") and teams_re.search(row["Team"] or "")
+    ]
+
+    # Levels played per "<year>-<category>", in first-seen order
+    season_category_levels = {}
+    for row in stats:
+        if season_re.match(row["Season"] or "") and not teams_re.search(row["Team"] or ""):
+            category = js["levelToCategory"].get(row["Level"]) or row["Level"]
+            levels = season_category_levels.setdefault(f"{row['Season']}-{category}", [])
+            if row["Level"] not in levels:
+                levels.append(row["Level"])
+
+    category_years = {}
+    for row in season_rows:
+        category_years.setdefault(row["Level"], []).append(int(row["Season"]))
+
+    def year_range(category):
+        years = category_years.get(category, [])
+        if not years:
+            return ""
+        if min(years) == max(years):
+            return str(min(years))
+        return f"{min(years)}-{str(max(years))[-2:]}"
+
+    def highlight_values(category):
+        row = career_rows[category]
+        return {
+            "ERA": (row or {}).get("ERA") or "-",
+            "W-L": f"{row['W']}-{row['L']}" if row else "-",
+            "G": (row or {}).get("G") or "-",
+            "IP": (row or {}).get("IP") or "-",
+            "SO": (row or {}).get("SO") or "-",
+            "WHIP": (row or {}).get("WHIP") or "-",
+        }
+
+    buttons = [
+        el(
+            "button",
+            {
+                "class": f"stats-category-btn{' active' if category == 'Minors' else ''}",
+                "data-category": category,
+                "data-highlights": json.dumps(highlight_values(category), separators=(",", ":"), ensure_ascii=False),
+            },
+            el("span", {"class": "stats-category-name"}, text(category)),
+            el("span", {"class": "stats-category-years"}, text(year_range(category))),
+        )
+        for category in CATEGORY_ORDER
+    ]
+
+    initial = highlight_values("Minors")
+    overview = [
+        el(
+            "div", {"class": "stat-card-large"},
+            el("div", {"class": "stat-value", "data-stat": stat}, text(initial.get(stat))),
+            el("div", {"class": "stat-label"}, text(js["highlightLabels"].get(stat))),
+            *[
+                stat_chart(charts, f"spark-{category.lower()}-{js['STAT_CHARTS'][stat]}.svg", category, "stat-sparkline")
+                for category in CATEGORY_ORDER if stat in js["STAT_CHARTS"]
+            ],
+        )
+        for stat in section["statsHighlights"]
+    ]
+
+    trends = [
+        stat_chart(charts, f"trend-{category.lower()}-{slug}.svg", category, "stat-trend")
+        for category in CATEGORY_ORDER
+        for slug in js["STAT_CHARTS"].values()
+    ]
+    # Minor league level totals go with the Minors tab
+    trends += [
+        stat_chart(charts, f"levels-{slug}.svg", "Minors", "stat-trend")
+        for slug in js["STAT_CHARTS"].values()
+    ]
+    trends = [chart for chart in trends if chart]
+
+    headers = ["Year", "Organization", "Levels", *STAT_COLUMNS]
+    columns = {"Organization": "team", "Levels": "levels"}
+    thead = el("thead", None, el("tr", None, *[
+        el("th", {"data-column": columns.get(header)}, text(header)) for header in headers
+    ]))
+
+    def saves(value):
+        return "0" if value in ("-", "") else value
+
+    def hidden(category):
+        return None if category == "Minors" else "display: none;"
+
+    body_rows = []
+    for row in season_rows:
+        category = row["Level"]
+        team = ""
+        if row.get("Org") and row["Org"] != "-":
+            display_name = js["orgDisplayNames"].get(row["Org"]) or row["Org"]
+            team = el("span", {"class": f"org-badge {js['orgClasses'].get(row['Org'], '')}"}, text(display_name))
+
+        if category == "Minors":
+            levels = "".join(
+                el("span", {"class": f"level-badge {js['levelClasses'].get(level, '')}"}, text(level)) + " "
+                for level in season_category_levels.get(f"{row['Season']}-{category}", [])
+            )
+        else:
+            league = js["categoryLeagues"].get(category)
+            levels = el("span", {"class": f"league-badge {league['className']}"}, text(league["name"])) if league else ""
+
+        cells = [el("td", None, text(row["Season"])), el("td", None, team), el("td", None, levels)]
+        cells += [el("td", None, text(saves(row[col]) if col == "SV" else row[col])) for col in STAT_COLUMNS]
+        body_rows.append(el("tr", {"data-category": category, "style": hidden(category)}, *cells))
+
+    foot_rows = []
+    for category in CATEGORY_ORDER:
+        career = career_rows[category]
+        if not career:
+            continue
+        cells = [el("td"), el("td"), el("td")]
+        for col in STAT_COLUMNS:
+            value = career.get(col) or "-"
+            cells.append(el("td", None, el("strong", None, text(saves(value) if col == "SV" else value))))
+        foot_rows.append(el("tr", {"data-category": category, "style": hidden(category)}, *cells))
+
+    table = el(
+        "div", {"class": "stats-table-wrapper"},
+        el("table", {"class": "stats-table"}, thead, el("tbody", None, *body_rows), el("tfoot", None, *foot_rows)),
+    )
+
+    subsection = el(
+        "div", {"class": "subsection"},
+        el("div", {"class": "subsection-header"}, el("h3", None, text("Career Stats"))),
+        el("div", {"class": "stats-category-selector"}, *buttons),
+        el("div", {"class": "stats-overview"}, *overview),
+        el("div", {"class": "stats-charts"}, *trends) if trends else "",
+        table,
+    )
+
+    links = el("div", {"class": "stats-links"}, *[
+        el(
+            "a", {"href": link["url"], "target": "_blank", "rel": "noopener noreferrer", "class": "stats-link"},
+            el("span", {"class": "stats-link-name"}, text(link["name"])),
+            icon(js["ICONS"], "externalLink"),
+        )
+        for link in section["statsLinks"]
+    ])
+
+    training = ""
+    training_data = files.get(section.get("trainingFile"))
+    if training_data:
+        cards = [render_training_card(item) for item in sort_by_date(training_data) if item.get("type") == "video"]
+        training = el(
+            "div", {"class": "subsection"},
+            el("div", {"class": "subsection-header"}, el("h3", None, text("My Training"))),
+            el("div", {"class": "content-grid"}, *cards),
+        )
+
+    return el("div", {"class": "container"}, section_header(section, js), subsection, links, training)
+
+
+def render_training_card(item: dict) -> str:
+    """Match the training video card built in renderStatsSection()."""
+    parts = []
+    if item.get("poster"):
+        parts.append(el("div", {"class": "training-bg-wrapper"},
+                        el("img", {"src": item["poster"], "alt": "Training video thumbnail"})))
+        parts.append(el("div", {"class": "training-bg-overlay"}))
+
+    header = []
+    if item.get("credit"):
+        header.append(el("div", {"class": "training-handle"}, text(f"@{item['credit']['handle']}")))
+    if item.get("date"):
+        header.append(el("span", {"class": "training-date"}, text(format_date(item["date"]))))
+    parts.append(el("div", {"class": "training-header"}, *header))
+
+    if item.get("pinned"):
+        parts.append(el("div", {"class": "card-badge-row"}, el("span", {"class": "pinned-badge"}, "Pinned")))
+
+    caption = ""
+    if item.get("caption"):
+        caption = el("p", {"class": "training-caption"}, with_mentions(truncate(item["caption"]), "training-mention"))
+    parts.append(el("div", {"class": "training-card-content"}, caption))
+
+    card = el("div", {"class": "training-card", "data-date": item.get("date") or None}, *parts)
+    if item.get("url"):
+        return el("a", {"href": item["url"], "target": "_blank", "rel": "noopener noreferrer",
+                        "class": "training-card-link"}, card)
+    return card
+
+
+def render_content_section(section: dict, files: dict, js: dict) -> str:
+    """Match renderContentSection(): topics plus one carousel per subsection."""
+    parts = [section_header(section, js)]
+
+    if section.get("topics"):
+        label = el("span", {"class": "section-topics-label"}, text(section["topicsLabel"])) if section.get("topicsLabel") else ""
+        tags = [el("span", {"class": "section-topic-tag"}, text(topic)) for topic in section["topics"]]
+        parts.append(el("div", {"class": "section-topics"}, label, el("div", {"class": "section-topics-tags"}, *tags)))
+
+    for subsection in section["subsections"]:
+        view_all = ""
+        if subsection.get("viewAllUrl"):
+            view_all = el("a", {"href": subsection["viewAllUrl"], "target": "_blank", "class": "view-all-link"},
+                          text(subsection.get("viewAllLabel")))
+        header = el("div", {"class": "subsection-header"}, el("h3", None, text(subsection["title"])), view_all)
+
+        grid_class = "content-grid content-grid--projects" if subsection["displayType"] == "projects" else "content-grid"
+        items = files.get(subsection["dataFile"])
+        if items is None:
+            grid = el("div", {"class": grid_class}, muted_message("Content not available."))
+        else:
+            grid = render_items(grid_class, items, subsection, js)
+
+        parts.append(el("div", {"class": "subsection"}, header, grid))
+
+    return el("div", {"class": "container"}, *parts)
+
+
+def render_items(grid_class: str, items: list, subsection: dict, js: dict) -> str:
+    """Match displayItems(): sorted cards inside the carousel wrapper, or an empty state."""
+    display_type = subsection["displayType"]
+    if not items:
+        empty = {"projects": "No projects to display yet.", "tweets": "No tweets to display yet."}
+        return el("div", {"class": grid_class}, muted_message(empty.get(display_type, "No items to display yet.")))
+
+    if display_type == "projects":
+        by_stars = sorted(items, key=lambda item: -(item.get("stars") or 0))
+        cards = [render_project_card(item, js) for item in sorted(by_stars, key=lambda item: not item.get("pinned"))]
+    elif display_type == "tweets":
+        cards = [render_tweet_card(item, subsection.get("handle"), js) for item in sort_by_date(items)]
+    else:
+        cards = [render_content_card(item, js) for item in sort_by_date(items)]
+
+    return el("div", {"class": "content-grid-wrapper"}, el("div", {"class": grid_class}, *cards))
+
+
+def render_project_card(project: dict, js: dict) -> str:
+    """Match createProjectCard()."""
+    parts = [el("h3", None, text(project.get("title")))]
+
+    is_gist = "gist.github.com" in (project.get("url") or "")
+    if project.get("pinned") or is_gist:
+        badges = el("span", {"class": "pinned-badge"}, "Pinned") if project.get("pinned") else ""
+        badges += el("span", {"class": "gist-badge"}, "Gist") if is_gist else ""
+        parts.append(el("div", {"class": "card-badge-row"}, badges))
+
+    content = ""
+    if (project.get("description") or "").strip():
+        content += el("p", {"class": "card-description"}, text(project["description"]))
+    if project.get("topics"):
+        content += el("div", {"class": "project-topics"}, *[
+            el("span", {"class": "project-topic"}, text(topic)) for topic in project["topics"][:3]
+        ])
+    parts.append(el("div", {"class": "project-content"}, content))
+
+    stats = []
+    if project.get("language"):
+        color = js["LANGUAGE_COLORS"].get(project["language"], "#858585")
+        stats.append(el("span", {"class": "project-language"},
+                        el("span", {"class": "language-dot", "style": f"background-color: {color};"}),
+                        text(project["language"])))
+    for key, icon_name in (("stars", "star"), ("forks", "fork")):
+        if key in project:
+            stats.append(el("span", {"class": "project-stat"}, icon(js["ICONS"], icon_name), el("span", None, text(project[key]))))
+    if stats:
+        parts.append(el("div", {"class": "project-stats"}, *stats))
+
+    return el(
+        "a",
+        {
+            "class": "content-card project-card pinned" if project.get("pinned") else "content-card project-card",
+            "href": project.get("url"),
+            "target": "_blank",
+            "rel": "noopener noreferrer",
+            "data-date": project.get("date") or None,
+        },
+        *parts,
+    )
+
+
+def engagement_stats(item: dict, js: dict, icon_class: str) -> str:
+    """Retweet/like/bookmark counts shared by tweet and content cards."""
+    stats = [
+        el("span", {"class": "tweet-stat"}, icon(js["ICONS"], name, icon_class), format_count(item[key]))
+        for key, name in (("retweets", "retweet"), ("likes", "heart"), ("bookmarks", "bookmark"))
+        if key in item
+    ]
+    return el("div", {"class": "tweet-stats"}, *stats) if stats else ""
+
+
+def render_tweet_card(item: dict, handle: str, js: dict) -> str:
+    """Match createTweetCard()."""
+    parts = [el(
+        "div", {"class": "tweet-header"},
+        el("div", {"class": "tweet-handle"}, text(f"@{handle}")),
+        el("span", {"class": "tweet-date"}, text(format_date(item["date"]))),
+    )]
+    if item.get("pinned"):
+        parts.append(el("div", {"class": "card-badge-row"}, el("span", {"class": "pinned-badge"}, "Pinned")))
+
+    tweet_text = truncate(item.get("text") or item.get("title") or "")
+    parts.append(el("div", {"class": "tweet-content"},
+                    el("p", {"class": "tweet-text"}, with_mentions(tweet_text, "tweet-mention"))))
+    parts.append(engagement_stats(item, js, "icon-wrapper"))
+
+    return el(
+        "a",
+        {
+            "class": "tweet-card pinned" if item.get("pinned") else "tweet-card",
+            "href": item.get("url"),
+            "target": "_blank",
+            "rel": "noopener noreferrer",
+            "data-date": item["date"],
+        },
+        *parts,
+    )
+
+
+def render_content_card(item: dict, js: dict) -> str:
+    """Match createContentCard()."""
+    parts = []
+    pinned = el("span", {"class": "pinned-badge"}, "Pinned") if item.get("pinned") else ""
+
+    if item.get("thumbnail"):
+        overlay = el("div", {"class": "card-badge-overlay"}, pinned) if pinned else ""
+        parts.append(el(
+            "div", {"class": "thumbnail-wrapper"},
+            el("img", {"class": "thumbnail", "src": item["thumbnail"], "alt": item.get("title"),
+                       "loading": "lazy", "referrerpolicy": "no-referrer"}),
+            overlay,
+        ))
+
+    meta_left = el("span", {"class": "date"}, text(format_date(item["date"])))
+    if not item.get("thumbnail"):
+        meta_left += pinned
+    source = el("span", {"class": "source"}, text(item["source"])) if item.get("source") else ""
+    parts.append(el("div", {"class": "card-meta-row"}, el("div", {"class": "card-meta-left"}, meta_left), source))
+
+    parts.append(el("h3", None, text(item.get("title"))))
+    if item.get("authors"):
+        parts.append(el("div", {"class": "authors"}, text(", ".join(item["authors"]))))
+    parts.append(engagement_stats(item, js, "tweet-stat-icon"))
+    if (item.get("description") or "").strip():
+        parts.append(el("p", {"class": "card-description"}, text(item["description"])))
+
+    return el(
+        "a",
+        {
+            "class": "content-card pinned" if item.get("pinned") else "content-card",
+            "href": item.get("url"),
+            "target": "_blank",
+            "rel": "noopener noreferrer",
+            "data-date": item["date"],
+        },
+        *parts,
+    )
+
+
+def render_personal_section(section: dict, files: dict, js: dict) -> str:
+    """Match renderPersonalSection(): reading, listening and chess cards."""
+    data = files.get(section["dataFile"])
+    if data is None:
+        return el("div", {"class": "container"}, section_header(section, js, intro=False),
+                  muted_message("Content not available."))
+
+    def media_card(entry, item_key, icon_name, subtitle_key):
+        item = entry[item_key]
+        return el(
+            "a", {"href": item["url"], "target": "_blank", "rel": "noopener noreferrer", "class": "personal-card"},
+            el("div", {"class": "personal-card-icon"}, icon(js["ICONS"], icon_name)),
+            el("h3", {"class": "personal-card-title"}, text(entry["title"])),
+            el("img", {"src": item["cover"], "alt": item["title"], "class": "personal-cover"}),
+            el("p", {"class": "personal-item-title"}, text(item["title"])),
+            el("p", {"class": "personal-item-subtitle"}, text(item[subtitle_key])),
+        )
+
+    cards = []
+    if data.get("reading"):
+        cards.append(media_card(data["reading"], "book", "book", "author"))
+    if data.get("listening"):
+        cards.append(media_card(data["listening"], "album", "headphones", "artist"))
+    if data.get("chess"):
+        links = [
+            el(
+                "a", {"href": link["url"], "target": "_blank", "rel": "noopener noreferrer", "class": "personal-card-link"},
+                el("span", {"class": "personal-link-label"}, text(link["label"])),
+                el("span", {"class": "personal-link-rating-container"},
+                   el("span", {"class": "personal-link-type"}, text(link["ratingType"])),
+                   el("span", {"class": "personal-link-rating"}, text(link["rating"]))),
+            )
+            for link in data["chess"]["links"].values()
+        ]
+        cards.append(el(
+            "div", {"class": "personal-card personal-card-multi"},
+            el("div", {"class": "personal-card-icon"}, icon(js["ICONS"], "chess")),
+            el("h3", {"class": "personal-card-title"}, text(data["chess"]["title"])),
+            el("div", {"class": "personal-card-links"}, *links),
+        ))
+
+    return el("div", {"class": "container"}, section_header(section, js, intro=False),
+              el("div", {"class": "content-grid"}, *cards))
+
+
+def render_sections(config: dict, files: dict, js: dict, charts: dict | None = None) -> list[str]:
+    """Match renderSections(): one <section> per site.json section, alternating backgrounds."""
+    renderers = {"stats": partial(render_stats_section, charts=charts), "personal": render_personal_section}
+    sections = []
+    for index, section in enumerate(config["sections"]):
+        render = renderers.get(section.get("type"), render_content_section)
+        class_name = "content-section" + (" alt-bg" if index % 2 == 0 else "")
+        sections.append(el("section", {"id": section["id"], "class": class_name}, render(section, files, js)))
+    return sections
+
+
+# =============================================================================
+# index.html
+# =============================================================================
+
+def replace_element(html: str, tag: str, inner: str) -> str:
+    """Replace the contents of the first <tag>...</tag> in the page body."""
+    pattern = re.compile(rf"(<{tag}(?:\s[^>]*)?>).*?(</{tag}>)", re.DOTALL)
+    if not pattern.search(html):
+        raise ValueError(f"<{tag}> not found in {INDEX_HTML.name}")
+    return pattern.sub(lambda m: m.group(1) + inner + m.group(2), html, count=1)
+
+
+def set_prerendered(html: str, enabled: bool) -> str:
+    """Add or remove the data-prerendered flag on <body>."""
+    html = re.sub(rf"(<body[^>]*?)\s+{PRERENDER_ATTR}(?=[\s>])", r"\1", html, count=1)
+    if enabled:
+        html = re.sub(r"<body([^>]*)>", rf"<body\1 {PRERENDER_ATTR}>", html, count=1)
+    return html
+
+
+def is_prerendered(html: str) -> bool:
+    """Whether index.html currently carries prerendered markup."""
+    return re.search(rf"<body[^>]*\s{PRERENDER_ATTR}[\s>]", html) is not None
+
+
+def prerender() -> None:
+    """Render every section from the data files and write them into index.html."""
+    with open(SITE_JSON, "r") as f:
+        config = json.load(f)
+
+    bundle = build_bundle(config)
+    files = bundle["files"]
+    placeholders = bundle.get("placeholders", {})
+    images = bundle.get("images", {})
+    js = load_js_constants()
+
+    def with_images(html: str) -> str:
+        return with_responsive_images(with_placeholders(html, placeholders), images, js["IMAGE_SIZES"])
+
+    indent = "\n        "
+    header = indent + with_images(render_header(config, js)) + "\n    "
+    main = indent + indent.join([render_hero(config, js), *render_sections(config, files, js, bundle.get("charts"))]) + "\n    "
+    main = with_images(main)
+    footer = indent + render_footer(config) + "\n    "
+
+    before = INDEX_HTML.read_text()
+    html = replace_element(before, "header", header)
+    html = replace_element(html, "main", main)
+    html = replace_element(html, "footer", footer)
+    html = set_prerendered(html, True)
+
+    if html == before:
+        print(f"{INDEX_HTML} is up to date")
+        return
+
+    INDEX_HTML.write_text(html)
+    print(f"Prerendered {len(config['sections'])} sections into {INDEX_HTML} "
+          f"({len(before.encode()):,} -> {len(html.encode()):,} bytes)")
+
+
+def clean() -> None:
+    """Restore the empty header/main/footer shell so script.js renders client-side."""
+    html = INDEX_HTML.read_text()
+    for tag, inner in EMPTY_SHELL.items():
+        html = replace_element(html, tag, inner)
+    INDEX_HTML.write_text(set_prerendered(html, False))
+    print(f"Restored client-rendered shell in {INDEX_HTML}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Prerender home page sections into index.html")
+    parser.add_argument("--refresh", action="store_true", help="Re-render only if index.html is already prerendered")
+    parser.add_argument("--clean", action="store_true", help="Remove prerendered markup from index.html")
+    args = parser.parse_args()
+
+    if args.clean:
+        clean()
+    elif args.refresh and not is_prerendered(INDEX_HTML.read_text()):
+        print("index.html is not prerendered; nothing to refresh")
+    else:
+        prerender()
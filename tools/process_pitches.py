@@ -0,0 +1,544 @@
+#!/usr/bin/env python3
+"""
+Stream pitch-level exports into per-team pitch counts, GO/AO and pitch-type summaries.
+
+Pitch-by-pitch exports (Statcast / TrackMan style: one row per pitch with
+pitch type, velocity, spin, result and batted-ball type) run to millions of
+rows per season. This module reads them in fixed-size chunks. Each chunk is
+turned into NumPy columns and reduced with bincount into small accumulators,
+so memory depends on the chunk size and the number of (team, pitch type)
+groups, never on the file length. Files may be gzipped.
+
+Rows are grouped by the same (year, team, level) join key process_stats.py
+uses for supplemental exports, and filtered to PLAYER_NAME when a player
+column exists. Per group we keep:
+
+- NP: pitch count
+- GO and AO: batted-ball outs on ground balls, and on fly balls, line drives
+  and pop-ups (sacrifice flies count as airouts, strikeouts as neither)
+- per pitch type: count, velocity sum / sum of squares / max, spin sum
+
+process_stats.py joins NP, GO and AO onto career_stats.csv (values from
+supplemental exports take precedence) and writes the per-pitch-type side
+file assets/documents/pitch_types.csv with usage, average and max velocity,
+velocity spread and average spin for every team, season and career.
+
+Recognized columns (first match wins; see PITCH_COLUMNS):
+    Year/Season/game_year (or game_date), Team, Level, Player/player_name,
+    pitch_type, release_speed, release_spin_rate, events, bb_type
+
+Usage:
+    python tools/process_pitches.py                         # summarize assets/documents/pitches/
+    python tools/process_pitches.py exports/2024.csv.gz
+    python tools/process_pitches.py --synthetic /tmp/pitches.csv --rows 1000000
+    python tools/process_pitches.py --benchmark 10000000
+"""
+
+import argparse
+import csv
+import gzip
+import math
+import resource
+import sys
+import time
+from itertools import islice
+from pathlib import Path
+
+import numpy as np
+
+from process_stats import (
+    CATEGORY_MAP,
+    LEVEL_MAP,
+    LEVEL_ORDER,
+    PLAYER_NAME,
+    first_column,
+    join_key,
+    normalize_text,
+    read_bbref_stats,
+)
+
+PROJECT_ROOT = Path(__file__).parent.parent
+PITCHES_DIR = PROJECT_ROOT / "assets" / "documents" / "pitches"
+PITCH_TYPES_FILE = PROJECT_ROOT / "assets" / "documents" / "pitch_types.csv"
+BENCHMARK_DIR = Path(__file__).parent / ".cache"
+
+CHUNK_ROWS = 1 << 16
+
+# Every field is parsed as a fixed-width string (numbers converted afterwards,
+# so blanks become NaN); longer values are truncated
+FIELD_DTYPE = "U32"
+NUMBER_DTYPE = "U12"
+NUMBER_FIELDS = {"velo", "spin"}
+
+# Per-word multipliers for hashing fixed-width strings in categorize()
+HASH_WEIGHTS = np.random.default_rng(0).integers(1, 2**63, size=32, dtype=np.uint64) | np.uint64(1)
+
+# Field -> column names that supply it
+PITCH_COLUMNS = {
+    "year": ("Year", "Season", "game_year"),
+    "date": ("game_date", "Date"),
+    "team": ("Team", "Tm"),
+    "level": ("Level", "Lev"),
+    "player": ("Player", "Name", "player_name", "Pitcher"),
+    "pitch_type": ("pitch_type", "Pitch Type", "PitchType", "TaggedPitchType"),
+    "velo": ("release_speed", "Velocity", "Velo", "RelSpeed"),
+    "spin": ("release_spin_rate", "Spin", "SpinRate"),
+    "event": ("events", "Event", "PlayResult"),
+    "bb_type": ("bb_type", "Batted Ball", "TaggedHitType"),
+}
+
+# Batted-ball types and outs, compared after squeeze() ("ground_ball" -> "groundball")
+GROUND_TYPES = {"groundball", "grounder"}
+AIR_TYPES = {"flyball", "linedrive", "popup"}
+OUT_EVENTS = {
+    "out", "fieldout", "forceout", "groundedintodoubleplay", "doubleplay", "tripleplay",
+    "fielderschoiceout", "sacfly", "sacflydoubleplay",
+}
+
+# Per (group, pitch type) accumulator layout
+N, VELO_N, VELO_SUM, VELO_SQ, VELO_MAX, SPIN_N, SPIN_SUM = range(7)
+PITCH_FIELDS = 7
+
+# Per group counter layout
+NP, GO, AO = range(3)
+
+PITCH_TYPE_COLUMNS = ["Season", "Team", "Level", "Pitch", "N", "Pct", "Velo", "MaxVelo", "VeloSD", "Spin"]
+
+# Site level label -> category ("Rk+" -> "Minors")
+LEVEL_CATEGORY = {label: CATEGORY_MAP[code] for code, label in LEVEL_MAP.items()}
+CATEGORIES = ["College", "Summer", "Independent", "Minors"]
+LEVEL_RANK = {level: i for i, level in enumerate(["NCAA", "Summer", "Independent", *LEVEL_ORDER])}
+
+# Synthetic arsenal: pitch type -> (share, mean velo, velo sd, mean spin, spin sd)
+SYNTHETIC_MIX = {
+    "FF": (0.42, 91.0, 1.6, 2250, 110),
+    "SI": (0.14, 90.2, 1.5, 2120, 100),
+    "SL": (0.22, 82.5, 1.8, 2480, 140),
+    "CH": (0.14, 83.8, 1.7, 1750, 150),
+    "CU": (0.08, 76.5, 2.0, 2600, 160),
+}
+# Share of pitches put in play, batted-ball mix, and out rate per batted-ball type
+SYNTHETIC_IN_PLAY = 0.18
+SYNTHETIC_BATTED = {"ground_ball": (0.44, 0.74), "line_drive": (0.21, 0.32), "fly_ball": (0.26, 0.86), "popup": (0.09, 0.98)}
+
+
+def squeeze(value: str) -> str:
+    """Lowercase letters only, so "Ground_Ball", "GroundBall" and "ground ball" match."""
+    return "".join(ch for ch in value.lower() if ch.isalpha())
+
+
+def open_text(path: Path):
+    """Open a CSV, transparently decompressing .gz files."""
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt", newline="", encoding="utf-8")
+    return open(path, newline="", encoding="utf-8")
+
+
+def find_pitch_files(directory: Path = PITCHES_DIR) -> list[Path]:
+    """Pitch exports (.csv and .csv.gz) in a directory, sorted."""
+    if not directory.is_dir():
+        return []
+    return sorted([*directory.glob("*.csv"), *directory.glob("*.csv.gz")])
+
+
+def categorize(values) -> tuple[list[str], np.ndarray]:
+    """
+    Distinct values of a string column and each row's index into them.
+
+    Sorting fixed-width strings is slow, so each value is hashed to a uint64
+    (a random linear combination of its characters) and the hashes are
+    deduplicated instead. A collision is caught by comparing every row with
+    its representative, falling back to sorting the strings.
+    """
+    column = np.ascontiguousarray(values)
+    # Read the UCS-4 characters two at a time as uint64 words
+    words = column.dtype.itemsize // 8
+    if column.dtype.kind == "U" and column.dtype.itemsize % 8 == 0 and 0 < words <= len(HASH_WEIGHTS) and len(column):
+        codes = column.view(np.uint64).reshape(len(column), words) @ HASH_WEIGHTS[:words]
+        _, first, inverse = np.unique(codes, return_index=True, return_inverse=True)
+        uniques = column[first]
+        inverse = inverse.ravel()
+        if (uniques[inverse] == column).all():
+            return uniques.tolist(), inverse
+    uniques, inverse = np.unique(column, return_inverse=True)
+    return uniques.tolist(), inverse.ravel()
+
+
+def to_float(values) -> np.ndarray:
+    """Numeric column with blanks and junk as NaN."""
+    column = np.asarray(values)
+    out = np.full(column.shape, np.nan)
+    present = (column != "") & (column != "NA") & (column != "-") & (column != "null")
+    try:
+        out[present] = column[present].astype(np.float64)
+    except ValueError:
+        for i in np.flatnonzero(present):
+            try:
+                out[i] = float(column[i])
+            except ValueError:
+                pass
+    return out
+
+
+class PitchTotals:
+    """
+    Compact accumulators for pitch-level data.
+
+    groups maps a join key to an int64 [NP, GO, AO] vector; pitches maps
+    (join key, pitch type) to a float64 vector laid out as N, VELO_N,
+    VELO_SUM, VELO_SQ, VELO_MAX, SPIN_N, SPIN_SUM. Both are sums, so any
+    set of groups can be rolled up by adding vectors (and taking the max
+    of VELO_MAX).
+    """
+
+    def __init__(self):
+        self.groups = {}
+        self.pitches = {}
+        self.rows = 0
+        self.kept = 0
+        self.has_batted_balls = False
+
+    def add_chunk(self, columns: dict, player: str | None) -> None:
+        """Reduce one chunk of string columns (field -> array) into the accumulators."""
+        size = len(next(iter(columns.values())))
+        self.rows += size
+
+        keep = np.ones(size, dtype=bool)
+        if "player" in columns and player:
+            names, inverse = categorize(columns["player"])
+            matches = np.array([player_matches(name, player) for name in names])
+            keep = matches[inverse]
+            if not keep.any():
+                return
+
+        # A game_date's first four characters are the year
+        years = columns["year"] if "year" in columns else columns["date"].astype("U4")
+        year_u, year_i = categorize(years)
+        team_u, team_i = categorize(columns["team"])
+        level_u, level_i = categorize(columns["level"])
+        combined = (year_i.astype(np.int64) * len(team_u) + team_i) * len(level_u) + level_i
+        group_codes, group_i = np.unique(combined[keep], return_inverse=True)
+        group_i = group_i.ravel()
+        group_keys = []
+        for code in group_codes.tolist():
+            code, level = divmod(code, len(level_u))
+            year, team = divmod(code, len(team_u))
+            group_keys.append(join_key(year_u[year], team_u[team], level_u[level]))
+
+        pitch_u, pitch_i = categorize(columns["pitch_type"] if "pitch_type" in columns else np.full(size, ""))
+        pitch_u = [normalize_text(p) or "UN" for p in pitch_u]
+        pitch_i = pitch_i[keep]
+        n_pitch = len(pitch_u)
+        flat = group_i * n_pitch + pitch_i
+        cells = len(group_keys) * n_pitch
+
+        velo = to_float(columns["velo"])[keep] if "velo" in columns else np.full(len(flat), np.nan)
+        spin = to_float(columns["spin"])[keep] if "spin" in columns else np.full(len(flat), np.nan)
+        has_velo = ~np.isnan(velo)
+        has_spin = ~np.isnan(spin)
+
+        stats = np.zeros((cells, PITCH_FIELDS))
+        stats[:, N] = np.bincount(flat, minlength=cells)
+        stats[:, VELO_N] = np.bincount(flat[has_velo], minlength=cells)
+        stats[:, VELO_SUM] = np.bincount(flat[has_velo], weights=velo[has_velo], minlength=cells)
+        stats[:, VELO_SQ] = np.bincount(flat[has_velo], weights=velo[has_velo] ** 2, minlength=cells)
+        stats[:, VELO_MAX] = -np.inf
+        np.maximum.at(stats[:, VELO_MAX], flat[has_velo], velo[has_velo])
+        stats[:, SPIN_N] = np.bincount(flat[has_spin], minlength=cells)
+        stats[:, SPIN_SUM] = np.bincount(flat[has_spin], weights=spin[has_spin], minlength=cells)
+
+        counts = np.zeros((len(group_keys), 3), dtype=np.int64)
+        counts[:, NP] = np.bincount(group_i, minlength=len(group_keys))
+        if "bb_type" in columns and "event" in columns:
+            self.has_batted_balls = True
+            bb_u, bb_i = categorize(columns["bb_type"])
+            event_u, event_i = categorize(columns["event"])
+            ground = np.array([squeeze(b) in GROUND_TYPES for b in bb_u])[bb_i][keep]
+            air = np.array([squeeze(b) in AIR_TYPES for b in bb_u])[bb_i][keep]
+            out = np.array([squeeze(e) in OUT_EVENTS for e in event_u])[event_i][keep]
+            counts[:, GO] = np.bincount(group_i[out & ground], minlength=len(group_keys))
+            counts[:, AO] = np.bincount(group_i[out & air], minlength=len(group_keys))
+
+        for g, key in enumerate(group_keys):
+            if key in self.groups:
+                self.groups[key] += counts[g]
+            else:
+                self.groups[key] = counts[g].copy()
+        for cell in np.flatnonzero(stats[:, N]).tolist():
+            g, p = divmod(cell, n_pitch)
+            pitch_key = (group_keys[g], pitch_u[p])
+            current = self.pitches.get(pitch_key)
+            if current is None:
+                self.pitches[pitch_key] = stats[cell].copy()
+            else:
+                current[:VELO_MAX] += stats[cell, :VELO_MAX]
+                current[VELO_MAX] = max(current[VELO_MAX], stats[cell, VELO_MAX])
+                current[SPIN_N:] += stats[cell, SPIN_N:]
+        self.kept += len(flat)
+
+    def counts(self) -> dict:
+        """Join key -> {"np", "go", "ao"} in the shape read_supplemental() produces."""
+        index = {}
+        for key, counts in self.groups.items():
+            values = {"np": int(counts[NP])}
+            if self.has_batted_balls:
+                values["go"] = int(counts[GO])
+                values["ao"] = int(counts[AO])
+            index[key] = values
+        return index
+
+
+def player_matches(name: str, player: str) -> bool:
+    """Whether a player cell names the player ("Josh Hejka" or "Hejka, Josh")."""
+    if "," in name:
+        last, first = name.split(",", 1)
+        name = f"{first} {last}"
+    return normalize_text(name) == player
+
+
+def read_columns(path: Path) -> tuple[list[str], dict[str, int]]:
+    """Header of a pitch export and the column index of each recognized field."""
+    with open_text(path) as f:
+        header = next(csv.reader(f), [])
+    positions = {name.strip(): i for i, name in enumerate(header)}
+    fields = {}
+    for field, names in PITCH_COLUMNS.items():
+        index = first_column(positions, names)
+        if index is not None:
+            fields[field] = index
+    return header, fields
+
+
+def ingest_pitches(paths: list[Path], chunk_rows: int = CHUNK_ROWS, player: str = PLAYER_NAME) -> PitchTotals:
+    """
+    Stream pitch exports into one PitchTotals.
+
+    Args:
+        paths: CSV or CSV.gz pitch exports
+        chunk_rows: Rows parsed and reduced per step (bounds memory)
+        player: Player to keep when a file has a player column (None keeps all)
+
+    Raises:
+        ValueError: A file lacks the team, level or year/date columns
+    """
+    totals = PitchTotals()
+    player = normalize_text(player) if player else None
+    for path in paths:
+        header, fields = read_columns(path)
+        missing = [f for f in ("team", "level") if f not in fields]
+        if "year" not in fields and "date" not in fields:
+            missing.append("year")
+        if missing:
+            raise ValueError(f"{path.name}: no {', '.join(missing)} column")
+
+        # NumPy's C parser reads only the recognized columns, as fixed-width strings
+        dtype = [(field, NUMBER_DTYPE if field in NUMBER_FIELDS else FIELD_DTYPE) for field in fields]
+        with open_text(path) as f:
+            next(f, None)
+            while True:
+                lines = list(islice(f, chunk_rows))
+                if not lines:
+                    break
+                chunk = np.loadtxt(lines, dtype=dtype, delimiter=",", quotechar='"', comments=None,
+                                   usecols=list(fields.values()), ndmin=1)
+                del lines
+                totals.add_chunk({field: chunk[field] for field in fields}, player)
+    return totals
+
+
+def combine(vectors: list[np.ndarray]) -> np.ndarray:
+    """Roll up pitch-type accumulators (sums, and the max of VELO_MAX)."""
+    total = np.sum(vectors, axis=0)
+    total[VELO_MAX] = max(v[VELO_MAX] for v in vectors)
+    return total
+
+
+def pitch_type_rows(season: str, team: str, level: str, by_pitch: dict[str, np.ndarray]) -> list[dict]:
+    """Side-file rows for one group, most used pitch first."""
+    total = sum(v[N] for v in by_pitch.values())
+    rows = []
+    for pitch, v in sorted(by_pitch.items(), key=lambda item: (-item[1][N], item[0])):
+        velo = v[VELO_SUM] / v[VELO_N] if v[VELO_N] else None
+        spread = math.sqrt(max(v[VELO_SQ] / v[VELO_N] - velo ** 2, 0.0)) if v[VELO_N] else None
+        rows.append({
+            "Season": season,
+            "Team": team,
+            "Level": level,
+            "Pitch": pitch,
+            "N": int(v[N]),
+            "Pct": f"{v[N] / total * 100:.1f}",
+            "Velo": f"{velo:.1f}" if velo is not None else "-",
+            "MaxVelo": f"{v[VELO_MAX]:.1f}" if v[VELO_N] else "-",
+            "VeloSD": f"{spread:.1f}" if spread is not None else "-",
+            "Spin": f"{v[SPIN_SUM] / v[SPIN_N]:.0f}" if v[SPIN_N] else "-",
+        })
+    return rows
+
+
+def write_pitch_types(totals: PitchTotals, output: Path = PITCH_TYPES_FILE) -> int:
+    """
+    Write per-pitch-type summaries per team, per season and category, and per career.
+
+    Returns:
+        Number of rows written
+    """
+    teams = {}
+    for (key, pitch), vector in totals.pitches.items():
+        teams.setdefault(key, {})[pitch] = vector
+
+    output_rows = []
+    seasons = {}
+    careers = {}
+    for key in sorted(teams, key=lambda k: (k[0], LEVEL_RANK.get(k[2], len(LEVEL_RANK)), k[1])):
+        year, team, level = key
+        output_rows.extend(pitch_type_rows(year, team, level, teams[key]))
+        category = LEVEL_CATEGORY.get(level)
+        if category:
+            for pitch, vector in teams[key].items():
+                seasons.setdefault((year, category), {}).setdefault(pitch, []).append(vector)
+                careers.setdefault(category, {}).setdefault(pitch, []).append(vector)
+
+    for (year, category), by_pitch in sorted(seasons.items()):
+        output_rows.extend(pitch_type_rows(year, "-", category, {p: combine(v) for p, v in by_pitch.items()}))
+    for category in CATEGORIES:
+        if category in careers:
+            by_pitch = {p: combine(v) for p, v in careers[category].items()}
+            output_rows.extend(pitch_type_rows(f"{category} Career", "-", category, by_pitch))
+
+    with open(output, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=PITCH_TYPE_COLUMNS)
+        writer.writeheader()
+        writer.writerows(output_rows)
+    return len(output_rows)
+
+
+def write_synthetic_pitches(path: Path, rows: int, seed: int = 0, chunk_rows: int = CHUNK_ROWS) -> None:
+    """
+    Write a synthetic pitch export that joins onto the real bbref rows.
+
+    Pitches are spread over the bbref (year, team, level) rows in proportion
+    to batters faced, with the SYNTHETIC_MIX arsenal and batted-ball rates.
+    Written in chunks, so any row count fits in memory. Deterministic per seed.
+    """
+    rng = np.random.default_rng(seed)
+    groups = [r for r in read_bbref_stats() if r.bf > 0]
+    weights = np.array([r.bf for r in groups], dtype=float)
+    weights /= weights.sum()
+    group_years = np.array([r.year for r in groups])
+    group_teams = np.array([r.team for r in groups])
+    group_levels = np.array([r.level for r in groups])
+
+    pitch_names = np.array(list(SYNTHETIC_MIX))
+    shares, velo_mean, velo_sd, spin_mean, spin_sd = (np.array(col, dtype=float) for col in zip(*SYNTHETIC_MIX.values()))
+    batted_names = np.array(list(SYNTHETIC_BATTED))
+    batted_share, out_rate = (np.array(col) for col in zip(*SYNTHETIC_BATTED.values()))
+
+    with open_text_writer(path) as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(["Year", "Team", "Level", "Player", "pitch_type", "release_speed",
+                         "release_spin_rate", "events", "bb_type"])
+        written = 0
+        while written < rows:
+            n = min(chunk_rows, rows - written)
+            group = rng.choice(len(groups), size=n, p=weights)
+            pitch = rng.choice(len(pitch_names), size=n, p=shares / shares.sum())
+            velo = rng.normal(velo_mean[pitch], velo_sd[pitch])
+            spin = rng.normal(spin_mean[pitch], spin_sd[pitch])
+            in_play = rng.random(n) < SYNTHETIC_IN_PLAY
+            batted = rng.choice(len(batted_names), size=n, p=batted_share)
+            is_out = in_play & (rng.random(n) < out_rate[batted])
+
+            bb_type = np.where(in_play, batted_names[batted], "")
+            events = np.where(is_out, "field_out", np.where(in_play, "single", ""))
+            writer.writerows(zip(
+                group_years[group].tolist(),
+                group_teams[group].tolist(),
+                group_levels[group].tolist(),
+                [PLAYER_NAME] * n,
+                pitch_names[pitch].tolist(),
+                [f"{v:.1f}" for v in velo.tolist()],
+                [f"{s:.0f}" for s in spin.tolist()],
+                events.tolist(),
+                bb_type.tolist(),
+            ))
+            written += n
+
+
+def open_text_writer(path: Path):
+    """Open a CSV for writing, gzip-compressing .gz paths."""
+    if path.suffix == ".gz":
+        return gzip.open(path, "wt", newline="", encoding="utf-8")
+    return open(path, "w", newline="", encoding="utf-8")
+
+
+def print_summary(totals: PitchTotals) -> None:
+    """Per-group NP and GO/AO, as process_stats.py would join them."""
+    print(f"{'Year':<6}{'Team':<8}{'Level':<13}{'NP':>10}{'GO':>8}{'AO':>8}{'GO/AO':>7}")
+    for key, counts in sorted(totals.groups.items()):
+        ratio = f"{counts[GO] / counts[AO]:.2f}" if counts[AO] else "-"
+        print(f"{key[0]:<6}{key[1]:<8}{key[2]:<13}{counts[NP]:>10,}{counts[GO]:>8,}{counts[AO]:>8,}{ratio:>7}")
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is kilobytes on Linux, bytes on macOS
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def benchmark(rows: int, chunk_rows: int) -> None:
+    """Ingest a synthetic file of the given size and report throughput and peak memory."""
+    path = BENCHMARK_DIR / f"pitches-synthetic-{rows}.csv"
+    if not path.exists():
+        BENCHMARK_DIR.mkdir(parents=True, exist_ok=True)
+        start = time.perf_counter()
+        write_synthetic_pitches(path, rows)
+        print(f"Wrote {path} ({path.stat().st_size / 1024 / 1024:.0f} MB) in {time.perf_counter() - start:.1f}s")
+
+    baseline = peak_rss_mb()
+    start = time.perf_counter()
+    totals = ingest_pitches([path], chunk_rows)
+    elapsed = time.perf_counter() - start
+    print(f"Ingested {totals.rows:,} rows in {elapsed:.1f}s ({totals.rows / elapsed:,.0f} rows/s), "
+          f"chunk {chunk_rows:,} rows")
+    print(f"Peak RSS {peak_rss_mb():.0f} MB (before ingest {baseline:.0f} MB); "
+          f"{len(totals.groups)} groups, {len(totals.pitches)} pitch-type accumulators")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Aggregate pitch-level exports",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument("files", type=Path, nargs="*", help="Pitch exports (default: assets/documents/pitches/)")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS, help=f"Rows per chunk (default: {CHUNK_ROWS:,})")
+    parser.add_argument("--pitch-types", type=Path, help="Also write the per-pitch-type side file here")
+    parser.add_argument("--synthetic", type=Path, metavar="PATH", help="Write a synthetic export instead (.csv or .csv.gz)")
+    parser.add_argument("--rows", type=int, default=100_000, help="Rows for --synthetic (default: 100,000)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for --synthetic")
+    parser.add_argument("--benchmark", type=int, metavar="ROWS", help="Time ingesting a synthetic file of ROWS rows")
+    args = parser.parse_args()
+
+    if args.synthetic:
+        write_synthetic_pitches(args.synthetic, args.rows, args.seed, args.chunk_rows)
+        print(f"Wrote {args.rows:,} synthetic pitches to {args.synthetic}")
+        return
+    if args.benchmark:
+        benchmark(args.benchmark, args.chunk_rows)
+        return
+
+    files = args.files or find_pitch_files()
+    if not files:
+        print(f"No pitch exports given or found in {PITCHES_DIR}")
+        return
+    start = time.perf_counter()
+    totals = ingest_pitches(files, args.chunk_rows)
+    print(f"Read {totals.rows:,} rows ({totals.kept:,} for {PLAYER_NAME}) from {len(files)} file(s) "
+          f"in {time.perf_counter() - start:.1f}s\n")
+    print_summary(totals)
+    if args.pitch_types:
+        count = write_pitch_types(totals, args.pitch_types)
+        print(f"\nWrote {count} pitch-type rows to {args.pitch_types}")
+
+
+if __name__ == "__main__":
+    main()
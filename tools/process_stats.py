@@ -6,8 +6,31 @@ This script reads bbref_stats.csv and generates career_stats.csv with:
 - Individual team rows for level badge extraction
 - Career totals for each category
 - Level totals for minors (Rk+, A-, A+, AA, AAA)
+
+bbref has no holds, save opportunities, pitch counts or groundout/airout
+splits. Any CSV in assets/documents/supplemental/ (e.g. a MiLB export) can
+supply them. Each needs Year, Team and Level columns plus any of HLD, SVO,
+NP, GO and AO (common aliases such as Holds, Pitches and Airouts are accepted).
+Teams may be full names or TEAM_ABBREV codes, and levels bbref codes or site
+labels. Rows are indexed by (year, team, level) and joined onto the bbref rows
+in one pass. A Player column, if present, is filtered to PLAYER_NAME, so
+multi-player exports work as-is. Season, career and level rollups sum the
+counts, and GO/AO is computed from the summed GO and AO. A total is shown
+only when every row it covers has the value. Supplemental keys that match no
+bbref row are reported.
+
+Pitch-by-pitch exports in assets/documents/pitches/ are streamed through
+tools/process_pitches.py (needs NumPy). The NP, GO and AO counts derived from
+them fill whatever the supplemental files leave empty, and per-pitch-type
+summaries are written to pitch_types.csv.
+
+Usage:
+    python tools/process_stats.py
+    python tools/process_stats.py --supplemental path/to/exports/
+    python tools/process_stats.py --pitches path/to/pitch/exports/
 """
 
+import argparse
 import csv
 from pathlib import Path
 from collections import defaultdict
@@ -16,6 +39,11 @@ from typing import NamedTuple
 PROJECT_ROOT = Path(__file__).parent.parent
 INPUT_FILE = PROJECT_ROOT / "assets" / "documents" / "bbref_stats.csv"
 OUTPUT_FILE = PROJECT_ROOT / "assets" / "documents" / "career_stats.csv"
+SUPPLEMENTAL_DIR = PROJECT_ROOT / "assets" / "documents" / "supplemental"
+PITCHES_DIR = PROJECT_ROOT / "assets" / "documents" / "pitches"
+
+# Player whose rows are kept from multi-player supplemental exports
+PLAYER_NAME = "Josh Hejka"
 
 # Output columns (matching existing format)
 OUTPUT_COLUMNS = [
@@ -64,6 +92,26 @@ TEAM_ABBREV = {
     "Reading": "REA",
 }
 
+# Level spellings used by other sources -> our level labels
+LEVEL_ALIASES = {
+    "ROK": "Rk+",
+    "RK": "Rk+",
+    "RK+": "Rk+",
+    "SS-A": "A-",
+    "SHORT-SEASON A": "A-",
+    "HIGH-A": "A+",
+    "A (ADV)": "A+",
+}
+
+# Supplemental fields (StatsRow attribute) and the column names that supply them
+SUPPLEMENTAL_COLUMNS = {
+    "hld": ("HLD", "Holds", "HD"),
+    "svo": ("SVO", "SvOpp", "Save Opportunities"),
+    "np": ("NP", "Pit", "Pitches", "Pitch Count"),
+    "go": ("GO", "Groundouts"),
+    "ao": ("AO", "Airouts", "Flyouts"),
+}
+
 # Organization mappings
 ORG_MAP = {
     "NYM": "Mets",
@@ -105,6 +153,12 @@ class StatsRow(NamedTuple):
     hbp: int
     bf: int
     whip: float
+    # From supplemental sources; None when unknown
+    hld: int | None = None
+    svo: int | None = None
+    np: int | None = None
+    go: int | None = None
+    ao: int | None = None
 
 
 def parse_ip(ip_str: str) -> float:
@@ -172,6 +226,114 @@ def calculate_avg(h: int, bf: int, bb: int, hbp: int) -> str:
     return f".{int(avg * 1000):03d}"
 
 
+def normalize_text(value: str) -> str:
+    """Collapse whitespace (bbref uses non-breaking spaces) and uppercase."""
+    return " ".join((value or "").split()).upper()
+
+
+# Normalized full team name or code -> code
+TEAM_KEYS = {normalize_text(name): code for name, code in TEAM_ABBREV.items()}
+TEAM_KEYS.update({normalize_text(code): code for code in TEAM_ABBREV.values()})
+
+# Normalized bbref code, site label or alias -> site label
+LEVEL_KEYS = {normalize_text(code): label for code, label in LEVEL_MAP.items()}
+LEVEL_KEYS.update({normalize_text(label): label for label in LEVEL_MAP.values()})
+LEVEL_KEYS.update(LEVEL_ALIASES)
+
+
+def join_key(year: str, team: str, level: str) -> tuple[str, str, str]:
+    """Normalized (year, team code, level label) used to match rows across sources."""
+    team = normalize_text(team)
+    level = normalize_text(level)
+    return year.strip(), TEAM_KEYS.get(team, team), LEVEL_KEYS.get(level, level)
+
+
+def first_column(row: dict, names: tuple[str, ...]) -> str | None:
+    """Value of the first of several alternative column names present in a row."""
+    for name in names:
+        if name in row:
+            return row[name]
+    return None
+
+
+def read_supplemental(paths: list[Path], extra_sources: list[tuple[str, dict]] = ()) -> tuple[dict, list[str]]:
+    """
+    Index supplemental stat rows by join key.
+
+    Rows sharing a key within a file (split stints) are summed. When two
+    files supply the same field for a key, the first file wins and the
+    conflict is reported. extra_sources (name, key -> {field: value}), such
+    as counts derived from pitch-level data, are merged after the files.
+
+    Returns:
+        (key -> {field: value}, list of warnings)
+    """
+    index = {}
+    owners = {}
+    warnings = []
+    player = normalize_text(PLAYER_NAME)
+
+    def merge(source: str, source_values: dict) -> None:
+        for key, values in source_values.items():
+            entry = index.setdefault(key, {})
+            for attr, value in values.items():
+                if attr not in entry:
+                    entry[attr] = value
+                    owners[key, attr] = source
+                elif entry[attr] != value:
+                    warnings.append(f"{source}: {attr.upper()} for {' '.join(key)} is {value}, "
+                                    f"keeping {entry[attr]} from {owners[key, attr]}")
+
+    for path in paths:
+        file_values = defaultdict(dict)
+        with open(path, newline='') as f:
+            reader = csv.DictReader(f)
+            columns = reader.fieldnames or []
+            fields = {attr: names for attr, names in SUPPLEMENTAL_COLUMNS.items() if any(n in columns for n in names)}
+            if "GO/AO" in columns and not {"go", "ao"} <= fields.keys():
+                warnings.append(f"{path.name}: GO/AO ratios can't be summed across teams; provide GO and AO counts")
+            player_column = first_column({c: c for c in columns}, ("Player", "Name"))
+
+            for row in reader:
+                year = first_column(row, ("Year", "Season"))
+                if not year or not year.strip():
+                    continue
+                if player_column and normalize_text(row[player_column]) != player:
+                    continue
+                key = join_key(year, first_column(row, ("Team", "Tm")) or "", first_column(row, ("Level", "Lev")) or "")
+                for attr, names in fields.items():
+                    value = first_column(row, names)
+                    if value and value.strip() not in ("", "-"):
+                        file_values[key][attr] = file_values[key].get(attr, 0) + safe_int(value)
+
+        merge(path.name, file_values)
+
+    for source, source_values in extra_sources:
+        merge(source, source_values)
+
+    return index, warnings
+
+
+def join_supplemental(rows: list[StatsRow], index: dict) -> tuple[list[StatsRow], list[tuple]]:
+    """
+    Fill supplemental fields on bbref rows with one hash lookup per row.
+
+    Returns:
+        (joined rows, supplemental keys that matched no bbref row)
+    """
+    matched = set()
+    joined = []
+    for row in rows:
+        key = join_key(row.year, row.team, row.level)
+        values = index.get(key)
+        if values:
+            matched.add(key)
+            row = row._replace(**values)
+        joined.append(row)
+    unmatched = sorted(key for key in index if key not in matched)
+    return joined, unmatched
+
+
 def read_bbref_stats() -> list[StatsRow]:
     """Read and parse the bbref stats CSV."""
     rows = []
@@ -270,9 +432,29 @@ def aggregate_stats(rows: list[StatsRow]) -> StatsRow:
         hbp=total_hbp,
         bf=total_bf,
         whip=calculate_whip(total_h, total_bb, total_ip),
+        hld=sum_known(rows, "hld"),
+        svo=sum_known(rows, "svo"),
+        np=sum_known(rows, "np"),
+        go=sum_known(rows, "go"),
+        ao=sum_known(rows, "ao"),
     )
 
 
+def sum_known(rows: list[StatsRow], field: str) -> int | None:
+    """Sum a supplemental field, or None if any row lacks it (a partial total would mislead)."""
+    values = [getattr(r, field) for r in rows]
+    if any(v is None for v in values):
+        return None
+    return sum(values)
+
+
+def format_go_ao(go: int | None, ao: int | None) -> str:
+    """Groundout/airout ratio from counts."""
+    if go is None or not ao:
+        return "-"
+    return f"{go / ao:.2f}"
+
+
 def format_output_row(stats: StatsRow, team_override: str = None,
                       level_override: str = None, season_override: str = None,
                       org_override: str = None) -> dict:
@@ -295,30 +477,52 @@ def format_output_row(stats: StatsRow, team_override: str = None,
         "GS": stats.gs,
         "CG": stats.cg,
         "SHO": stats.sho,
-        "HLD": "-",  # Not in bbref data
+        "HLD": stats.hld if stats.hld is not None else "-",
         "SV": stats.sv if stats.sv else "-",
-        "SVO": "-",  # Not in bbref data
+        "SVO": stats.svo if stats.svo is not None else "-",
         "IP": format_ip(stats.ip),
         "H": stats.h,
         "R": stats.r,
         "ER": stats.er,
         "HR": stats.hr,
-        "NP": "-",  # Not in bbref data
+        "NP": stats.np if stats.np is not None else "-",
         "HB": stats.hbp,
         "BB": stats.bb,
         "IBB": stats.ibb,
         "SO": stats.so,
         "AVG": avg,
         "WHIP": f"{stats.whip:.2f}",
-        "GO/AO": "-",  # Not in bbref data
+        "GO/AO": format_go_ao(stats.go, stats.ao),
     }
 
 
-def process_stats():
+def process_stats(supplemental_dir: Path = SUPPLEMENTAL_DIR, pitches_dir: Path = PITCHES_DIR):
     """Main processing function."""
     all_rows = read_bbref_stats()
     output_rows = []
 
+    supplemental_files = sorted(supplemental_dir.glob("*.csv")) if supplemental_dir.is_dir() else []
+    extra_sources = []
+    pitch_files = sorted([*pitches_dir.glob("*.csv"), *pitches_dir.glob("*.csv.gz")]) if pitches_dir.is_dir() else []
+    if pitch_files:
+        # Needs NumPy; imported only when there is pitch data
+        from process_pitches import PITCH_TYPES_FILE, ingest_pitches, write_pitch_types
+
+        totals = ingest_pitches(pitch_files)
+        extra_sources.append(("pitch data", totals.counts()))
+        print(f"Read {totals.kept:,} pitches from {len(pitch_files)} pitch export(s); "
+              f"wrote {write_pitch_types(totals)} rows to {PITCH_TYPES_FILE}")
+
+    if supplemental_files or extra_sources:
+        index, warnings = read_supplemental(supplemental_files, extra_sources)
+        all_rows, unmatched = join_supplemental(all_rows, index)
+        for warning in warnings:
+            print(f"Warning: {warning}")
+        print(f"Joined {len(index) - len(unmatched)} of {len(index)} supplemental keys "
+              f"from {len(supplemental_files) + len(pitch_files)} file(s) onto {len(all_rows)} bbref rows")
+        for year, team, level in unmatched:
+            print(f"  Unmatched supplemental key: {year} {team} {level}")
+
     # Group by year and category
     year_category_groups = defaultdict(list)
     for row in all_rows:
@@ -398,4 +602,19 @@ def process_stats():
 
 
 if __name__ == "__main__":
-    process_stats()
+    parser = argparse.ArgumentParser(description="Build career_stats.csv from bbref and supplemental stats")
+    parser.add_argument(
+        "--supplemental",
+        type=Path,
+        default=SUPPLEMENTAL_DIR,
+        help="Directory of supplemental stat CSVs (default: assets/documents/supplemental)"
+    )
+    parser.add_argument(
+        "--pitches",
+        type=Path,
+        default=PITCHES_DIR,
+        help="Directory of pitch-level exports, .csv or .csv.gz (default: assets/documents/pitches)"
+    )
+    args = parser.parse_args()
+
+    process_stats(args.supplemental, args.pitches)
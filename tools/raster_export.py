@@ -0,0 +1,202 @@
+"""
+Shared raster export for the favicon and logo generators.
+
+Every favicon command produces the same set of files from one large source
+image. Instead of resizing the full source once per output, this module builds
+a downscale pyramid once (e.g. 512 -> 180 -> 32 -> 16), encodes each distinct
+size once, and writes every PNG and the ICO from that pyramid.
+
+Used by generate_favicon.py and generate_hedgertronic_logo.py.
+"""
+
+import io
+import math
+from pathlib import Path
+
+# Output filename -> pixel size for a favicon set
+FAVICON_SIZES = {
+    "favicon-16.png": 16,
+    "favicon-32.png": 32,
+    "favicon-180.png": 180,
+    "apple-touch-icon.png": 180,
+}
+
+# Sizes embedded in favicon.ico (first entry is the primary image)
+ICO_SIZES = (32, 16)
+
+# A level is only downscaled from a parent at least this many times larger.
+# Below 2x, LANCZOS has too few source pixels per output pixel and repeated
+# steps start to soften edges, so we fall back to the next larger level.
+MIN_STEP_RATIO = 2.0
+
+# With verify, a stepped level is kept only if it stays this close (PSNR, dB)
+# to a direct resize from the source; otherwise the direct resize replaces it
+MIN_PYRAMID_PSNR = 35.0
+
+
+def hex_to_rgb(hex_color: str) -> tuple:
+    """Convert a hex color string ("#ffa300" or "ffa300") to an (r, g, b) tuple."""
+    hex_color = hex_color.lstrip("#")
+    return tuple(int(hex_color[i:i + 2], 16) for i in (0, 2, 4))
+
+
+def composite_layers(layers, colors: dict):
+    """
+    Paint flat colors through alpha masks onto a transparent canvas.
+
+    Args:
+        layers: Sequence of (role, "L" mask) pairs in paint order, all the same size
+        colors: Mapping of role to (r, g, b)
+
+    Returns:
+        RGBA PIL image
+    """
+    from PIL import Image
+
+    size = layers[0][1].size
+    img = Image.new("RGBA", size, (0, 0, 0, 0))
+    for role, mask in layers:
+        img.paste((*colors[role], 255), (0, 0, *size), mask)
+    return img
+
+
+def build_pyramid(img, sizes) -> dict:
+    """
+    Build a progressive downscale pyramid from a square RGBA image.
+
+    Sizes are produced largest first. Each level is resized from the smallest
+    already-built level that is at least MIN_STEP_RATIO times its size,
+    falling back to the source image. Use verify_pyramid() to check the
+    stepped levels against direct resizes.
+
+    Args:
+        img: Square PIL image (the source, e.g. 512x512)
+        sizes: Iterable of target pixel sizes
+
+    Returns:
+        Mapping of pixel size to resized PIL image
+    """
+    from PIL import Image
+
+    pyramid = {}
+    for size in sorted(set(sizes), reverse=True):
+        if size == img.size[0]:
+            pyramid[size] = img
+            continue
+
+        parent = img
+        for built in sorted(pyramid, reverse=True):
+            if built >= size * MIN_STEP_RATIO:
+                parent = pyramid[built]
+
+        pyramid[size] = parent.resize((size, size), Image.LANCZOS)
+
+    return pyramid
+
+
+def verify_pyramid(img, pyramid: dict, min_psnr: float = MIN_PYRAMID_PSNR) -> dict:
+    """
+    Compare each level against a direct LANCZOS resize from the source.
+
+    This costs one full-source resize per level, which is what the pyramid
+    avoids, so it only runs when asked for (--verify). The dB per size is
+    printed, and a level below min_psnr is replaced by the direct resize.
+
+    Args:
+        img: Source image the pyramid was built from
+        pyramid: Mapping of pixel size to resized image (updated in place)
+        min_psnr: Minimum PSNR (dB) for a stepped level to be kept
+
+    Returns:
+        The pyramid
+    """
+    from PIL import Image
+
+    for size in sorted(pyramid, reverse=True):
+        if size == img.size[0]:
+            continue
+        direct = img.resize((size, size), Image.LANCZOS)
+        # Compare premultiplied, so colors under fully transparent pixels don't count
+        if img.mode == "RGBA":
+            quality = psnr(direct.convert("RGBa"), pyramid[size].convert("RGBa"))
+        else:
+            quality = psnr(direct, pyramid[size])
+        if quality < min_psnr:
+            pyramid[size] = direct
+            print(f"Pyramid {size}x{size}: {quality:.1f} dB vs direct resize, below "
+                  f"{min_psnr:.0f} dB; using the direct resize")
+        else:
+            print(f"Pyramid {size}x{size}: {quality:.1f} dB vs direct resize")
+    return pyramid
+
+
+def psnr(reference, candidate) -> float:
+    """Peak signal-to-noise ratio (dB) between two images of the same size and mode."""
+    from PIL import ImageChops, ImageStat
+
+    rms = ImageStat.Stat(ImageChops.difference(reference, candidate)).rms
+    mse = sum(band ** 2 for band in rms) / len(rms)
+    if mse == 0:
+        return math.inf
+    return 10 * math.log10(255 ** 2 / mse)
+
+
+def encode_png(img) -> bytes:
+    """Encode a PIL image as PNG bytes."""
+    buf = io.BytesIO()
+    img.save(buf, "PNG")
+    return buf.getvalue()
+
+
+def export_favicon_set(img, output_dir: Path, sizes: dict = None, ico_sizes: tuple = ICO_SIZES,
+                       verify: bool = False) -> dict:
+    """
+    Write a full favicon set (PNGs + ICO) from one source image.
+
+    Identical sizes (favicon-180.png and apple-touch-icon.png) are encoded
+    once and the same bytes are written to each file.
+
+    Args:
+        img: Square RGBA source image
+        output_dir: Directory to save favicon files
+        sizes: Output filename -> pixel size (default: FAVICON_SIZES)
+        ico_sizes: Sizes embedded in favicon.ico
+        verify: Check every pyramid level against a direct resize (verify_pyramid)
+
+    Returns:
+        Mapping of output filename to written bytes
+    """
+    sizes = sizes or FAVICON_SIZES
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    pyramid = build_pyramid(img, [*sizes.values(), *ico_sizes])
+    if verify:
+        verify_pyramid(img, pyramid)
+
+    encoded = {}
+    written = {}
+    for filename, size in sizes.items():
+        if size not in encoded:
+            encoded[size] = encode_png(pyramid[size])
+        output_path = output_dir / filename
+        output_path.write_bytes(encoded[size])
+        written[filename] = encoded[size]
+        print(f"Created {output_path} ({size}x{size})")
+
+    # ICO file (primary image plus the remaining sizes embedded)
+    ico_path = output_dir / "favicon.ico"
+    primary, *rest = ico_sizes
+    buf = io.BytesIO()
+    pyramid[primary].save(
+        buf,
+        format="ICO",
+        sizes=[(s, s) for s in ico_sizes],
+        append_images=[pyramid[s] for s in rest],
+    )
+    ico_path.write_bytes(buf.getvalue())
+    written[ico_path.name] = buf.getvalue()
+    embedded = " + ".join(f"{s}x{s}" for s in sorted(ico_sizes))
+    print(f"Created {ico_path} ({embedded} embedded)")
+
+    return written
@@ -0,0 +1,408 @@
+#!/usr/bin/env python3
+"""
+Long-running local render service for the resume PDF, OG card and favicons.
+
+Every generator in tools/ pays its startup cost on each run: importing fpdf
+and Pillow, parsing fonts, launching Chromium and decoding the headshot. This
+server pays it once and keeps the state warm between requests:
+
+- fpdf is imported, DM Sans is checked/downloaded and data/resume.json is
+  parsed once (fpdf still embeds the font per document, since it tracks
+  the glyph subset per PDF)
+- one headless Chromium page stays open, so the template's fonts and images
+  are already in its memory cache
+- decoded circular headshots and rasterized favicon/logo layers are reused
+
+Rendered bytes go into an in-memory LRU bounded by total size and keyed by a
+hash of the endpoint, its parameters and the (mtime, size) of every input
+file, so editing resume.json or a headshot invalidates naturally.
+
+Endpoints (parameters from the query string, or a JSON object in a POST body):
+
+    GET  /resume.pdf                 data/resume.json
+    POST /resume.pdf                 body is a resume.json object
+         ?fonts=0                    Helvetica instead of DM Sans
+    GET  /og.png                     OG card from data/site.json's profile
+         ?name=&bio=&headshot=       override profile fields (headshot: site path)
+    GET  /favicon.png                circular headshot favicon
+         ?source=&size=180           source: site path (default: profile headshot)
+         ?kind=text&text=JH&bg=&fg=&radius=0.2&stroke=0
+         ?kind=logo&bg=&body=&simplified=1
+    GET  /favicon.svg?kind=text|logo ...
+    GET  /stats                      cache and latency counters as JSON
+
+Each response carries X-Cache (hit/miss), X-Render-Ms and a Server-Timing
+header, and is logged with its latency. Endpoints whose dependencies are not
+installed (fpdf, playwright) answer 503; the others keep working.
+
+Requests are handled one at a time: Playwright's sync API is bound to the
+thread that started it, and renders are CPU-bound anyway.
+
+Usage:
+    python tools/render_server.py                 # http://localhost:8010
+    python tools/render_server.py --port 9000 --cache-mb 128
+    curl -o /tmp/og.png 'http://localhost:8010/og.png?bio=Testing'
+"""
+
+import argparse
+import functools
+import hashlib
+import io
+import json
+import time
+from collections import OrderedDict, deque
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from urllib.parse import parse_qsl, urlsplit
+
+from generate_favicon import cached_circular, render_text_favicon, text_favicon_svg
+from generate_hedgertronic_logo import hedgertronic_logo_svg, render_logo
+from generate_og_image import populate_template, render_screenshot
+
+try:
+    import generate_resume_pdf
+except ImportError:
+    generate_resume_pdf = None
+
+PROJECT_ROOT = Path(__file__).parent.parent
+SITE_JSON = PROJECT_ROOT / "data" / "site.json"
+RESUME_JSON = PROJECT_ROOT / "data" / "resume.json"
+OG_TEMPLATE = Path(__file__).parent / "og-template.html"
+FONT_PATH = PROJECT_ROOT / "assets" / "fonts" / "DMSans.ttf"
+
+DEFAULT_PORT = 8010
+DEFAULT_CACHE_MB = 64
+MAX_BODY_BYTES = 1 << 20
+MAX_FAVICON_SIZE = 512
+
+# Recent render times kept per endpoint for /stats
+LATENCY_WINDOW = 256
+
+CONTENT_TYPES = {"pdf": "application/pdf", "png": "image/png", "svg": "image/svg+xml"}
+
+
+class Unavailable(Exception):
+    """An endpoint's optional dependency is not installed."""
+
+
+class RenderCache:
+    """LRU of rendered bytes keyed by input hash, bounded by total size."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> bytes | None:
+        body = self.entries.get(key)
+        if body is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return body
+
+    def put(self, key: str, body: bytes) -> None:
+        if len(body) > self.max_bytes:
+            return
+        old = self.entries.pop(key, None)
+        if old is not None:
+            self.size -= len(old)
+        self.entries[key] = body
+        self.size += len(body)
+        while self.size > self.max_bytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.size -= len(evicted)
+            self.evictions += 1
+
+
+def file_stamp(path: Path) -> list:
+    """(path, mtime, size) of an input file, so edits change the cache key."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return [str(path), None, None]
+    return [str(path), stat.st_mtime_ns, stat.st_size]
+
+
+def site_file(rel: str) -> Path:
+    """Resolve a site path like /assets/images/headshot/a.jpg?v=1 inside the project."""
+    path = (PROJECT_ROOT / rel.split("?")[0].lstrip("/")).resolve()
+    if PROJECT_ROOT.resolve() not in path.parents or not path.is_file():
+        raise ValueError(f"not a project file: {rel}")
+    return path
+
+
+def flag(value) -> bool:
+    return str(value).lower() in ("1", "true", "yes", "on")
+
+
+class Renderers:
+    """Warm render state shared by every request."""
+
+    def __init__(self):
+        self.playwright = None
+        self.page = None
+        self.use_custom_fonts = False
+        if generate_resume_pdf is not None:
+            self.use_custom_fonts = generate_resume_pdf.ensure_fonts()
+
+    @property
+    def profile(self) -> dict:
+        return self.load_profile(*file_stamp(SITE_JSON)[1:])
+
+    @functools.lru_cache(maxsize=4)
+    def load_profile(self, mtime: int, size: int) -> dict:
+        """Profile from site.json, re-read only when its stamp changes."""
+        with open(SITE_JSON, "r") as f:
+            return json.load(f)["profile"]
+
+    def close(self) -> None:
+        if self.playwright is not None:
+            self.playwright.stop()
+
+    def inputs(self, kind: str, params: dict, body: dict | None) -> list:
+        """Input files a render depends on (their stamps go into the cache key)."""
+        if kind == "resume":
+            files = [FONT_PATH] if self.use_custom_fonts else []
+            return [file_stamp(path) for path in files + ([] if body else [RESUME_JSON])]
+        if kind == "og":
+            headshot = site_file(params.get("headshot", self.profile["headshot"]))
+            return [file_stamp(OG_TEMPLATE), file_stamp(SITE_JSON), file_stamp(headshot)]
+        if params.get("kind", "headshot") == "headshot":
+            source = site_file(params.get("source", self.profile["headshot"]))
+            return [file_stamp(SITE_JSON), file_stamp(source)]
+        return [file_stamp(FONT_PATH)]
+
+    def resume(self, params: dict, body: dict | None) -> tuple[bytes, str]:
+        if generate_resume_pdf is None:
+            raise Unavailable("fpdf is not installed (pip install fpdf2)")
+        resume = body or self.load_resume(*file_stamp(RESUME_JSON)[1:])
+        fonts = self.use_custom_fonts and flag(params.get("fonts", "1"))
+        return generate_resume_pdf.render_pdf(resume, use_custom_fonts=fonts), "pdf"
+
+    @functools.lru_cache(maxsize=4)
+    def load_resume(self, mtime: int, size: int) -> dict:
+        """Parsed resume.json, re-read only when its stamp changes."""
+        return generate_resume_pdf.load_resume()
+
+    def og(self, params: dict, body: dict | None) -> tuple[bytes, str]:
+        profile = {**self.profile, **{k: params[k] for k in ("name", "bio", "headshot") if k in params}}
+        page = self.og_page()
+        html = populate_template(OG_TEMPLATE, profile, PROJECT_ROOT)
+        # Fonts and images are already in the warm page's cache; no fixed settle wait
+        return render_screenshot(html, page=page, settle_ms=0), "png"
+
+    def og_page(self):
+        """Launch Chromium and open the 1200x630 page on first use."""
+        if self.page is None:
+            try:
+                from playwright.sync_api import sync_playwright
+            except ImportError:
+                raise Unavailable("playwright is not installed (pip install playwright && playwright install chromium)")
+            self.playwright = sync_playwright().start()
+            browser = self.playwright.chromium.launch()
+            self.page = browser.new_page(viewport={"width": 1200, "height": 630})
+        return self.page
+
+    def favicon(self, params: dict, body: dict | None, fmt: str) -> tuple[bytes, str]:
+        from PIL import Image
+
+        kind = params.get("kind", "headshot")
+        size = int(params.get("size", 180))
+        if not 1 <= size <= MAX_FAVICON_SIZE:
+            raise ValueError(f"size must be 1-{MAX_FAVICON_SIZE}")
+
+        if kind == "text":
+            options = (params.get("text", "JH"), FONT_PATH, params.get("bg", "#0a0e1a"), params.get("fg", "#ffffff"),
+                       float(params.get("radius", 0.2)), float(params.get("stroke", 0.0)))
+            if fmt == "svg":
+                return text_favicon_svg(*options).encode(), "svg"
+            img = render_text_favicon(*options)
+        elif kind == "logo":
+            options = (params.get("bg", "#FFA300"), params.get("body", "#0a0a0a"), flag(params.get("simplified", "0")))
+            if fmt == "svg":
+                return hedgertronic_logo_svg(*options).encode(), "svg"
+            img = render_logo(*options)
+        elif kind == "headshot":
+            if fmt == "svg":
+                raise ValueError("headshot favicons are PNG only")
+            source = site_file(params.get("source", self.profile["headshot"]))
+            img = self.circular(source, *file_stamp(source)[1:])
+        else:
+            raise ValueError(f"unknown favicon kind: {kind}")
+
+        if img.size != (size, size):
+            img = img.resize((size, size), Image.LANCZOS)
+        buf = io.BytesIO()
+        img.save(buf, "PNG", optimize=True)
+        return buf.getvalue(), "png"
+
+    @functools.lru_cache(maxsize=8)
+    def circular(self, source: Path, mtime: int, size: int):
+        """Decoded, circle-masked headshot at the working size, kept per file version."""
+        return cached_circular(source)
+
+
+class RenderRequestHandler(BaseHTTPRequestHandler):
+    """Routes render requests through the cache and records latency."""
+
+    renderers: Renderers = None
+    cache: RenderCache = None
+    latencies: dict = None
+
+    ROUTES = {
+        "/resume.pdf": "resume",
+        "/og.png": "og",
+        "/favicon.png": "favicon",
+        "/favicon.svg": "favicon",
+    }
+
+    def do_GET(self):
+        self.handle_render(body=None)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_BODY_BYTES:
+            self.send_plain(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "body too large")
+            return
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError as e:
+            self.send_plain(HTTPStatus.BAD_REQUEST, f"invalid JSON: {e}")
+            return
+        self.handle_render(body=body if isinstance(body, dict) else None)
+
+    def handle_render(self, body: dict | None) -> None:
+        start = time.perf_counter()
+        url = urlsplit(self.path)
+        if url.path == "/stats":
+            self.send_bytes(HTTPStatus.OK, json.dumps(self.stats(), indent=2).encode(), "application/json")
+            return
+
+        kind = self.ROUTES.get(url.path)
+        if kind is None:
+            self.send_plain(HTTPStatus.NOT_FOUND, f"unknown endpoint: {url.path}")
+            return
+
+        params = dict(parse_qsl(url.query))
+        # Resume bodies are the resume itself; other endpoints take parameters
+        if body and kind != "resume":
+            params.update({k: str(v) for k, v in body.items()})
+            body = None
+        fmt = url.path.rsplit(".", 1)[1]
+
+        try:
+            key_data = {"path": url.path, "params": params, "body": body,
+                        "inputs": self.renderers.inputs(kind, params, body)}
+            key = hashlib.sha256(json.dumps(key_data, sort_keys=True).encode()).hexdigest()
+
+            data = self.cache.get(key)
+            hit = data is not None
+            if not hit:
+                render = getattr(self.renderers, kind)
+                data, fmt = render(params, body, fmt) if kind == "favicon" else render(params, body)
+                self.cache.put(key, data)
+        except Unavailable as e:
+            self.send_plain(HTTPStatus.SERVICE_UNAVAILABLE, str(e))
+            return
+        except (ValueError, KeyError, OSError) as e:
+            self.send_plain(HTTPStatus.BAD_REQUEST, f"{type(e).__name__}: {e}")
+            return
+
+        elapsed = (time.perf_counter() - start) * 1000
+        self.latencies.setdefault(kind, {"hit": deque(maxlen=LATENCY_WINDOW), "miss": deque(maxlen=LATENCY_WINDOW)})
+        self.latencies[kind]["hit" if hit else "miss"].append(elapsed)
+
+        self.send_bytes(HTTPStatus.OK, data, CONTENT_TYPES[fmt], {
+            "ETag": f'"{key[:16]}"',
+            "X-Cache": "hit" if hit else "miss",
+            "X-Render-Ms": f"{elapsed:.1f}",
+            "Server-Timing": f'render;dur={elapsed:.1f};desc="{"cache hit" if hit else "render"}"',
+        })
+        print(f"{kind:<8} {'hit ' if hit else 'miss'} {len(data):>9,}B {elapsed:8.1f}ms  {url.path}{'?' + url.query if url.query else ''}")
+
+    def stats(self) -> dict:
+        """Cache counters and latency percentiles per endpoint and hit/miss."""
+        def summary(samples):
+            ordered = sorted(samples)
+            if not ordered:
+                return None
+            pick = lambda q: round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 1)
+            return {"count": len(ordered), "p50_ms": pick(0.5), "p95_ms": pick(0.95), "max_ms": round(ordered[-1], 1)}
+
+        return {
+            "cache": {
+                "entries": len(self.cache.entries),
+                "bytes": self.cache.size,
+                "max_bytes": self.cache.max_bytes,
+                "hits": self.cache.hits,
+                "misses": self.cache.misses,
+                "evictions": self.cache.evictions,
+            },
+            "latency": {
+                kind: {outcome: summary(samples) for outcome, samples in outcomes.items()}
+                for kind, outcomes in self.latencies.items()
+            },
+        }
+
+    def send_bytes(self, status: int, data: bytes, content_type: str, headers: dict = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Cache-Control", "no-cache")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(data)
+
+    def send_plain(self, status: int, message: str) -> None:
+        self.send_bytes(status, (message + "\n").encode(), "text/plain; charset=utf-8")
+        print(f"{int(status)} {self.command} {self.path}: {message}")
+
+    def log_message(self, format, *args):
+        # Requests are logged by handle_render()
+        pass
+
+
+def run_server(port: int, cache_mb: int) -> None:
+    """Warm the renderers and serve until interrupted."""
+    start = time.perf_counter()
+    renderers = Renderers()
+    handler = type("Handler", (RenderRequestHandler,), {
+        "renderers": renderers,
+        "cache": RenderCache(cache_mb * 1024 * 1024),
+        "latencies": {},
+    })
+
+    server = HTTPServer(("127.0.0.1", port), handler)
+    print(f"Render service at http://localhost:{port}/ (warmed in {(time.perf_counter() - start) * 1000:.0f}ms)")
+    print(f"resume.pdf: {'ok' if generate_resume_pdf else 'unavailable (fpdf missing)'}; "
+          f"og.png: Chromium starts on first request; cache {cache_mb} MB")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        cache = handler.cache
+        print(f"\nCache: {cache.hits} hits, {cache.misses} misses, {cache.size / 1024:.0f} KB held")
+    finally:
+        server.server_close()
+        renderers.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Serve resume, OG card and favicon renders from warm state",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument("-p", "--port", type=int, default=DEFAULT_PORT, help=f"Port (default: {DEFAULT_PORT})")
+    parser.add_argument("--cache-mb", type=int, default=DEFAULT_CACHE_MB,
+                        help=f"Render cache size in MB (default: {DEFAULT_CACHE_MB})")
+    args = parser.parse_args()
+
+    run_server(args.port, args.cache_mb)
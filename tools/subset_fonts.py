@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+"""
+Subset the self-hosted web fonts to the glyphs the site actually shows.
+
+Every string the pages can display is known at build time: the text of
+index.html and resume/index.html, string literals in script.js and
+resume/script.js, CSS content: values in styles.css, and every string in
+data/*.json. This script collects those code points and, for each family in
+FONTS, writes two WOFF2 files to assets/fonts/subsets/:
+
+- <name>-core.woff2: printable ASCII (always, since script.js formats dates
+  and numbers at runtime) plus the Latin-1 and punctuation characters the
+  content uses
+- <name>-extra.woff2: any other used characters the font covers (arrows,
+  accented letters outside Latin-1, symbols), only when there are some
+
+Variable fonts are also clipped to the weight range styles.css declares.
+The @font-face rules in styles.css are rewritten between font-subsets
+markers, one rule per file with a unicode-range, so a page that uses no
+rare characters never downloads the extra file.
+
+assets/fonts/subsets/manifest.json records each family's source hash and
+covered code points. A family is only re-subset when its source font
+changes or the content uses a character the current subset lacks; removing
+text leaves the files alone.
+
+Usage:
+    python tools/subset_fonts.py            # subset changed families, rewrite styles.css
+    python tools/subset_fonts.py --force    # re-subset every family
+    python tools/subset_fonts.py --remove   # back to the full fonts
+"""
+
+import argparse
+import hashlib
+import html
+import io
+import json
+import re
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+FONTS_DIR = PROJECT_ROOT / "assets" / "fonts"
+SUBSET_DIR = FONTS_DIR / "subsets"
+MANIFEST_PATH = SUBSET_DIR / "manifest.json"
+STYLES_CSS = PROJECT_ROOT / "styles.css"
+
+# Family -> full font file and the weight range styles.css declares
+FONTS = {
+    "DM Sans": {"file": "DMSans.woff2", "weight": (400, 700)},
+    "JetBrains Mono": {"file": "JetBrainsMono.woff2", "weight": (400, 500)},
+    "Instrument Serif": {"file": "InstrumentSerif.woff2", "weight": (400, 400)},
+}
+
+# Files whose text can end up on screen
+HTML_SOURCES = ["index.html", "resume/index.html"]
+JS_SOURCES = ["script.js", "resume/script.js"]
+DATA_SOURCES = ["data/*.json"]
+
+# Generated data files that hold paths and hashes, not display text
+SKIP_DATA = re.compile(r"^(site-data\.[0-9a-f]+|asset-manifest|image-manifest|placeholders)\.json$")
+
+# Always in the core file, used or not
+ASCII = set(range(0x20, 0x7F))
+
+# Characters from these ranges go in the core file when used; anything else
+# used goes in the extra file
+CORE_RANGES = [(0x00A0, 0x00FF), (0x2010, 0x2027), (0x2032, 0x203A)]
+
+# Bump to re-subset every family when the subsetting settings change
+SUBSET_VERSION = 1
+
+MARKER_START = "/* font-subsets:start */"
+MARKER_END = "/* font-subsets:end */"
+
+FONT_FACE = re.compile(r"@font-face\s*\{[^}]*\}\n*")
+
+JS_TOKEN = re.compile(
+    r"""(?P<comment>//[^\n]*|/\*.*?\*/)"""
+    r"""|(?P<string>'(?:\\.|[^'\\\n])*'|"(?:\\.|[^"\\\n])*"|`(?:\\.|[^`\\])*`)""",
+    re.DOTALL,
+)
+JS_ESCAPE = re.compile(r"\\u\{([0-9a-fA-F]+)\}|\\u([0-9a-fA-F]{4})|\\x([0-9a-fA-F]{2})")
+HTML_SKIP = re.compile(r"<(script|style)\b[^>]*>.*?</\1>", re.DOTALL | re.IGNORECASE)
+HTML_TAG = re.compile(r"<[^>]*>")
+HTML_TEXT_ATTR = re.compile(r'\b(?:alt|title|aria-label|placeholder)="([^"]*)"', re.IGNORECASE)
+CSS_CONTENT = re.compile(r"""content:\s*(["'])(.*?)\1""")
+CSS_ESCAPE = re.compile(r"\\([0-9a-fA-F]{1,6})\s?")
+
+
+# =============================================================================
+# Text collection
+# =============================================================================
+
+def html_text(source: str) -> str:
+    """Visible text and text attributes of an HTML page."""
+    page = HTML_SKIP.sub(" ", source)
+    attributes = " ".join(HTML_TEXT_ATTR.findall(page))
+    return html.unescape(HTML_TAG.sub(" ", page) + " " + attributes)
+
+
+def js_strings(source: str) -> str:
+    """String and template literals of a script, with escapes and entities decoded."""
+    strings = [m.group("string")[1:-1] for m in JS_TOKEN.finditer(source) if m.group("string")]
+    text = " ".join(strings)
+    text = JS_ESCAPE.sub(lambda m: chr(int(next(g for g in m.groups() if g), 16)), text)
+    return html.unescape(text)
+
+
+def json_strings(value) -> list[str]:
+    """Every string (keys included) in a parsed JSON value."""
+    if isinstance(value, str):
+        return [html.unescape(value)]
+    if isinstance(value, dict):
+        return [s for k, v in value.items() for s in (k, *json_strings(v))]
+    if isinstance(value, list):
+        return [s for item in value for s in json_strings(item)]
+    return []
+
+
+def css_content(source: str) -> str:
+    """Generated-content strings in a stylesheet."""
+    return " ".join(
+        CSS_ESCAPE.sub(lambda m: chr(int(m.group(1), 16)), value)
+        for _, value in CSS_CONTENT.findall(source)
+    )
+
+
+def used_codepoints() -> dict[str, set[int]]:
+    """
+    Code points the site can display, by source file.
+
+    Returns:
+        Mapping of project-relative path to the code points found in it
+    """
+    found = {}
+
+    def add(path: Path, text: str):
+        found[path.relative_to(PROJECT_ROOT).as_posix()] = {ord(c) for c in text if c.isprintable()}
+
+    for pattern in HTML_SOURCES:
+        for path in sorted(PROJECT_ROOT.glob(pattern)):
+            add(path, html_text(path.read_text()))
+    for pattern in JS_SOURCES:
+        for path in sorted(PROJECT_ROOT.glob(pattern)):
+            add(path, js_strings(path.read_text()))
+    for pattern in DATA_SOURCES:
+        for path in sorted(PROJECT_ROOT.glob(pattern)):
+            if not SKIP_DATA.match(path.name):
+                with open(path, "r") as f:
+                    add(path, " ".join(json_strings(json.load(f))))
+    add(STYLES_CSS, css_content(STYLES_CSS.read_text()))
+    return found
+
+
+def is_core(codepoint: int) -> bool:
+    return codepoint in ASCII or any(low <= codepoint <= high for low, high in CORE_RANGES)
+
+
+def unicode_range(codepoints) -> str:
+    """Compact unicode-range value, e.g. "U+20-7E, U+A9, U+2013-2014"."""
+    ranges = []
+    for cp in sorted(codepoints):
+        if ranges and cp == ranges[-1][1] + 1:
+            ranges[-1][1] = cp
+        else:
+            ranges.append([cp, cp])
+    return ", ".join(f"U+{low:X}" if low == high else f"U+{low:X}-{high:X}" for low, high in ranges)
+
+
+def parse_unicode_range(value: str) -> set[int]:
+    """Inverse of unicode_range()."""
+    codepoints = set()
+    for part in filter(None, (p.strip() for p in value.split(","))):
+        low, _, high = part[2:].partition("-")
+        codepoints.update(range(int(low, 16), int(high or low, 16) + 1))
+    return codepoints
+
+
+# =============================================================================
+# Subsetting
+# =============================================================================
+
+def file_hash(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()[:16]
+
+
+def subset_font(source: Path, codepoints: set[int], weight: tuple[int, int]) -> bytes:
+    """
+    Subset one font to the given code points as WOFF2.
+
+    Keeps every OpenType layout feature (kerning, ligatures, tabular figures)
+    for the glyphs that remain, and clips a variable weight axis to `weight`.
+    """
+    from fontTools import subset
+    from fontTools.ttLib import TTFont
+
+    font = TTFont(source)
+    # Keep head.modified from the source so output only changes with input
+    font.recalcTimestamp = False
+
+    if "fvar" in font and any(axis.axisTag == "wght" for axis in font["fvar"].axes):
+        from fontTools.varLib import instancer
+
+        low, high = weight
+        limited = instancer.instantiateVariableFont(font, {"wght": (low, high) if low != high else low})
+        # Reload so the subsetter sees fully compiled tables
+        buffer = io.BytesIO()
+        limited.save(buffer)
+        buffer.seek(0)
+        font = TTFont(buffer, recalcTimestamp=False)
+
+    options = subset.Options()
+    options.flavor = "woff2"
+    options.layout_features = ["*"]
+    options.name_IDs = ["*"]
+    options.notdef_outline = True
+
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=codepoints)
+    subsetter.subset(font)
+
+    buffer = io.BytesIO()
+    font.flavor = "woff2"
+    font.save(buffer)
+    return buffer.getvalue()
+
+
+def font_cmap(source: Path) -> set[int]:
+    from fontTools.ttLib import TTFont
+
+    return set(TTFont(source, lazy=True).getBestCmap())
+
+
+def stem(family: str) -> str:
+    return Path(FONTS[family]["file"]).stem
+
+
+def subset_family(family: str, used: set[int]) -> dict:
+    """
+    Write the core (and extra) subset of one family.
+
+    Returns:
+        Manifest entry: source hash, version and each file's range and size
+    """
+    source = FONTS_DIR / FONTS[family]["file"]
+    covered = font_cmap(source)
+    core = (ASCII | {cp for cp in used if is_core(cp)}) & covered
+    extra = {cp for cp in used if not is_core(cp)} & covered
+
+    files = {}
+    for part, codepoints in (("core", core), ("extra", extra)):
+        if not codepoints:
+            continue
+        data = subset_font(source, codepoints, FONTS[family]["weight"])
+        path = SUBSET_DIR / f"{stem(family)}-{part}.woff2"
+        path.write_bytes(data)
+        files[part] = {"range": unicode_range(codepoints), "bytes": len(data)}
+
+    return {"source": file_hash(source), "version": SUBSET_VERSION, "files": files}
+
+
+def needs_subset(entry: dict | None, family: str, used: set[int]) -> str | None:
+    """Reason a family has to be re-subset, or None if its files still cover the content."""
+    if entry is None:
+        return "new"
+    if entry.get("version") != SUBSET_VERSION:
+        return "settings changed"
+    if entry.get("source") != file_hash(FONTS_DIR / FONTS[family]["file"]):
+        return "source font changed"
+    for part in entry["files"]:
+        if not (SUBSET_DIR / f"{stem(family)}-{part}.woff2").exists():
+            return f"{part} file missing"
+
+    have = set().union(*(parse_unicode_range(f["range"]) for f in entry["files"].values()))
+    new = (used & font_cmap(FONTS_DIR / FONTS[family]["file"])) - have
+    if new:
+        return f"new glyphs {''.join(sorted(chr(cp) for cp in new))!r}"
+    return None
+
+
+# =============================================================================
+# styles.css
+# =============================================================================
+
+def font_face(family: str, src: str, unicode_range_value: str = None) -> str:
+    low, high = FONTS[family]["weight"]
+    lines = [
+        "@font-face {",
+        f"    font-family: '{family}';",
+        "    font-style: normal;",
+        f"    font-weight: {low if low == high else f'{low} {high}'};",
+        "    font-display: swap;",
+        f"    src: url('{src}') format('woff2');",
+    ]
+    if unicode_range_value:
+        lines.append(f"    unicode-range: {unicode_range_value};")
+    lines.append("}")
+    return "\n".join(lines)
+
+
+def subset_rules(manifest: dict) -> str:
+    rules = []
+    for family in FONTS:
+        for part, entry in manifest[family]["files"].items():
+            src = "/" + (SUBSET_DIR / f"{stem(family)}-{part}.woff2").relative_to(PROJECT_ROOT).as_posix()
+            rules.append(font_face(family, src, entry["range"]))
+    return "\n\n".join(rules)
+
+
+def full_rules() -> str:
+    return "\n\n".join(
+        font_face(family, "/" + (FONTS_DIR / spec["file"]).relative_to(PROJECT_ROOT).as_posix())
+        for family, spec in FONTS.items()
+    )
+
+
+def replace_font_faces(css: str, rules: str, marked: bool = True) -> str:
+    """
+    Swap the @font-face rules in styles.css for `rules`.
+
+    Replaces the marked block if present, otherwise the run of @font-face
+    rules from the first to the last.
+    """
+    block = f"{MARKER_START}\n{rules}\n{MARKER_END}\n\n" if marked else f"{rules}\n\n"
+    pattern = re.compile(re.escape(MARKER_START) + r".*?" + re.escape(MARKER_END) + r"\n*", re.DOTALL)
+    if pattern.search(css):
+        return pattern.sub(lambda _: block, css, count=1)
+
+    faces = list(FONT_FACE.finditer(css))
+    if not faces:
+        raise ValueError(f"No @font-face rules found in {STYLES_CSS.name}")
+    return css[:faces[0].start()] + block + css[faces[-1].end():]
+
+
+def write_css(css: str) -> None:
+    """Write styles.css unless only the ?v= fingerprints from fingerprint_assets.py differ."""
+    unversioned = re.compile(r"\?v=[\w.-]*")
+    if unversioned.sub("", css) != unversioned.sub("", STYLES_CSS.read_text()):
+        STYLES_CSS.write_text(css)
+        print(f"Updated @font-face rules in {STYLES_CSS}")
+
+
+# =============================================================================
+# Main
+# =============================================================================
+
+def subset_fonts(force: bool = False) -> None:
+    """Re-subset families whose content gained glyphs, rewrite styles.css and report sizes."""
+    by_file = used_codepoints()
+    used = set().union(*by_file.values())
+    print(f"Collected {len(used)} distinct characters from {len(by_file)} files "
+          f"({len(used - ASCII)} outside ASCII)")
+
+    previous = {}
+    if MANIFEST_PATH.exists():
+        with open(MANIFEST_PATH, "r") as f:
+            previous = json.load(f)
+
+    SUBSET_DIR.mkdir(parents=True, exist_ok=True)
+    manifest = {}
+    for family in FONTS:
+        reason = "forced" if force else needs_subset(previous.get(family), family, used)
+        if reason is None:
+            manifest[family] = previous[family]
+            print(f"{family:<18} unchanged, skipped")
+            continue
+        manifest[family] = subset_family(family, used)
+        print(f"{family:<18} subset ({reason})")
+
+    # Files of parts that are no longer produced
+    keep = {f"{stem(family)}-{part}.woff2" for family in FONTS for part in manifest[family]["files"]}
+    for stale in SUBSET_DIR.glob("*.woff2"):
+        if stale.name not in keep:
+            stale.unlink()
+            print(f"Removed {stale.name}")
+
+    MANIFEST_PATH.write_text(json.dumps(manifest, indent=2) + "\n")
+    write_css(replace_font_faces(STYLES_CSS.read_text(), subset_rules(manifest)))
+
+    print(f"\n{'Family':<18} {'Full':>8} {'Core':>8} {'Extra':>8} {'Saved':>8}  Extra glyphs")
+    total_full = total_core = total_extra = 0
+    for family, entry in manifest.items():
+        full = (FONTS_DIR / FONTS[family]["file"]).stat().st_size
+        core = entry["files"]["core"]["bytes"]
+        extra_entry = entry["files"].get("extra")
+        extra = extra_entry["bytes"] if extra_entry else 0
+        glyphs = "".join(chr(cp) for cp in sorted(parse_unicode_range(extra_entry["range"]))) if extra_entry else ""
+        print(f"{family:<18} {full:>8,} {core:>8,} {extra:>8,} {1 - (core + extra) / full:>8.0%}  {glyphs}")
+        total_full, total_core, total_extra = total_full + full, total_core + core, total_extra + extra
+    print(f"{'Total':<18} {total_full:>8,} {total_core:>8,} {total_extra:>8,} "
+          f"{1 - (total_core + total_extra) / total_full:>8.0%}")
+    print(f"\nA page using only core characters downloads {total_core:,} of {total_full:,} font bytes")
+
+
+def remove_subsets() -> None:
+    """Point styles.css back at the full fonts and delete the subsets."""
+    write_css(replace_font_faces(STYLES_CSS.read_text(), full_rules(), marked=False))
+    if SUBSET_DIR.exists():
+        for path in SUBSET_DIR.iterdir():
+            path.unlink()
+        SUBSET_DIR.rmdir()
+        print(f"Removed {SUBSET_DIR}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Subset the web fonts to the characters the site uses",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument("--force", action="store_true", help="Re-subset every family even if it covers the content")
+    parser.add_argument("--remove", action="store_true", help="Restore the full fonts in styles.css")
+    args = parser.parse_args()
+
+    if args.remove:
+        remove_subsets()
+    else:
+        subset_fonts(args.force)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+Shared SVG export for the logo and text favicon generators.
+
+Builds small, self-contained SVG documents from the same parameters the PIL
+renderers use. Text is converted to outlined paths from the TTF (via
+fontTools), so the SVG has no font dependency.
+
+Optional dependencies:
+    fonttools  - required for any SVG containing text
+    cairosvg   - rasterizes the SVG for PNG/ICO fallbacks; without it the
+                 caller's PIL render is used instead
+"""
+
+from pathlib import Path
+
+from raster_export import export_favicon_set
+
+# Files in the modern favicon set (favicon.svg is written alongside these)
+MODERN_FAVICON_SIZES = {
+    "apple-touch-icon.png": 180,
+}
+MODERN_ICO_SIZES = (32,)
+
+
+def hex_to_svg(hex_color: str) -> str:
+    """Normalize a hex color to lowercase #rrggbb."""
+    return "#" + hex_color.lstrip("#").lower()
+
+
+def rgb_to_svg(rgb: tuple) -> str:
+    """Convert an (r, g, b) tuple to #rrggbb."""
+    return "#{:02x}{:02x}{:02x}".format(*rgb[:3])
+
+
+def fmt(value: float) -> str:
+    """Format a coordinate with at most two decimals and no trailing zeros."""
+    text = f"{value:.2f}".rstrip("0").rstrip(".")
+    return "0" if text == "-0" else text
+
+
+def text_outline(text: str, font_path: Path, font_size: float) -> dict:
+    """
+    Convert a string to an SVG path using the font's glyph outlines.
+
+    Coordinates are in pixels with the pen origin at (0, 0) on the baseline
+    and y pointing down, matching PIL's drawing space. Kerning is not applied.
+
+    Args:
+        text: Text to outline
+        font_path: Path to the TTF font file
+        font_size: Font size in pixels
+
+    Returns:
+        Dict with the path data ("d"), ink bounds ("bbox" as x0, y0, x1, y1)
+        and the scaled ascender ("ascent")
+    """
+    from fontTools.pens.boundsPen import BoundsPen
+    from fontTools.pens.svgPathPen import SVGPathPen
+    from fontTools.pens.transformPen import TransformPen
+    from fontTools.ttLib import TTFont
+
+    font = TTFont(str(font_path))
+    glyph_set = font.getGlyphSet()
+    cmap = font.getBestCmap()
+    scale = font_size / font["head"].unitsPerEm
+
+    path_pen = SVGPathPen(glyph_set, ntos=fmt)
+    bounds_pen = BoundsPen(glyph_set)
+    pen_x = 0.0
+    for char in text:
+        glyph_name = cmap.get(ord(char), ".notdef")
+        transform = (scale, 0, 0, -scale, pen_x, 0)
+        glyph_set[glyph_name].draw(TransformPen(path_pen, transform))
+        glyph_set[glyph_name].draw(TransformPen(bounds_pen, transform))
+        pen_x += font["hmtx"][glyph_name][0] * scale
+
+    bbox = bounds_pen.bounds or (0, 0, 0, 0)
+    return {
+        "d": path_pen.getCommands(),
+        "bbox": bbox,
+        "ascent": font["hhea"].ascent * scale,
+    }
+
+
+def svg_document(size: int, elements: list[str]) -> str:
+    """Wrap SVG elements in a square root element with a matching viewBox."""
+    body = "".join(elements)
+    return f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {size} {size}">{body}</svg>\n'
+
+
+def rounded_rect(x: float, y: float, width: float, height: float, radius: float, fill: str) -> str:
+    """SVG rounded rectangle element."""
+    return (
+        f'<rect x="{fmt(x)}" y="{fmt(y)}" width="{fmt(width)}" height="{fmt(height)}" '
+        f'rx="{fmt(radius)}" fill="{fill}"/>'
+    )
+
+
+def circle(cx: float, cy: float, r: float, fill: str) -> str:
+    """SVG circle element."""
+    return f'<circle cx="{fmt(cx)}" cy="{fmt(cy)}" r="{fmt(r)}" fill="{fill}"/>'
+
+
+def path(d: str, fill: str, dx: float = 0, dy: float = 0, stroke_width: float = 0) -> str:
+    """SVG path element, optionally translated and stroked in its fill color."""
+    attrs = f'd="{d}" fill="{fill}"'
+    if dx or dy:
+        attrs += f' transform="translate({fmt(dx)} {fmt(dy)})"'
+    if stroke_width > 0:
+        attrs += f' stroke="{fill}" stroke-width="{fmt(stroke_width)}" stroke-linejoin="round"'
+    return f"<path {attrs}/>"
+
+
+def rasterize_svg(svg: str, size: int):
+    """
+    Rasterize an SVG string to a square RGBA PIL image.
+
+    Returns:
+        The rendered image, or None if cairosvg (or the cairo library) is missing
+    """
+    try:
+        import cairosvg
+    except (ImportError, OSError):
+        return None
+
+    import io
+    from PIL import Image
+
+    png = cairosvg.svg2png(bytestring=svg.encode(), output_width=size, output_height=size)
+    return Image.open(io.BytesIO(png)).convert("RGBA")
+
+
+def write_modern_favicon_set(svg: str, fallback_img, output_dir: Path) -> None:
+    """
+    Write a modern favicon set built around a tiny SVG.
+
+    Creates:
+        - favicon.svg (primary icon for current browsers)
+        - favicon.ico (32x32, for legacy browsers and /favicon.ico requests)
+        - apple-touch-icon.png (180x180)
+
+    The raster files are rendered from the SVG when cairosvg is available so
+    every format shows identical geometry; otherwise fallback_img is used.
+
+    Args:
+        svg: SVG document text
+        fallback_img: Large square RGBA PIL image to use if the SVG can't be rasterized
+        output_dir: Directory to save favicon files
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    svg_path = output_dir / "favicon.svg"
+    svg_path.write_text(svg)
+    print(f"Created {svg_path} ({len(svg.encode()):,} bytes)")
+
+    source = rasterize_svg(svg, fallback_img.size[0])
+    if source is None:
+        print("cairosvg not available; rasterizing fallbacks from the PIL render")
+        source = fallback_img
+
+    export_favicon_set(source, output_dir, MODERN_FAVICON_SIZES, MODERN_ICO_SIZES)
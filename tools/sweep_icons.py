@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Sweep color and shape variants of the logo and text favicons.
+
+Each distinct geometry (simplified flag for the logo; text, font, radius and
+bold for text favicons) is rasterized once into cached alpha masks. Every
+color combination is then produced by painting flat fills through those masks,
+so large grids only pay for compositing and export.
+
+Writes one favicon set per variant into <output>/<variant>/ plus a single
+contact-sheet.png for side-by-side comparison.
+
+Usage:
+    # Logo: every bg/body color pair, full and simplified
+    uv run --with pillow tools/sweep_icons.py logo \
+        --bg-color "#FFA300" "#002D72" "#E81828" --body-color "#0a0a0a" "#ffffff" \
+        --simplified both -o sweep/
+
+    # Text favicons: grid over text, radius, bold and colors
+    uv run --with pillow tools/sweep_icons.py text --text JH H \
+        --font assets/fonts/DMSans.ttf --radius 0.2 0.5 --bold 0 0.04 \
+        --bg-color "#0a0e1a" "#FFA300" --text-color "#ffffff" -o sweep/
+"""
+
+import argparse
+import contextlib
+import io
+import itertools
+import math
+import re
+import time
+from pathlib import Path
+
+from generate_favicon import render_text_favicon, text_favicon_layers
+from generate_hedgertronic_logo import logo_layers, render_logo
+from raster_export import export_favicon_set
+
+THUMB_SIZE = 128
+LABEL_HEIGHT = 18
+SHEET_COLUMNS = 8
+SHEET_BACKGROUND = (24, 24, 27)
+
+
+def slug(*parts) -> str:
+    """Build a filesystem-safe variant name from its parameters."""
+    text = "-".join(str(part) for part in parts)
+    return re.sub(r"[^A-Za-z0-9.]+", "-", text.replace("#", "")).strip("-").lower()
+
+
+def logo_variants(bg_colors: list[str], body_colors: list[str], shapes: list[bool]) -> list[tuple]:
+    """
+    Expand a logo parameter grid into (name, geometry key, render fn) triples.
+
+    Geometry-major order keeps each mask set hot while its colors are painted.
+    """
+    variants = []
+    for simplified, bg, body in itertools.product(shapes, bg_colors, body_colors):
+        name = slug("logo", "simplified" if simplified else "full", bg, body)
+        variants.append((name, ("logo", simplified), lambda s=simplified, b=bg, c=body: render_logo(b, c, s)))
+    return variants
+
+
+def text_variants(texts: list[str], fonts: list[Path], radii: list[float], bolds: list[float],
+                  bg_colors: list[str], text_colors: list[str]) -> list[tuple]:
+    """Expand a text favicon parameter grid into (name, geometry key, render fn) triples."""
+    variants = []
+    for text, font, radius, bold in itertools.product(texts, fonts, radii, bolds):
+        geometry = ("text", text, font, radius, bold)
+        for bg, fg in itertools.product(bg_colors, text_colors):
+            name = slug("text", text, font.stem, f"r{radius}", f"b{bold}", bg, fg)
+            render = lambda t=text, f=font, r=radius, w=bold, b=bg, c=fg: render_text_favicon(t, f, b, c, r, w)
+            variants.append((name, geometry, render))
+    return variants
+
+
+def contact_sheet(thumbnails: list[tuple], output_path: Path) -> None:
+    """
+    Lay out labelled thumbnails in a grid and save it as one PNG.
+
+    Args:
+        thumbnails: List of (label, RGBA thumbnail image) pairs
+        output_path: Where to write the sheet
+    """
+    from PIL import Image, ImageDraw, ImageFont
+
+    columns = min(SHEET_COLUMNS, len(thumbnails))
+    rows = math.ceil(len(thumbnails) / columns)
+    cell_w = THUMB_SIZE + 16
+    cell_h = THUMB_SIZE + LABEL_HEIGHT + 16
+
+    sheet = Image.new("RGBA", (columns * cell_w, rows * cell_h), (*SHEET_BACKGROUND, 255))
+    draw = ImageDraw.Draw(sheet)
+    font = ImageFont.load_default()
+
+    for index, (label, thumb) in enumerate(thumbnails):
+        x = (index % columns) * cell_w + 8
+        y = (index // columns) * cell_h + 8
+        sheet.alpha_composite(thumb, (x, y))
+
+        # Trim long labels to the cell width
+        while label and draw.textlength(label, font=font) > THUMB_SIZE:
+            label = label[:-1]
+        draw.text((x, y + THUMB_SIZE + 4), label, font=font, fill=(200, 200, 200, 255))
+
+    sheet.save(output_path, "PNG", optimize=True)
+    print(f"Created {output_path} ({len(thumbnails)} variants, {sheet.size[0]}x{sheet.size[1]})")
+
+
+def run_sweep(variants: list[tuple], output_dir: Path) -> None:
+    """
+    Render, export and sheet every variant.
+
+    Args:
+        variants: List of (name, geometry key, render fn) from *_variants()
+        output_dir: Parent directory for per-variant favicon sets
+    """
+    from PIL import Image
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    start = time.perf_counter()
+    thumbnails = []
+    for name, _, render in variants:
+        img = render()
+        with contextlib.redirect_stdout(io.StringIO()):
+            export_favicon_set(img, output_dir / name)
+        thumbnails.append((name, img.resize((THUMB_SIZE, THUMB_SIZE), Image.LANCZOS)))
+    elapsed = time.perf_counter() - start
+
+    geometries = len({geometry for _, geometry, _ in variants})
+    cache = logo_layers.cache_info().misses + text_favicon_layers.cache_info().misses
+    print(f"Rendered {len(variants)} variants from {geometries} geometries "
+          f"({cache} mask renders) in {elapsed:.2f}s ({elapsed / len(variants) * 1000:.0f}ms/variant)")
+
+    contact_sheet(thumbnails, output_dir / "contact-sheet.png")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Sweep logo and text favicon variants",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    # Subcommand: logo
+    logo_parser = subparsers.add_parser("logo", help="Sweep hedgertronic logo colors and shapes")
+    logo_parser.add_argument("--bg-color", nargs="+", default=["#FFA300"], help="Background/body colors")
+    logo_parser.add_argument("--body-color", nargs="+", default=["#0a0a0a"], help="Text and lens colors")
+    logo_parser.add_argument(
+        "--simplified",
+        choices=["full", "simplified", "both"],
+        default="both",
+        help="Which logo shapes to include (default: both)"
+    )
+
+    # Subcommand: text
+    text_parser = subparsers.add_parser("text", help="Sweep text favicon text, fonts, shapes and colors")
+    text_parser.add_argument("--text", nargs="+", required=True, help="Text values (e.g., JH)")
+    text_parser.add_argument("--font", nargs="+", type=Path, required=True, help="TTF font paths")
+    text_parser.add_argument("--radius", nargs="+", type=float, default=[0.2], help="Corner radius fractions")
+    text_parser.add_argument("--bold", nargs="+", type=float, default=[0.0], help="Faux-bold stroke fractions")
+    text_parser.add_argument("--bg-color", nargs="+", default=["#0a0e1a"], help="Background colors")
+    text_parser.add_argument("--text-color", nargs="+", default=["#ffffff"], help="Text colors")
+
+    for sub in (logo_parser, text_parser):
+        sub.add_argument(
+            "-o", "--output-dir",
+            type=Path,
+            default=Path("sweep"),
+            help="Output directory (default: sweep)"
+        )
+
+    args = parser.parse_args()
+
+    if args.command == "logo":
+        shapes = {"full": [False], "simplified": [True], "both": [False, True]}[args.simplified]
+        variants = logo_variants(args.bg_color, args.body_color, shapes)
+    else:
+        variants = text_variants(args.text, args.font, args.radius, args.bold, args.bg_color, args.text_color)
+
+    run_sweep(variants, args.output_dir)
+
+
+if __name__ == "__main__":
+    main()